@@ -0,0 +1,66 @@
+"""상대 행동 분석 요청 합치기 유무에 따른 LLM 호출 수와 지연 시간 비교 (fake LLM)
+
+    python -m benchmarks.analysis_coalescing [--sessions 20] [--actions 5] [--interval 0.04] [--window 0.1]
+
+세션마다 상대 행동 actions개가 interval초 간격으로 들어와(콤보) 각각 분석을 요청한다.
+합치지 않으면 요청마다 분석을 실행하고, 합치면 창 안에 들어오거나 앞선 분석을 기다리는 동안 들어온 행동을
+한 번에 분석한다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from benchmarks.fake_llm import FakeLLM
+from core.session_manager import SessionManager
+
+
+async def _combo(coalesce: bool, window: float, sessions: int, actions: int, interval: float, latency: float):
+    llm = FakeLLM(latency=latency)
+    session_manager = SessionManager(llm=llm, max_sessions=0, max_memory_mb=0, analysis_coalesce_seconds=window)
+    session_ids = [
+        await session_manager.create_session(character_role="바르곤", opponent_role="카게츠") for _ in range(sessions)
+    ]
+    calls_before = llm.call_count
+    latencies: List[float] = []
+
+    async def analyze(session_id: str, index: int):
+        await asyncio.sleep(index * interval)
+        action = f"상대가 {index + 1}번째 공격을 이어감"
+        started = time.perf_counter()
+        if coalesce:
+            await session_manager.analyze_game_state(session_id, action)
+        else:
+            await session_manager.submit(session_id, lambda agent: agent.aanalyze_game_state(action))
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        analyze(session_id, index) for session_id in session_ids for index in range(actions)
+    ])
+    elapsed = time.perf_counter() - started
+    session_manager.shutdown()
+    return llm.call_count - calls_before, latencies, elapsed
+
+
+async def run(sessions: int, actions: int, interval: float, window: float, latency: float):
+    print(f"sessions={sessions} actions={actions} interval={interval}s llm_latency={latency}s")
+    for label, coalesce, window_ in [("each", False, 0.0), ("coalesce 0ms", True, 0.0),
+                                     (f"coalesce {window * 1000:.0f}ms", True, window)]:
+        calls, latencies, elapsed = await _combo(coalesce, window_, sessions, actions, interval, latency)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(f"{label:<16} llm_calls={calls:<5} total={elapsed:6.2f}s p50={p50:7.1f}ms p99={p99:7.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--actions", type=int, default=5, help="세션마다 연달아 들어오는 상대 행동 수")
+    parser.add_argument("--interval", type=float, default=0.04, help="행동 사이 간격(초)")
+    parser.add_argument("--window", type=float, default=0.1, help="요청을 모으는 시간(초)")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake LLM 호출 하나의 지연 시간(초)")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.actions, args.interval, args.window, args.latency))
@@ -0,0 +1,117 @@
+"""Batch* RPC와 세션별 단건 RPC N개의 소요 시간 비교 (fake LLM)
+
+    python -m benchmarks.batch [--sessions 32] [--latency 0.2] [--rounds 3]
+
+서버(GRPCServer)를 별도 프로세스로 띄우고, 세션 N개에 대해 다음 세 방식으로 InitSession, Chat,
+AnalyzeGameState를 보낸다.
+- serial: 세션마다 단건 RPC를 하나씩 차례로 (로비가 매치를 순회하며 호출하는 방식)
+- concurrent: 단건 RPC N개를 동시에
+- batch: Batch* RPC 하나
+매치업 캐릭터 소개는 측정 전에 한 번 만들어 두므로 InitSession은 세 방식 모두 캐시를 사용한다.
+"""
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from grpc import aio
+
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.workers import _wait_ready
+from generated import chatbot_pb2, chatbot_pb2_grpc
+
+
+def _serve(port: int, latency: float):
+    from server import GRPCServer
+
+    server = GRPCServer(port=port, host="127.0.0.1", llm_factory=functools.partial(FakeLLM, latency=latency))
+    asyncio.run(server.start())
+
+
+def _init_request(session_id: str = "") -> chatbot_pb2.InitSessionRequest:
+    return chatbot_pb2.InitSessionRequest(
+        session_id=session_id, character_role="바르곤", opponent_role="카게츠", language="korean"
+    )
+
+
+async def _measure(stub, sessions: int, round_: int) -> Dict[str, Dict[str, float]]:
+    """방식별, RPC별 소요 시간(초)"""
+    timings: Dict[str, Dict[str, float]] = {}
+    for mode in ("serial", "concurrent", "batch"):
+        session_ids = [f"{mode}-{round_}-{index}" for index in range(sessions)]
+        init = [_init_request(session_id) for session_id in session_ids]
+        chat = [chatbot_pb2.ChatRequest(session_id=session_id, user_message="간다!") for session_id in session_ids]
+        analysis = [
+            chatbot_pb2.AnalysisRequest(session_id=session_id, opponent_actions="상대가 점프 공격을 반복함")
+            for session_id in session_ids
+        ]
+
+        calls: Dict[str, Callable[[], Awaitable]] = {}
+        if mode == "serial":
+            async def serial(method, requests):
+                for request in requests:
+                    await method(request)
+            calls["InitSession"] = lambda: serial(stub.InitSession, init)
+            calls["Chat"] = lambda: serial(stub.Chat, chat)
+            calls["AnalyzeGameState"] = lambda: serial(stub.AnalyzeGameState, analysis)
+        elif mode == "concurrent":
+            calls["InitSession"] = lambda: asyncio.gather(*[stub.InitSession(request) for request in init])
+            calls["Chat"] = lambda: asyncio.gather(*[stub.Chat(request) for request in chat])
+            calls["AnalyzeGameState"] = lambda: asyncio.gather(*[stub.AnalyzeGameState(request) for request in analysis])
+        else:
+            calls["InitSession"] = lambda: stub.BatchInitSession(chatbot_pb2.BatchInitSessionRequest(requests=init))
+            calls["Chat"] = lambda: stub.BatchChat(chatbot_pb2.BatchChatRequest(requests=chat))
+            calls["AnalyzeGameState"] = lambda: stub.BatchAnalyzeGameState(
+                chatbot_pb2.BatchAnalysisRequest(requests=analysis)
+            )
+
+        timings[mode] = {}
+        for method, call in calls.items():
+            started = time.perf_counter()
+            await call()
+            timings[mode][method] = time.perf_counter() - started
+
+        for session_id in session_ids:
+            await stub.EndSession(chatbot_pb2.EndSessionRequest(session_id=session_id))
+    return timings
+
+
+async def _benchmark(port: int, sessions: int, rounds: int) -> List[Dict[str, Dict[str, float]]]:
+    async with aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        stub = chatbot_pb2_grpc.CharacterChatServiceStub(channel)
+        # 매치업 캐릭터 소개를 미리 만들어 둠
+        warmup = await stub.InitSession(_init_request())
+        await stub.EndSession(chatbot_pb2.EndSessionRequest(session_id=warmup.session_id))
+        return [await _measure(stub, sessions, round_) for round_ in range(rounds)]
+
+
+def run(sessions: int, latency: float, rounds: int, port: int):
+    process = multiprocessing.get_context("spawn").Process(target=_serve, args=(port, latency))
+    process.start()
+    try:
+        asyncio.run(_wait_ready(port))
+        results = asyncio.run(_benchmark(port, sessions, rounds))
+    finally:
+        process.terminate()
+        process.join(60)
+
+    print(f"sessions={sessions} llm_latency={latency}s rounds={rounds} (median)")
+    for method in ("InitSession", "Chat", "AnalyzeGameState"):
+        line = " ".join(
+            f"{mode}={statistics.median(result[mode][method] for result in results) * 1000:8.1f}ms"
+            for mode in ("serial", "concurrent", "batch")
+        )
+        print(f"{method:<18} {line}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=32, help="한 번에 다루는 세션 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake LLM 호출 하나의 지연 시간(초)")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=50161)
+    args = parser.parse_args()
+    run(args.sessions, args.latency, args.rounds, args.port)
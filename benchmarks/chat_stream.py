@@ -0,0 +1,67 @@
+"""스트리밍 채팅의 첫 대사 조각까지 걸린 시간(TTFT)과 전체 턴 소요 시간 비교 (fake LLM)
+
+    python -m benchmarks.chat_stream [--turns 20] [--latency 0.3] [--token-latency 0.03] [--speech-chars 60]
+
+같은 세션에서 Chat 방식(완성된 JSON을 받은 뒤 응답)과 ChatStream 방식(대사 조각을 받는 대로 전달)으로
+턴을 번갈아 실행한다. fake LLM은 첫 조각까지 latency, 이후 4글자마다 token_latency가 걸린다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+from benchmarks.fake_llm import FakeLLM
+from core.session_manager import SessionManager
+
+
+async def run(turns: int, latency: float, token_latency: float, speech_chars: int):
+    llm = FakeLLM(latency=latency, token_latency=token_latency, speech_chars=speech_chars)
+    session_manager = SessionManager(llm=llm)
+    session_id = await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+
+    chat_totals: List[float] = []
+    stream_first: List[float] = []
+    emotion_at: List[float] = []
+    stream_totals: List[float] = []
+
+    for _ in range(turns):
+        started = time.perf_counter()
+        await session_manager.submit(session_id, lambda agent: agent.achat("간다!"))
+        chat_totals.append(time.perf_counter() - started)
+
+        first: Optional[float] = None
+        emotion: Optional[float] = None
+
+        def on_event(field: str, value: str):
+            nonlocal first, emotion
+            now = time.perf_counter() - started
+            if field == "speech" and first is None:
+                first = now
+            elif field == "emotion":
+                emotion = now
+
+        started = time.perf_counter()
+        await session_manager.submit(session_id, lambda agent: agent.achat("간다!", on_event=on_event))
+        stream_totals.append(time.perf_counter() - started)
+        stream_first.append(first if first is not None else stream_totals[-1])
+        emotion_at.append(emotion if emotion is not None else stream_totals[-1])
+
+    session_manager.shutdown()
+
+    def ms(values: List[float]) -> str:
+        return f"{statistics.median(values) * 1000:7.1f}ms"
+
+    print(f"turns={turns} llm_latency={latency}s token_latency={token_latency}s speech_chars={speech_chars}")
+    print(f"{'Chat':<12} first speech {ms(chat_totals)}  total {ms(chat_totals)}")
+    print(f"{'ChatStream':<12} first speech {ms(stream_first)}  total {ms(stream_totals)}  emotion {ms(emotion_at)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.3, help="첫 조각까지의 fake LLM 지연 시간(초)")
+    parser.add_argument("--token-latency", type=float, default=0.03, help="4글자 조각마다의 지연 시간(초)")
+    parser.add_argument("--speech-chars", type=int, default=60, help="생성할 대사 길이")
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.latency, args.token_latency, args.speech_chars))
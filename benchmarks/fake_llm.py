@@ -0,0 +1,79 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, ClassVar, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+
+class FakeLLM(BaseChatModel):
+    """고정 지연 후 `{speech, emotion}` JSON을 돌려주는 벤치마크용 LLM (Gemini 호출 없음)
+
+    token_latency를 주면 첫 조각까지 latency, 이후 CHUNK_CHARS 글자마다 token_latency가 걸리는 것으로 흉내 내며,
+    스트리밍(astream)과 한 번에 받는 호출의 총 소요 시간은 같다.
+    """
+
+    CHUNK_CHARS: ClassVar[int] = 4
+
+    latency: float = 0.5
+    token_latency: float = 0.0
+    speech_chars: int = 0  # 대사 길이 (짧으면 채워서 늘림)
+    call_count: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _content(self) -> str:
+        self.call_count += 1
+        speech = f"대사 {self.call_count}"
+        speech += "하" * max(self.speech_chars - len(speech), 0)
+        return json.dumps({"speech": speech, "emotion": "자신감"}, ensure_ascii=False)
+
+    def _chunks(self, content: str) -> List[str]:
+        return [content[i:i + self.CHUNK_CHARS] for i in range(0, len(content), self.CHUNK_CHARS)]
+
+    def _result(self, content: str) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def _generate(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[CallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> ChatResult:
+        content = self._content()
+        time.sleep(self.latency + self.token_latency * len(self._chunks(content)))
+        return self._result(content)
+
+    async def _agenerate(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> ChatResult:
+        content = self._content()
+        await asyncio.sleep(self.latency + self.token_latency * len(self._chunks(content)))
+        return self._result(content)
+
+    async def _astream(
+            self,
+            messages: List[BaseMessage],
+            stop: Optional[List[str]] = None,
+            run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+            **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        content = self._content()
+        await asyncio.sleep(self.latency)
+        for piece in self._chunks(content):
+            await asyncio.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+
+    def with_structured_output(self, schema, **kwargs):
+        return self | RunnableLambda(lambda message: schema.model_validate_json(message.content))
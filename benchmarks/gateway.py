@@ -0,0 +1,209 @@
+"""로컬 서버 노드 여러 개로 SessionGateway 확인 (fake LLM)
+
+    python -m benchmarks.gateway [--nodes 3] [--sessions 200] [--warming 40] [--latency 0.2] [--port 50251]
+
+노드마다 GRPCServer를 별도 프로세스로 띄우고 게이트웨이를 이 프로세스에서 실행한다.
+세션을 만들어 노드별 분포와 ListSessions 집계를 확인하고, 노드를 하나 추가한 뒤 하나 제거하면서
+옮겨진 세션 수, 재분배에 걸린 시간, 모든 세션이 ring이 가리키는 노드에서 계속 대화되는지 출력한다.
+노드를 바꾸는 동안에도 StreamMatch 스트림 하나로 세션들의 이벤트를 계속 보내며, 그 출력이 모두 성공했는지 확인한다.
+마지막으로 백그라운드 초기화 세션 warming개를 만든 직후 노드를 하나 더 추가하여 초기화 중인 세션도 옮겨지는지,
+새 노드에 같은 ID의 세션을 미리 만들어 가져오기가 건너뛴 세션이 이전 노드에 남는지 확인한다.
+"""
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import time
+from collections import Counter
+from typing import Dict, List
+
+from grpc import aio
+
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.workers import _wait_ready
+from generated import chatbot_pb2, chatbot_pb2_grpc
+from services.gateway import HashRing, SessionGateway
+
+
+def _serve(port: int, latency: float):
+    from server import GRPCServer
+
+    server = GRPCServer(port=port, host="127.0.0.1", llm_factory=functools.partial(FakeLLM, latency=latency))
+    asyncio.run(server.start())
+
+
+async def _call_node(address: str, method: str, request):
+    """게이트웨이를 거치지 않고 노드에 직접 호출"""
+    async with aio.insecure_channel(address) as channel:
+        return await getattr(chatbot_pb2_grpc.CharacterChatServiceStub(channel), method)(request)
+
+
+async def _check(gateway: SessionGateway, stub, session_ids: List[str], label: str):
+    """모든 세션이 소유 노드에만 있고 게이트웨이를 통해 대화되는지 확인"""
+    listed = await stub.ListSessions(chatbot_pb2.ListSessionsRequest())
+    assert sorted(listed.session_ids) == sorted(session_ids), "ListSessions does not match created sessions"
+
+    per_node: Dict[str, List[str]] = {}
+    for address in gateway.backends:
+        async with aio.insecure_channel(address) as channel:
+            node = chatbot_pb2_grpc.CharacterChatServiceStub(channel)
+            per_node[address] = list((await node.ListSessions(chatbot_pb2.ListSessionsRequest())).session_ids)
+    for address, owned in per_node.items():
+        misplaced = [session_id for session_id in owned if gateway.backend_for(session_id) != address]
+        assert not misplaced, f"{len(misplaced)} sessions on {address} belong elsewhere"
+
+    responses = await asyncio.gather(*[
+        stub.Chat(chatbot_pb2.ChatRequest(session_id=session_id, user_message="다음 라운드")) for session_id in session_ids
+    ])
+    failed = [response.error_message for response in responses if not response.success]
+    assert not failed, f"{len(failed)} chats failed: {failed[:3]}"
+
+    distribution = Counter({address: len(owned) for address, owned in per_node.items()})
+    print(f"{label:<16} " + "  ".join(f"{address}={count}" for address, count in sorted(distribution.items())))
+
+
+async def _match_traffic(stub, session_ids: List[str], stop: asyncio.Event) -> Counter:
+    """stop이 설정될 때까지 세션을 돌아가며 ROUND_START를 보내는 StreamMatch 하나 - 결과별 출력 수 반환
+
+    확인용 Chat과 겹쳐 노드의 LLM 대기열이 차면 출력이 과부하로 거절될 수 있으므로 실패와 따로 센다.
+    """
+    async def events():
+        index = 0
+        while not stop.is_set():
+            yield chatbot_pb2.MatchEvent(session_id=session_ids[index % len(session_ids)], type=chatbot_pb2.ROUND_START,
+                                         round=1)
+            index += 1
+            await asyncio.sleep(0.01)
+
+    outputs = Counter()
+    async for output in stub.StreamMatch(events()):
+        if output.success:
+            outputs["ok"] += 1
+        elif "overloaded" in output.error_message:
+            outputs["overloaded"] += 1
+        else:
+            outputs["failed"] += 1
+            if outputs["failed"] <= 3:
+                print(f"StreamMatch output failed: {output.error_message}")
+    return outputs
+
+
+async def _add_with_pending_sessions(gateway: SessionGateway, stub, session_ids: List[str], address: str,
+                                     warming: int):
+    """초기화 중인 세션과 가져오기가 건너뛸 세션이 있는 상태에서 노드 추가
+
+    새 노드로 옮겨질 세션 하나와 같은 ID의 세션을 새 노드에 미리 만들어 두면 가져오기에서 건너뛰므로
+    이전 노드에 남아 있어야 한다. 확인 후 양쪽에서 지우고 검사 대상에서 뺀다.
+    """
+    ring = HashRing(gateway.backends + [address])
+    conflict = next(session_id for session_id in session_ids if ring.node_for(session_id) == address)
+    conflict_source = gateway.backend_for(conflict)
+    await _call_node(address, "InitSession", chatbot_pb2.InitSessionRequest(
+        session_id=conflict, character_role="바르곤", opponent_role="카게츠", language="korean"
+    ))
+
+    # 매치업 캐시를 피하도록 언어 태그를 달리하여 재분배 시점에 아직 초기화 중이도록 함
+    warming_ids = [
+        response.session_id for response in await asyncio.gather(*[
+            stub.InitSession(chatbot_pb2.InitSessionRequest(
+                character_role="바르곤", opponent_role="카게츠", language=f"warm-{index}", background_init=True
+            ))
+            for index in range(warming)
+        ])
+    ]
+    warming_moving = sum(1 for session_id in warming_ids if ring.node_for(session_id) != gateway.backend_for(session_id))
+
+    started = time.perf_counter()
+    moved = await gateway.set_backends(gateway.backends + [address])
+    print(f"add {address}: moved {moved}/{len(session_ids) + warming} sessions in "
+          f"{time.perf_counter() - started:.2f}s ({warming_moving} of {warming} warming sessions change owner)")
+
+    try:
+        kept = (await _call_node(conflict_source, "GetSessionStatus",
+                                 chatbot_pb2.SessionStatusRequest(session_id=conflict))).success
+    except aio.AioRpcError:
+        kept = False
+    print(f"skipped import: {conflict} kept on {conflict_source}={kept}")
+    assert kept, "A session skipped by ImportSessions was ended on its source"
+    for node in (conflict_source, address):
+        await _call_node(node, "EndSession", chatbot_pb2.EndSessionRequest(session_id=conflict))
+    session_ids.remove(conflict)
+    session_ids += warming_ids
+    await _check(gateway, stub, session_ids, f"{len(gateway.backends)} nodes")
+
+
+async def _scenario(ports: List[int], gateway_port: int, sessions: int, warming: int):
+    backends = [f"127.0.0.1:{port}" for port in ports]
+    gateway = SessionGateway(backends[:-2])
+    server = aio.server()
+    server.add_generic_rpc_handlers((gateway.handler(),))
+    server.add_insecure_port(f"127.0.0.1:{gateway_port}")
+    await server.start()
+
+    try:
+        async with aio.insecure_channel(f"127.0.0.1:{gateway_port}") as channel:
+            stub = chatbot_pb2_grpc.CharacterChatServiceStub(channel)
+            session_ids = [
+                response.session_id for response in await asyncio.gather(*[
+                    stub.InitSession(chatbot_pb2.InitSessionRequest(
+                        character_role="바르곤", opponent_role="카게츠", language="korean"
+                    ))
+                    for _ in range(sessions)
+                ])
+            ]
+            await _check(gateway, stub, session_ids, f"{len(gateway.backends)} nodes")
+
+            stop = asyncio.Event()
+            match = asyncio.create_task(_match_traffic(stub, session_ids, stop))
+            await asyncio.sleep(0.5)
+
+            started = time.perf_counter()
+            moved = await gateway.set_backends(backends[:-1])
+            print(f"add {backends[-2]}: moved {moved}/{sessions} sessions in {time.perf_counter() - started:.2f}s")
+            await _check(gateway, stub, session_ids, f"{len(gateway.backends)} nodes")
+
+            started = time.perf_counter()
+            moved = await gateway.set_backends(backends[1:-1])
+            print(f"remove {backends[0]}: moved {moved}/{sessions} sessions in {time.perf_counter() - started:.2f}s")
+            await _check(gateway, stub, session_ids, f"{len(gateway.backends)} nodes")
+
+            stop.set()
+            outputs = await match
+            print(f"StreamMatch across rebalances: ok={outputs['ok']} overloaded={outputs['overloaded']} "
+                  f"failed={outputs['failed']}")
+            assert outputs["ok"] and not outputs["failed"], "StreamMatch outputs failed during rebalancing"
+
+            # StreamMatch 출력을 기다리는 멈춤 동안 초기화가 끝나지 않도록 이벤트가 없을 때 추가
+            await _add_with_pending_sessions(gateway, stub, session_ids, backends[-1], warming)
+    finally:
+        await server.stop(grace=1.0)
+        await gateway.close()
+
+
+def run(nodes: int, sessions: int, warming: int, latency: float, port: int):
+    # 처음에는 nodes개로 시작하여 한 개 추가, 한 개 제거 후 다시 한 개를 추가하므로 nodes + 2개를 띄움
+    ports = [port + 1 + index for index in range(nodes + 2)]
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_serve, args=(node_port, latency)) for node_port in ports]
+    for process in processes:
+        process.start()
+    try:
+        for node_port in ports:
+            asyncio.run(_wait_ready(node_port))
+        asyncio.run(_scenario(ports, port, sessions, warming))
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=3, help="처음 노드 수 (두 개를 더 띄워 차례로 추가함)")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--warming", type=int, default=40, help="노드 추가 직전에 만드는 백그라운드 초기화 세션 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake LLM 호출 하나의 지연 시간(초)")
+    parser.add_argument("--port", type=int, default=50251, help="게이트웨이 포트 (노드는 그 다음 포트들)")
+    args = parser.parse_args()
+    run(args.nodes, args.sessions, args.warming, args.latency, args.port)
@@ -0,0 +1,62 @@
+"""유휴 세션 휴면 전후의 세션당 메모리와 휴면/복원 소요 시간 측정 (LLM 지연 0)
+
+    python -m benchmarks.hibernation [--sessions 1000] [--turns 10]
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from datetime import timedelta
+
+from core.session_manager import SessionManager
+from benchmarks.fake_llm import FakeLLM
+
+
+def _traced_kib(sessions: int) -> float:
+    gc.collect()
+    traced, _ = tracemalloc.get_traced_memory()
+    return traced / sessions / 1024
+
+
+async def run(sessions: int, turns: int):
+    session_manager = SessionManager(llm=FakeLLM(latency=0.0), hibernate_after_minutes=60)
+    await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+
+    tracemalloc.start()
+    session_ids = []
+    for _ in range(sessions):
+        session_id = await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+        for _ in range(turns):
+            await session_manager.submit(session_id, lambda agent: agent.achat("안녕"))
+        session_ids.append(session_id)
+    live = _traced_kib(sessions)
+
+    started = time.perf_counter()
+    hibernated = session_manager.hibernate_idle_sessions(idle_for=timedelta(0))
+    elapsed = time.perf_counter() - started
+    dormant = _traced_kib(sessions)
+    tracemalloc.stop()
+    blob_bytes = session_manager.get_hibernation_stats()["hibernated_bytes"]
+
+    # 모든 세션이 다음 턴에서 복원
+    started = time.perf_counter()
+    for session_id in session_ids:
+        await session_manager.submit(session_id, lambda agent: agent.achat("다시 왔다"))
+    resumed = time.perf_counter() - started
+
+    stats = session_manager.get_hibernation_stats()
+    print(f"sessions={sessions} turns={turns}")
+    print(f"memory: live {live:.1f}KiB/session -> hibernated {dormant:.1f}KiB/session (tracemalloc)")
+    print(f"hibernate: {hibernated} sessions in {elapsed * 1000:.0f}ms, avg {stats['avg_hibernate_ms']:.3f}ms, "
+          f"blob {blob_bytes / max(hibernated, 1) / 1024:.1f}KiB/session")
+    print(f"rehydrate: avg {stats['avg_rehydrate_ms']:.3f}ms, first turn after wake {resumed / sessions * 1000:.2f}ms")
+    session_manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.turns))
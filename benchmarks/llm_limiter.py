@@ -0,0 +1,90 @@
+"""LLM 동시 호출 제한 유무에 따른 버스트 처리 결과 비교 (fake LLM)
+
+    python -m benchmarks.llm_limiter [--burst 200] [--latency 0.2] [--max-concurrent 16] [--max-queue 64]
+
+세션 burst개가 동시에 Chat을 보내고, 성공/거절 수와 성공한 턴의 지연 시간 분포를 출력한다.
+제한이 없으면 모든 호출이 한꺼번에 LLM으로 가고, 제한이 있으면 대기열을 넘는 호출은 즉시 거절된다.
+이어서 InitSession burst개를 동시에 보내고 거절된 초기화가 체크포인터에 스레드를 남기지 않는지
+(체크포인터 스레드 수 == 살아 있는 세션 수) 출력한다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+from benchmarks.fake_llm import FakeLLM
+from core.limiter import LLMLimiter, LLMOverloadedException
+from core.session_manager import SessionManager
+
+
+async def _burst(limiter: Optional[LLMLimiter], burst: int, latency: float):
+    llm = FakeLLM(latency=latency)
+    session_manager = SessionManager(llm=llm, max_sessions=0, max_memory_mb=0, llm_limiter=limiter)
+    # 세션은 하나씩 만들어 두고 (매치업 캐시로 초기화 LLM 호출은 처음 한 번뿐) Chat만 한꺼번에 보냄
+    session_ids = [
+        await session_manager.create_session(character_role="바르곤", opponent_role="카게츠") for _ in range(burst)
+    ]
+
+    latencies: List[float] = []
+    rejected = 0
+
+    async def turn(session_id: str):
+        nonlocal rejected
+        started = time.perf_counter()
+        try:
+            await session_manager.submit(session_id, lambda agent: agent.achat("간다!"))
+            latencies.append(time.perf_counter() - started)
+        except LLMOverloadedException:
+            rejected += 1
+
+    await asyncio.gather(*[turn(session_id) for session_id in session_ids])
+    session_manager.shutdown()
+    return latencies, rejected
+
+
+async def _init_burst(limiter: LLMLimiter, burst: int, latency: float):
+    session_manager = SessionManager(llm=FakeLLM(latency=latency), max_sessions=0, max_memory_mb=0, llm_limiter=limiter)
+
+    # 매치업 캐시를 피하도록 조합마다 언어 태그를 달리하여 모든 초기화가 LLM을 호출하게 함
+    results = await asyncio.gather(*[
+        session_manager.create_session(character_role="바르곤", opponent_role="카게츠", language=f"bench-{i}")
+        for i in range(burst)
+    ], return_exceptions=True)
+    created = sum(1 for result in results if isinstance(result, str))
+    rejected = sum(1 for result in results if isinstance(result, LLMOverloadedException))
+
+    threads = len(session_manager.agent_graph.checkpointer.storage)
+    sessions = len(session_manager.sessions)
+    session_manager.shutdown()
+    return created, rejected, threads, sessions
+
+
+async def run(burst: int, latency: float, max_concurrent: int, max_queue: int, queue_timeout: float):
+    print(f"burst={burst} llm_latency={latency}s")
+    for label, limiter in [
+        ("unlimited", None),
+        (f"limit {max_concurrent}+{max_queue}", LLMLimiter(max_concurrent, max_queue, queue_timeout))
+    ]:
+        latencies, rejected = await _burst(limiter, burst, latency)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000 if latencies else 0.0
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0
+        print(f"{label:<16} ok={len(latencies):<5} rejected={rejected:<5} p50={p50:7.1f}ms p99={p99:7.1f}ms")
+        if limiter is not None:
+            print(f"{'':<16} {limiter.get_stats()}")
+
+    limiter = LLMLimiter(max_concurrent, max_queue, queue_timeout)
+    created, rejected, threads, sessions = await _init_burst(limiter, burst, latency)
+    print(f"{'init burst':<16} ok={created:<5} rejected={rejected:<5} threads={threads:<5} sessions={sessions}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=200, help="동시에 Chat(및 InitSession)을 보내는 세션 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake LLM 호출 하나의 지연 시간(초)")
+    parser.add_argument("--max-concurrent", type=int, default=16)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--queue-timeout", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.burst, args.latency, args.max_concurrent, args.max_queue, args.queue_timeout))
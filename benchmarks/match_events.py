@@ -0,0 +1,93 @@
+"""StreamMatch 이벤트 정책이 프레임 단위 이벤트를 LLM 호출 몇 번으로 줄이는지 측정 (fake LLM)
+
+    python -m benchmarks.match_events [--sessions 8] [--duration 10] [--fps 60] [--latency 0.3]
+
+세션마다 한 라운드(ROUND_START ~ KO) 동안 프레임마다 일정 확률로 적중/가드/콤보/체력 변화 이벤트를 만들어
+하나의 StreamMatch 스트림으로 보낸다. 이벤트마다 분석을 요청했다면 필요했을 LLM 호출 수(이벤트 수)와
+정책을 거쳐 실제로 생성한 대사/분석 수, LLM 호출 수를 비교한다.
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+from benchmarks.fake_llm import FakeLLM
+from core.session_manager import SessionManager
+from generated import chatbot_pb2
+from services.character_chat_service import CharacterChatService, MockContext
+
+
+async def _round(session_id: str, duration: float, fps: int, rng: random.Random):
+    """한 라운드의 매치 이벤트를 실제 시간 간격으로 생성"""
+    yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.ROUND_START, round=1)
+    hp = {False: 1000, True: 1000}
+    for _ in range(int(duration * fps)):
+        await asyncio.sleep(1 / fps)
+        roll = rng.random()
+        attacker = rng.random() < 0.5
+        if roll < 0.08:
+            damage = rng.randint(5, 30)
+            hp[not attacker] = max(hp[not attacker] - damage, 1)
+            yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.HIT, by_opponent=attacker,
+                                         move="잽", damage=damage, special=rng.random() < 0.02)
+            yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.HP_CHANGE, by_opponent=not attacker,
+                                         hp=hp[not attacker], max_hp=1000)
+        elif roll < 0.12:
+            yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.BLOCK, by_opponent=not attacker)
+        elif roll < 0.13:
+            hits = rng.randint(2, 7)
+            yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.COMBO, by_opponent=attacker,
+                                         combo_hits=hits, damage=hits * 15)
+    winner = hp[True] > hp[False]
+    yield chatbot_pb2.MatchEvent(session_id=session_id, type=chatbot_pb2.KO, by_opponent=winner, round=1)
+
+
+async def run(sessions: int, duration: float, fps: int, latency: float, seed: int):
+    llm = FakeLLM(latency=latency)
+    session_manager = SessionManager(llm=llm, max_sessions=0, max_memory_mb=0, analysis_coalesce_seconds=0.1)
+    service = CharacterChatService(session_manager)
+    session_ids = [
+        await session_manager.create_session(character_role="바르곤", opponent_role="카게츠") for _ in range(sessions)
+    ]
+    rng = random.Random(seed)
+    calls_before = llm.call_count
+    sent = 0
+
+    async def events():
+        nonlocal sent
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce(session_id: str):
+            async for event in _round(session_id, duration, fps, rng):
+                await queue.put(event)
+
+        producers = asyncio.gather(*[produce(session_id) for session_id in session_ids])
+        producers.add_done_callback(lambda _: queue.put_nowait(None))
+        while (event := await queue.get()) is not None:
+            sent += 1
+            yield event
+
+    outputs = Counter()
+    started = time.perf_counter()
+    async for output in service.StreamMatch(events(), MockContext()):
+        outputs[(chatbot_pb2.MatchOutputType.Name(output.type), output.success)] += 1
+    elapsed = time.perf_counter() - started
+    session_manager.shutdown()
+
+    calls = llm.call_count - calls_before
+    print(f"sessions={sessions} duration={duration}s fps={fps} llm_latency={latency}s")
+    print(f"events={sent} (LLM calls if every event were analyzed)")
+    print(f"outputs={dict(outputs)}")
+    print(f"llm_calls={calls} ({calls / sessions / elapsed:.2f}/s per session, {sent / max(calls, 1):.0f} events per call)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="라운드 길이(초)")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.3, help="fake LLM 호출 하나의 지연 시간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.duration, args.fps, args.latency, args.seed))
@@ -0,0 +1,65 @@
+"""정적 프롬프트를 턴마다 새로 만들 때와 PromptRegistry를 쓸 때의 비용 비교
+
+    python -m benchmarks.prompt_artifacts [--iterations 2000] [--chars-per-token 2.0]
+
+캐릭터 시트 크기는 글자 수와 함께 ContextPolicy의 글자 수 기반 추정(estimate_tokens)으로 환산한 토큰 수로 출력한다.
+"""
+import argparse
+import timeit
+
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import PromptTemplate
+
+from core.concepts import CHARACTERS
+from core.context import ContextPolicy, estimate_tokens
+from core.prompts import PromptRegistry
+from models.response import Response
+from benchmarks.fake_llm import FakeLLM
+
+
+def _legacy_chat_prompt(language: str) -> SystemMessage:
+    """레지스트리 도입 전 세션마다 수행하던 채팅 지시문 렌더링"""
+    chat_output_parser = PydanticOutputParser(pydantic_object=Response)
+    chat_prompt = PromptTemplate(
+        template="Must answer in {language}. Wrap the output in `json` tags.\n{format_instruction}",
+        input_variables=["language"],
+        partial_variables={"format_instruction": chat_output_parser.get_format_instructions()}
+    )
+    return SystemMessage(chat_prompt.invoke(input={"language": language}).to_string())
+
+
+def run(iterations: int, chars_per_token: float):
+    llm = FakeLLM(latency=0.0)
+    prompts = PromptRegistry(llm, CHARACTERS, languages=["korean"])
+
+    def per_us(stmt) -> float:
+        return timeit.timeit(stmt, number=iterations) / iterations * 1e6
+
+    print("CPU (us/call)        legacy   registry")
+    print(f"chat prompt        {per_us(lambda: _legacy_chat_prompt('korean')):8.1f} "
+          f"{per_us(lambda: prompts.chat_prompt_message('korean')):9.2f}")
+    print(f"structured llm     {per_us(lambda: llm.with_structured_output(schema=Response)):8.1f} "
+          f"{per_us(lambda: prompts.structured_llm):9.2f}")
+    for role, concept in CHARACTERS.items():
+        print(f"sheet {role:<12} {per_us(concept.model_dump_json):8.1f} "
+              f"{per_us(lambda: prompts.character_sheet(concept)):9.2f}")
+
+    def tokens(text: str) -> int:
+        return estimate_tokens([SystemMessage(text)], chars_per_token)
+
+    print(f"\ncharacter sheet size         chars legacy/normalized    tokens legacy/normalized "
+          f"(chars_per_token={chars_per_token})")
+    for role, concept in CHARACTERS.items():
+        legacy, normalized = concept.model_dump_json(), prompts.character_sheet(concept)
+        print(f"{role:<28} {len(legacy):7d} {len(normalized):9d}  (-{len(legacy) - len(normalized)})"
+              f" {tokens(legacy):8d} {tokens(normalized):9d}  (-{tokens(legacy) - tokens(normalized)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--chars-per-token", type=float, default=ContextPolicy().chars_per_token,
+                        help="토큰 수 추정에 쓰는 토큰당 평균 글자 수 (기본값은 ContextPolicy와 같음)")
+    args = parser.parse_args()
+    run(args.iterations, args.chars_per_token)
@@ -0,0 +1,91 @@
+"""세션 생성 비용과 세션당 메모리 측정 (매치업 캐시 적중 상태, LLM 호출 없음)
+
+    python -m benchmarks.session_footprint [--sessions 10000] [--turns 0]
+
+--max-rss-mb를 주면 측정 구간의 RSS 증가량이 한도를 넘을 때 종료 코드 1로 끝난다.
+
+턴마다 그래프가 세션의 전체 메시지 목록을 합치고 직렬화하므로 턴 비용이 대화 길이에 비례해 늘어난다
+(세션 1,000개 x 200턴을 그대로 돌리면 1시간이 넘게 걸림). 세션당 메모리는 세션 수와 무관하므로
+--extrapolate N을 주면 적은 세션으로 측정한 세션당 증가량을 세션 N개로 환산하고, 한도도 환산값과 비교한다.
+측정 구간의 고정 비용까지 세션 수로 나누므로 환산값은 실제보다 조금 크게 나온다. 예 (1코어에서 약 2분):
+
+    python -m benchmarks.session_footprint --sessions 20 --turns 200 --no-tracemalloc --extrapolate 1000 --max-rss-mb 1024
+"""
+import argparse
+import asyncio
+import gc
+import resource
+import sys
+import time
+import tracemalloc
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from core.checkpoint import LatestCheckpointSaver
+from core.session_manager import SessionManager
+from benchmarks.fake_llm import FakeLLM
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run(sessions: int, turns: int, retention: str, trace: bool, max_rss_mb: float, extrapolate: int) -> bool:
+    checkpointer = MemorySaver() if retention == "all" else LatestCheckpointSaver()
+    session_manager = SessionManager(llm=FakeLLM(latency=0.0), checkpointer=checkpointer)
+    # 매치업 캐시를 미리 채워서 세션 생성 자체의 비용만 측정
+    await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    session_ids = []
+    for _ in range(sessions):
+        session_ids.append(await session_manager.create_session(character_role="바르곤", opponent_role="카게츠"))
+    elapsed = time.perf_counter() - started
+
+    for _ in range(turns):
+        for session_id in session_ids:
+            await session_manager.submit(session_id, lambda agent: agent.achat("안녕"))
+
+    gc.collect()
+    rss_growth = _rss_mb() - rss_before
+    turn_elapsed = time.perf_counter() - started - elapsed
+
+    print(f"sessions={sessions} turns={turns} retention={retention}")
+    print(f"create: {elapsed:.2f}s total, {elapsed / sessions * 1000:.3f}ms/session")
+    if turns:
+        print(f"turns: {turn_elapsed:.1f}s total, {turn_elapsed / (sessions * turns) * 1000:.1f}ms/turn")
+    if trace:
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"memory: {traced / sessions / 1024:.1f}KiB/session (tracemalloc)")
+    print(f"peak RSS +{rss_growth:.0f}MiB ({rss_growth * 1024 / sessions:.1f}KiB/session)")
+    session_manager.shutdown()
+
+    label = "RSS growth"
+    if extrapolate:
+        rss_growth = rss_growth / sessions * extrapolate
+        label = f"projected RSS growth for {extrapolate} sessions"
+        print(f"{label}: +{rss_growth:.0f}MiB")
+    if max_rss_mb and rss_growth > max_rss_mb:
+        print(f"FAIL: {label} {rss_growth:.0f}MiB exceeds {max_rss_mb:.0f}MiB")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--turns", type=int, default=0, help="세션마다 추가로 실행할 채팅 턴 수")
+    parser.add_argument("--retention", choices=["latest", "all"], default="latest", help="체크포인트 보존 정책")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="tracemalloc 없이 RSS만 측정 (훨씬 빠름)")
+    parser.add_argument("--max-rss-mb", type=float, default=0, help="허용할 RSS 증가량 한도 (0이면 검사 안 함)")
+    parser.add_argument("--extrapolate", type=int, default=0,
+                        help="측정한 세션당 RSS 증가량을 이 세션 수로 환산해 보고하고 한도와 비교 (0이면 환산 안 함)")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run(
+        args.sessions, args.turns, args.retention, not args.no_tracemalloc, args.max_rss_mb, args.extrapolate
+    )) else 1)
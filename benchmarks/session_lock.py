@@ -0,0 +1,72 @@
+"""InitSession 폭주 중 get_session 지연 측정
+
+    python -m benchmarks.session_lock [--burst 50] [--latency 1.0]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import List
+
+from core.session_manager import SessionManager
+from services.character_chat_service import CharacterChatService, MockInitSessionRequest, MockContext
+from benchmarks.fake_llm import FakeLLM
+
+
+def _sample_get_session(session_manager: SessionManager, session_id: str, stop: threading.Event) -> List[float]:
+    """다른 스레드에서 get_session을 반복 호출하며 지연(ms) 수집"""
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        session_manager.get_session(session_id)
+        samples.append((time.perf_counter() - started) * 1000)
+        time.sleep(0.001)
+    return samples
+
+
+def _report(label: str, samples: List[float]):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:<10} n={len(samples):<6} p50={statistics.median(samples):.4f}ms "
+          f"p99={p99:.4f}ms max={samples[-1]:.4f}ms")
+
+
+async def run(burst: int, latency: float):
+    session_manager = SessionManager(llm=FakeLLM(latency=latency))
+    service = CharacterChatService(session_manager)
+    session_id = await session_manager.create_session()
+
+    async def measure(label: str, work):
+        stop = threading.Event()
+        sampler = asyncio.get_running_loop().run_in_executor(
+            None, _sample_get_session, session_manager, session_id, stop
+        )
+        await work()
+        stop.set()
+        _report(label, await sampler)
+
+    async def idle():
+        await asyncio.sleep(2 * latency)
+
+    async def init_burst():
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            service.InitSession(MockInitSessionRequest(
+                session_id="", character_role="바르곤", opponent_role="카게츠", language="korean"
+            ), MockContext())
+            for _ in range(burst)
+        ])
+        print(f"{burst} InitSession 완료: {time.perf_counter() - started:.2f}s")
+
+    await measure("idle", idle)
+    await measure("burst", init_burst)
+    session_manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=1.0, help="가짜 LLM 호출 1회 지연(초)")
+    args = parser.parse_args()
+    asyncio.run(run(args.burst, args.latency))
@@ -0,0 +1,74 @@
+"""스레드 수에 따른 get_session 조회 처리량 측정 (stripe 1개 = 예전 단일 락과 같은 직렬화)
+
+    python -m benchmarks.session_registry [--sessions 1000] [--threads 1,2,4,8,16] [--stripes 1,16,64]
+
+각 스레드가 duration초 동안 임의의 세션을 get_session으로 조회하고, 초당 조회 수를 출력한다.
+조회마다 활동 시각도 기록되므로 Chat/Analyze RPC의 세션 조회 경로와 같은 작업이다.
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+from typing import List
+
+from core.session_manager import SessionManager
+from benchmarks.fake_llm import FakeLLM
+
+
+def _lookup_load(session_manager: SessionManager, session_ids: List[str], threads: int, duration: float) -> float:
+    """threads개 스레드로 duration초 동안 조회하여 초당 조회 수 반환"""
+    counts = [0] * threads
+    start = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def worker(index: int):
+        rng = random.Random(index)
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            for _ in range(100):
+                session_manager.get_session(session_ids[rng.randrange(len(session_ids))])
+            count += 100
+        counts[index] = count
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - started)
+
+
+async def run(sessions: int, thread_counts: List[int], stripe_counts: List[int], duration: float):
+    print(f"sessions={sessions} duration={duration}s")
+    print(f"{'stripes':>8} " + " ".join(f"{f'{threads}T':>10}" for threads in thread_counts))
+    for stripes in stripe_counts:
+        session_manager = SessionManager(llm=FakeLLM(latency=0.0), registry_stripes=stripes, max_sessions=0,
+                                         max_memory_mb=0)
+        session_ids = [
+            await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+            for _ in range(sessions)
+        ]
+        rates = [_lookup_load(session_manager, session_ids, threads, duration) for threads in thread_counts]
+        print(f"{stripes:>8} " + " ".join(f"{rate / 1000:>9.0f}k" for rate in rates))
+        session_manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--threads", default="1,2,4,8,16", help="쉼표로 구분한 스레드 수 목록")
+    parser.add_argument("--stripes", default="1,16,64", help="쉼표로 구분한 stripe 수 목록")
+    parser.add_argument("--duration", type=float, default=1.0, help="스레드 수마다 측정할 시간(초)")
+    args = parser.parse_args()
+    asyncio.run(run(
+        args.sessions,
+        [int(value) for value in args.threads.split(",")],
+        [int(value) for value in args.stripes.split(",")],
+        args.duration
+    ))
@@ -0,0 +1,76 @@
+"""쓰기가 많은 채팅 부하에서 세션 저장소별 처리량 측정 (LLM 지연 0)
+
+    python -m benchmarks.session_store [--sessions 200] [--turns 20] [--hot-capacity 50]
+
+memory(LatestCheckpointSaver)와 sqlite(SQLiteSessionStore)를 같은 부하로 비교하고,
+sqlite는 재시작 후 메모리에 없는 세션을 다시 읽어 오는 비용도 측정한다.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from core.checkpoint import LatestCheckpointSaver
+from core.session_manager import SessionManager
+from core.session_store import SQLiteSessionStore
+from benchmarks.fake_llm import FakeLLM
+
+
+async def _chat_load(session_manager: SessionManager, sessions: int, turns: int) -> list:
+    session_ids = [
+        await session_manager.create_session(character_role="바르곤", opponent_role="카게츠")
+        for _ in range(sessions)
+    ]
+
+    async def converse(session_id: str):
+        for _ in range(turns):
+            await session_manager.submit(session_id, lambda agent: agent.achat("안녕"))
+
+    started = time.perf_counter()
+    # 모든 세션이 동시에 대화 (세션 안의 턴은 순서대로)
+    await asyncio.gather(*[converse(session_id) for session_id in session_ids])
+    elapsed = time.perf_counter() - started
+    print(f"  chat: {sessions * turns} turns in {elapsed:.2f}s, {sessions * turns / elapsed:.0f} turns/s")
+    return session_ids
+
+
+async def run(sessions: int, turns: int, hot_capacity: int):
+    print(f"sessions={sessions} turns={turns}")
+
+    print("memory")
+    session_manager = SessionManager(llm=FakeLLM(latency=0.0), checkpointer=LatestCheckpointSaver())
+    await _chat_load(session_manager, sessions, turns)
+    session_manager.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+
+        print(f"sqlite (hot_capacity={hot_capacity})")
+        store = SQLiteSessionStore(path, hot_capacity=hot_capacity)
+        session_manager = SessionManager(llm=FakeLLM(latency=0.0), session_store=store)
+        session_ids = await _chat_load(session_manager, sessions, turns)
+        print(f"  flushes={store.flushes} cold_loads={store.cold_loads} evictions={store.evictions} "
+              f"hot={store.hot_threads} db={os.path.getsize(path) / 1024:.0f}KiB")
+        session_manager.shutdown()
+
+        # 재시작: 새 프로세스처럼 빈 메모리에서 시작하여 저장된 세션으로 대화를 이어감
+        store = SQLiteSessionStore(path, hot_capacity=hot_capacity)
+        session_manager = SessionManager(llm=FakeLLM(latency=0.0), session_store=store)
+        started = time.perf_counter()
+        for session_id in session_ids:
+            await session_manager.submit(session_id, lambda agent: agent.achat("다시 왔다"))
+        elapsed = time.perf_counter() - started
+        history = len(session_manager.get_session(session_ids[0]).get_conversation_history())
+        print(f"  restart: {sessions} cold sessions resumed in {elapsed:.2f}s "
+              f"({elapsed / sessions * 1000:.2f}ms/turn incl. load), history={history} messages")
+        session_manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--hot-capacity", type=int, default=50, help="메모리에 유지할 세션 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.turns, args.hot_capacity))
@@ -0,0 +1,72 @@
+"""StreamChat 스트림 하나로 여러 매치를 보낼 때 동시 처리 수에 따른 처리 시간 비교 (fake LLM)
+
+    python -m benchmarks.stream_chat [--matches 16] [--turns 4] [--latency 0.2] [--concurrency 8]
+
+매치(세션)마다 turns개의 요청을 번갈아 섞어 한 스트림으로 보내고, 전체 소요 시간과 응답 지연 분포를 출력한다.
+동시 처리 수가 1이면 앞 매치의 LLM 호출이 끝날 때까지 뒤 매치가 기다린다 (head-of-line blocking).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from benchmarks.fake_llm import FakeLLM
+from core.session_manager import SessionManager
+from services.stream_dispatch import dispatch_by_key
+
+
+async def _stream(session_manager: SessionManager, session_ids: List[str], turns: int, concurrency: int):
+    sent: Dict[str, float] = {}
+
+    async def requests():
+        for turn in range(turns):
+            for session_id in session_ids:
+                request_id = f"{session_id}:{turn}"
+                sent[request_id] = time.perf_counter()
+                yield session_id, request_id
+
+    async def handle(request):
+        session_id, request_id = request
+        await session_manager.submit(session_id, lambda agent: agent.achat("간다!"))
+        return request_id
+
+    started = time.perf_counter()
+    latencies = []
+    order: Dict[str, List[str]] = {}
+    async for request_id in dispatch_by_key(requests(), lambda request: request[0], handle, concurrency):
+        latencies.append(time.perf_counter() - sent[request_id])
+        session_id, turn = request_id.rsplit(":", 1)
+        order.setdefault(session_id, []).append(turn)
+
+    # 같은 세션의 응답은 요청 순서대로 와야 함
+    assert all(turns_ == [str(turn) for turn in range(turns)] for turns_ in order.values())
+    return time.perf_counter() - started, latencies
+
+
+async def run(matches: int, turns: int, latency: float, concurrency: int):
+    llm = FakeLLM(latency=latency)
+    session_manager = SessionManager(llm=llm, max_sessions=0, max_memory_mb=0)
+    session_ids = [
+        await session_manager.create_session(character_role="바르곤", opponent_role="카게츠") for _ in range(matches)
+    ]
+
+    print(f"matches={matches} turns={turns} llm_latency={latency}s")
+    for label, limit in [("serial", 1), (f"concurrency {concurrency}", concurrency)]:
+        elapsed, latencies = await _stream(session_manager, session_ids, turns, limit)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(f"{label:<16} total={elapsed:6.2f}s p50={p50:7.1f}ms p99={p99:7.1f}ms")
+
+    session_manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=16, help="한 스트림에 섞어 보내는 세션 수")
+    parser.add_argument("--turns", type=int, default=4, help="세션마다 보내는 요청 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake LLM 호출 하나의 지연 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args.matches, args.turns, args.latency, args.concurrency))
@@ -0,0 +1,107 @@
+"""워커 프로세스 수에 따른 Chat RPC 처리량 측정 (fake LLM, 지연 0)
+
+    python -m benchmarks.workers [--workers 1,2,4] [--sessions 64] [--channels 8] [--duration 10]
+
+워커 수마다 server.MultiProcessServer(디스패처 + 워커 프로세스)를 별도 프로세스로 띄우고,
+여러 채널에서 세션마다 Chat을 연속으로 보내 초당 RPC 수를 잰다. 비교를 위해 디스패처 없는
+단일 프로세스 서버(direct)도 측정한다. 부하 생성기도 같은 호스트의 CPU를 쓰므로 코어 수가 적으면
+워커를 늘려도 처리량이 늘지 않는다.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from typing import List
+
+from grpc import aio
+
+from benchmarks.fake_llm import FakeLLM
+from generated import chatbot_pb2, chatbot_pb2_grpc
+
+
+def _fake_llm():
+    return FakeLLM(latency=0.0)
+
+
+def _serve(port: int, workers: int):
+    # 워커 프로세스에서도 import되므로 server 모듈은 여기서 불러옴
+    from server import GRPCServer, MultiProcessServer
+
+    if workers == 0:
+        server = GRPCServer(port=port, host="127.0.0.1", llm_factory=_fake_llm)
+    else:
+        server = MultiProcessServer(port=port, workers=workers, llm_factory=_fake_llm)
+    asyncio.run(server.start())
+
+
+async def _wait_ready(port: int, timeout: float = 120.0):
+    deadline = time.monotonic() + timeout
+    async with aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        stub = chatbot_pb2_grpc.HealthStub(channel)
+        while time.monotonic() < deadline:
+            try:
+                response = await stub.Check(chatbot_pb2.HealthCheckRequest(service=""), timeout=1.0)
+                if response.status == chatbot_pb2.HealthCheckResponse.SERVING:
+                    return
+            except aio.AioRpcError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"server on port {port} did not become ready")
+
+
+async def _chat_load(port: int, sessions: int, channels: int, duration: float) -> float:
+    """세션마다 Chat을 연속으로 보내 duration초 동안의 초당 RPC 수 반환"""
+    opened = [aio.insecure_channel(f"127.0.0.1:{port}") for _ in range(channels)]
+    stubs = [chatbot_pb2_grpc.CharacterChatServiceStub(channel) for channel in opened]
+    session_ids: List[str] = []
+    for index in range(sessions):
+        response = await stubs[index % channels].InitSession(chatbot_pb2.InitSessionRequest(
+            character_role="바르곤", opponent_role="카게츠", language="korean"
+        ))
+        session_ids.append(response.session_id)
+
+    counts = [0] * sessions
+    stop = time.monotonic() + duration
+
+    async def converse(index: int):
+        stub = stubs[index % channels]
+        while time.monotonic() < stop:
+            await stub.Chat(chatbot_pb2.ChatRequest(session_id=session_ids[index], user_message="안녕"))
+            counts[index] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[converse(index) for index in range(sessions)])
+    elapsed = time.perf_counter() - started
+    for channel in opened:
+        await channel.close()
+    return sum(counts) / elapsed
+
+
+def run(worker_counts: List[int], sessions: int, channels: int, duration: float, port: int):
+    print(f"cpus={os.cpu_count()} sessions={sessions} channels={channels} duration={duration}s")
+    context = multiprocessing.get_context("spawn")
+    baseline = None
+    for workers in [0, *worker_counts]:
+        process = context.Process(target=_serve, args=(port, workers))
+        process.start()
+        try:
+            asyncio.run(_wait_ready(port))
+            rate = asyncio.run(_chat_load(port, sessions, channels, duration))
+        finally:
+            process.terminate()
+            process.join(60)
+        label = "direct" if workers == 0 else f"{workers} workers"
+        baseline = baseline or rate
+        print(f"{label:<10} {rate:8.0f} RPC/s  ({rate / baseline:.2f}x direct)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,2,4", help="쉼표로 구분한 워커 수 목록")
+    parser.add_argument("--sessions", type=int, default=64, help="동시에 대화하는 세션 수")
+    parser.add_argument("--channels", type=int, default=8, help="클라이언트 gRPC 채널 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="워커 수마다 측정할 시간(초)")
+    parser.add_argument("--port", type=int, default=50151)
+    args = parser.parse_args()
+    run([int(value) for value in args.workers.split(",")], args.sessions, args.channels, args.duration, args.port)
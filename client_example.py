@@ -34,14 +34,18 @@ class MockGRPCClient:
             await self.channel.close()
         self.logger.info("Disconnected from server")
 
-    async def init_session(self, character_role: str, opponent_role: str, language: str = "korean", session_id: str = None):
-        """세션 초기화"""
+    async def init_session(self, character_role: str, opponent_role: str, language: str = "korean", session_id: str = None,
+                           background_init: bool = False, idle_timeout_seconds: int = 0, max_lifetime_seconds: int = 0):
+        """세션 초기화 (TTL이 0이면 서버 기본값)"""
         # 실제 환경에서는:
         request = chatbot_pb2.InitSessionRequest(
             session_id=session_id or "",
             character_role=character_role,
             opponent_role=opponent_role,
-            language=language
+            language=language,
+            background_init=background_init,
+            idle_timeout_seconds=idle_timeout_seconds,
+            max_lifetime_seconds=max_lifetime_seconds
         )
         response = await self.stub.InitSession(request)
         return response
@@ -53,6 +57,37 @@ class MockGRPCClient:
         #     "error_message": ""
         # }
 
+    async def get_session_status(self, session_id: str):
+        """세션 준비 상태 조회"""
+        request = chatbot_pb2.SessionStatusRequest(session_id=session_id)
+        response = await self.stub.GetSessionStatus(request)
+        return response
+
+    async def get_session_stats(self, top_n: int = 10):
+        """세션 통계 조회 (활성/휴면 세션 수, 메모리 사용량과 가장 큰 세션 top_n개)"""
+        request = chatbot_pb2.SessionStatsRequest(top_n=top_n)
+        response = await self.stub.GetSessionStats(request)
+        return response
+
+    async def watch_session_events(self, session_ids: list = None):
+        """세션 이벤트(만료, 제거, 종료) 스트림 - session_ids가 없으면 모든 세션"""
+        request = chatbot_pb2.SessionEventsRequest(session_ids=session_ids or [])
+        async for event in self.stub.WatchSessionEvents(request):
+            yield event
+
+    async def export_sessions(self, drain: bool = False):
+        """세션 스냅샷 스트림 (drain이면 새 세션을 막고 진행 중인 턴이 끝난 뒤 내보냄)"""
+        request = chatbot_pb2.ExportSessionsRequest(drain=drain)
+        async for snapshot in self.stub.ExportSessions(request):
+            yield snapshot
+
+    async def import_sessions(self, snapshots):
+        """export_sessions로 받은 스냅샷을 이 서버로 가져오기"""
+        async def requests():
+            async for snapshot in snapshots:
+                yield snapshot
+        return await self.stub.ImportSessions(requests())
+
     async def chat(self, session_id: str, message: str):
         """채팅 메시지 전송"""
         # 실제 환경에서는:
@@ -117,10 +152,11 @@ class MockGRPCClient:
         """스트림 채팅"""
         # 실제 환경에서는:
         async def request_generator():
-            for message in messages:
+            for i, message in enumerate(messages):
                 yield chatbot_pb2.ChatRequest(
                     session_id=session_id,
-                    user_message=message
+                    user_message=message,
+                    request_id=str(i)
                 )
 
         responses = []
@@ -1,11 +1,44 @@
-from .agent import Agent, AgentException
-from .session_manager import SessionManager
+from .agent import Agent, AgentException, AgentGraph, DeadlineExceededException
+from .matchup_cache import MatchupCache
+from .checkpoint import LatestCheckpointSaver
+from .session_store import SQLiteSessionStore
+from .context import ContextPolicy
+from .streaming import ResponseStreamParser
+from .prompts import PromptRegistry
+from .mailbox import SessionMailbox, SessionBusyException
+from .limiter import LLMLimiter, LLMOverloadedException
+from .coalescer import Coalescer
+from .match_policy import MatchPolicy, MatchEvent, MatchEventType
+from .registry import SessionRegistry
+from .expiry import ExpiryScheduler
+from .session_manager import SessionManager, SessionState, SessionEventType, SessionDrainingException
 from .concepts import CHARACTERS, Vargon, Naktis, Kagetsu
 
 __all__ = [
     'Agent',
     'AgentException',
+    'AgentGraph',
+    'DeadlineExceededException',
+    'MatchupCache',
+    'LatestCheckpointSaver',
+    'SQLiteSessionStore',
+    'ContextPolicy',
+    'ResponseStreamParser',
+    'PromptRegistry',
+    'SessionMailbox',
+    'SessionBusyException',
+    'LLMLimiter',
+    'LLMOverloadedException',
+    'Coalescer',
+    'MatchPolicy',
+    'MatchEvent',
+    'MatchEventType',
+    'SessionRegistry',
     'SessionManager',
+    'SessionState',
+    'SessionEventType',
+    'SessionDrainingException',
+    'ExpiryScheduler',
     'CHARACTERS',
     'Vargon',
     'Naktis',
@@ -1,30 +1,44 @@
+import asyncio
 import json
+import time
 import uuid
-from typing import Literal, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 import logging
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+from langchain_core.messages import BaseMessage, SystemMessage, AIMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import MessagesState, END
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 from pydantic import BaseModel, Field, ValidationError
 
 from models.concept import Concept
 from models.response import Response
+from .checkpoint import LatestCheckpointSaver
+from .concepts import CHARACTERS
+from .context import ContextPolicy, build_context, select_recent_start
+from .matchup_cache import MatchupCache
+from .prompts import PromptRegistry, assemble_prompt, build_summary_prompt
+from .streaming import ResponseStreamParser, chunk_text
+
+if TYPE_CHECKING:
+    from .limiter import LLMLimiter
 
 
 class Process(BaseModel):
-    action: Literal["chat", "analysis", "done"] = Field(description="사용자가 원하는 동작")
+    action: Literal["chat", "analysis", "react", "done"] = Field(description="사용자가 원하는 동작")
     query: str = Field(description="사용자 질의")
 
 
 class ProcessState(MessagesState):
     process: Optional[Process] = None
     initialized: bool = False  # 초기화 상태 추가
+    context_start: int = 0  # 초기화 대화(항상 LLM에 보내는 부분)의 길이
+    summary: str = ""  # 컨텍스트 범위 밖으로 밀려난 대화의 롤링 요약
+    summarized_count: int = 0  # 요약에 반영된 대화 메시지 수 (초기화 대화 이후 기준)
 
 
 class AgentException(Exception):
@@ -35,104 +49,277 @@ class AgentException(Exception):
         return self.message
 
 
-class Agent:
-    def __init__(self, llm: BaseChatModel, concept: Concept, language: str, opponent_concept: Concept):
+class DeadlineExceededException(AgentException):
+    """턴의 마감 시각이 지나 LLM 호출을 하지 않거나 중단했을 때 발생"""
+    pass
+
+
+# 현재 턴의 마감 시각 (time.monotonic 기준, None이면 없음) - 그래프 노드의 LLM 호출 timeout으로 사용
+_turn_deadline: ContextVar[Optional[float]] = ContextVar("turn_deadline", default=None)
+
+
+# 현재 턴의 응답 조각을 받을 콜백 (field, value) - 있으면 채팅 응답을 스트리밍으로 생성
+_turn_listener: ContextVar[Optional[Callable[[str, str], None]]] = ContextVar("turn_listener", default=None)
+
+
+@contextmanager
+def turn_deadline(deadline: Optional[float]):
+    """with 블록 안에서 실행되는 LLM 호출에 마감 시각 적용"""
+    token = _turn_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _turn_deadline.reset(token)
+
+
+@contextmanager
+def turn_listener(listener: Optional[Callable[[str, str], None]]):
+    """with 블록 안의 채팅 응답을 스트리밍으로 생성하고 조각을 listener로 전달"""
+    token = _turn_listener.set(listener)
+    try:
+        yield
+    finally:
+        _turn_listener.reset(token)
+
+
+class AgentGraph:
+    """모든 세션이 공유하는 컴파일된 그래프와 체크포인터
+
+    세션별 정보(캐릭터, 상대방, 언어)는 RunnableConfig의 configurable로 전달되고,
+    대화 기록은 thread_id로 구분되어 하나의 체크포인터에 저장된다.
+    """
+
+    def __init__(
+            self,
+            llm: BaseChatModel,
+            matchup_cache: Optional[MatchupCache] = None,
+            prompts: Optional[PromptRegistry] = None,
+            context_policy: Optional[ContextPolicy] = None,
+            checkpointer: Optional[BaseCheckpointSaver] = None,
+            limiter: Optional["LLMLimiter"] = None
+    ):
         self.__llm: BaseChatModel = llm
-        self.__language: str = language
-        self.__concept: Concept = concept
-        self.__opponent_concept: Concept = opponent_concept
-        self.__config: RunnableConfig = {"configurable": {"thread_id": str(uuid.uuid4())}}
-        self.__chat_prompt_message: SystemMessage = self.__generate_chat_prompt_message(
-            language=language, opponent_concept=opponent_concept
-        )
-        self.__memory: MemorySaver = MemorySaver()
+        self.__limiter: Optional["LLMLimiter"] = limiter  # None이면 LLM 동시 호출 수 제한 없음
+        self.__matchup_cache: Optional[MatchupCache] = matchup_cache
+        self.__prompts: PromptRegistry = prompts if prompts is not None else PromptRegistry(llm, CHARACTERS)
+        self.__context_policy: Optional[ContextPolicy] = context_policy  # None이면 전체 기록 전송
+        # 백그라운드에서 생성된 요약 (thread_id -> (요약, 반영된 메시지 수)), 다음 턴에 상태에 기록
+        self.__pending_summaries: Dict[str, Tuple[str, int]] = {}
+        self.__summary_tasks: Dict[str, asyncio.Task] = {}
+        # 기본값은 스레드마다 최신 체크포인트만 유지하는 체크포인터
+        self.__memory: BaseCheckpointSaver = checkpointer if checkpointer is not None else LatestCheckpointSaver()
         self.__graph: CompiledStateGraph = self.__build_graph()
 
         # 로깅 설정
         logging.getLogger("langchain_google_genai.chat_models").setLevel(logging.ERROR)
 
-        # 에이전트 초기화 - 그래프 실행하여 초기화 완료
-        self._initialize_agent()
-
-    def _initialize_agent(self):
-        """에이전트 초기화 - init만 실행하고 멈춤"""
+    async def __ainvoke(self, runnable, input: Any, config: Optional[RunnableConfig] = None):
+        """LLM 호출 - limiter가 있으면 동시 호출 수 제한과 대기열을 거침 (초과 시 LLMOverloadedException)"""
+        return await self.__limited(lambda: runnable.ainvoke(input=input, config=config))
+
+    async def __limited(self, make_call: Callable[[], Awaitable[Any]]):
+        """limiter와 턴 마감 시각을 적용하여 LLM 호출 실행
+
+        턴에 마감 시각이 있으면 대기열 대기를 포함한 남은 시간을 timeout으로 쓰고,
+        이미 지났으면 호출하지 않고 DeadlineExceededException을 던진다.
+        """
+        call = make_call() if self.__limiter is None else self.__limiter.run(make_call)
+
+        deadline = _turn_deadline.get()
+        if deadline is None:
+            return await call
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            call.close()
+            raise DeadlineExceededException("Deadline exceeded before the LLM call")
         try:
-            # 초기화만 실행하는 상태
-            initial_state = ProcessState(
-                messages=[],
-                process=Process(action="done", query="init"),  # done으로 설정해서 초기화 후 바로 종료
-                initialized=False
-            )
-            result = self.__graph.invoke(input=initial_state, config=self.__config)
-            logging.info("Agent initialized successfully")
-        except Exception as e:
-            logging.error(f"Agent initialization failed: {e}")
-            raise AgentException(f"Failed to initialize agent: {e}")
+            return await asyncio.wait_for(call, timeout=remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededException(f"LLM call did not finish within the remaining {remaining:.2f}s")
+
+    async def __stream_response(
+            self,
+            llm_input: List[BaseMessage],
+            config: RunnableConfig,
+            listener: Callable[[str, str], None]
+    ) -> Response:
+        """채팅 응답을 토큰 스트리밍으로 생성 - speech 조각과 완성된 emotion을 listener로 바로 전달"""
+        parser = ResponseStreamParser()
+        async for chunk in self.__llm.astream(input=llm_input, config=config):
+            for field, value in parser.feed(chunk_text(chunk)):
+                listener(field, value)
+        return parser.result()
+
+    async def ainvoke_turn(self, input: Any, config: RunnableConfig) -> Dict[str, Any]:
+        """그래프 한 턴 실행 - 응답을 돌려주지 못하면(취소, 마감 초과, LLM 과부하, LLM 오류 등) 턴 시작 전 체크포인트로 되돌림
+
+        노드 사이에 저장된 중간 체크포인트(사용자 메시지만 있고 응답이 없는 상태)가 남지 않도록 한다.
+        거절되거나 실패한 입력이 대화 기록에 남으면 다음 턴에서 응답 없는 메시지가 연달아 보이게 된다.
+        되돌리기는 LatestCheckpointSaver 계열에서만 동작한다 (전체 이력을 보관하는 체크포인터는 그대로 둠).
+        """
+        thread_id = config["configurable"]["thread_id"]
+        saved = self.__memory.export_thread(thread_id) if isinstance(self.__memory, LatestCheckpointSaver) else None
+        try:
+            return await self.__graph.ainvoke(input=input, config=config)
+        except BaseException:
+            if saved is not None:
+                self.__memory.rollback_thread(thread_id, saved)
+            raise
+
+    async def ainvoke_init(self, input: Any, config: RunnableConfig) -> Dict[str, Any]:
+        """초기화 실행 - 끝까지 마치지 못하면(취소, LLM 과부하, LLM 오류 등) 스레드를 삭제
+
+        실패한 초기화의 체크포인트는 어떤 세션에도 속하지 않으므로 그대로 두면 공유 체크포인터에 계속 남는다.
+        취소된 경우 LangGraph가 남은 체크포인트 저장을 마칠 때까지 기다린 뒤 삭제하여 늦게 도착한 쓰기가 남지 않게 한다.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        try:
+            return await self.__graph.ainvoke(input=input, config=config)
+        except BaseException as e:
+            await _finish_pending_writes(e)
+            self.delete_thread(thread_id)
+            raise
 
     @staticmethod
-    def __generate_chat_prompt_message(language: str, opponent_concept: Concept) -> SystemMessage:
-        chat_output_parser: PydanticOutputParser = PydanticOutputParser(pydantic_object=Response)
-        chat_prompt = PromptTemplate(
-            template="Must answer in {language}. Wrap the output in `json` tags.\n{format_instruction}",
-            input_variables=["language", "opponent_character"],
-            partial_variables={"format_instruction": chat_output_parser.get_format_instructions()}
-        )
-        return SystemMessage(
-            chat_prompt.invoke(input={"language": language, "opponent_character": opponent_concept.role}).to_string()
-        )
+    def make_config(thread_id: str, concept: Concept, opponent_concept: Concept, language: str) -> RunnableConfig:
+        """세션 실행용 config 생성"""
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "concept": concept,
+                "opponent_concept": opponent_concept,
+                "language": language
+            }
+        }
+
+    def __context_messages(self, state: ProcessState, config: RunnableConfig) -> List[BaseMessage]:
+        """정책에 따라 LLM에 보낼 기록 구성 - 범위 밖으로 밀려난 대화는 백그라운드 요약 예약"""
+        messages = state["messages"]
+        if self.__context_policy is None:
+            return messages
+
+        context_start = state.get("context_start", 0)
+        prefix, dialogue = messages[:context_start], messages[context_start:]
+        start = select_recent_start(dialogue, self.__context_policy)
+
+        summarized_count = state.get("summarized_count", 0)
+        if start > summarized_count:
+            self.__schedule_summary(
+                config["configurable"]["thread_id"], state.get("summary", ""),
+                dialogue[summarized_count:start], start
+            )
+
+        return build_context(prefix, state.get("summary", ""), dialogue, start)
+
+    def __schedule_summary(self, thread_id: str, previous_summary: str, messages: Sequence[BaseMessage], count: int):
+        """요약 생성을 요청 경로 밖에서 실행 (스레드당 하나만)"""
+        if thread_id in self.__summary_tasks:
+            return
+
+        task = asyncio.create_task(self.__summarize(thread_id, previous_summary, list(messages), count))
+        self.__summary_tasks[thread_id] = task
+        task.add_done_callback(lambda _: self.__summary_tasks.pop(thread_id, None))
+
+    async def __summarize(self, thread_id: str, previous_summary: str, messages: List[BaseMessage], count: int):
+        # 요약은 요청과 무관한 작업이므로 턴의 마감 시각을 물려받지 않음
+        _turn_deadline.set(None)
+        try:
+            response = await self.__ainvoke(self.__llm, build_summary_prompt(previous_summary, messages))
+            self.__pending_summaries[thread_id] = (str(response.content), count)
+        except Exception as e:
+            logging.warning(f"Conversation summary failed: {e}")
+
+    def __apply_pending_summary(self, state: ProcessState, config: RunnableConfig):
+        """백그라운드에서 완성된 요약을 이번 턴의 상태에 반영 (체크포인트로 저장됨)"""
+        pending = self.__pending_summaries.pop(config["configurable"]["thread_id"], None)
+        if pending is not None and pending[1] > state.get("summarized_count", 0):
+            state["summary"], state["summarized_count"] = pending
+
+    async def __generate_init_messages(self, config: RunnableConfig) -> list:
+        """캐릭터 소개와 상대방 소개로 이루어진 초기화 대화 생성 (LLM 2회 호출)"""
+        session = config["configurable"]
+        concept: Concept = session["concept"]
+        opponent_concept: Concept = session["opponent_concept"]
+        messages = []
+
+        # 캐릭터 소개
+        query = self.__prompts.init_prompt(session["language"], concept)
+        messages.append(SystemMessage(content=query))
+        response = await self.__ainvoke(self.__llm, SystemMessage(content=query).model_dump_json(), config=config)
+        messages.append(AIMessage(content=response.content))
+
+        # 상대방 소개
+        opponent_intro = f"나는 {opponent_concept.role}, {opponent_concept.group}다."
+        messages.append(HumanMessage(content=opponent_intro))
+        response = await self.__ainvoke(self.__llm, messages, config=config)
+        messages.append(AIMessage(content=response.content))
+
+        return messages
 
     def __build_graph(self) -> CompiledStateGraph:
-        def init_agent_node(state: ProcessState) -> ProcessState:
+        async def init_agent_node(state: ProcessState, config: RunnableConfig) -> ProcessState:
             # 이미 초기화된 경우 스킵
             if state.get("initialized", False):
                 return state
 
-            # 캐릭터 소개
-            query = f"모든 대답은 다음 언어로 답하라. {self.__language}. 너는 {self.__concept.role}이다. 상대방과 너는 같은 존재일 수 있다. \n캐릭터 정보:{self.__concept.model_dump_json()}"
-            state["messages"].append(SystemMessage(content=query))
-            response = self.__llm.invoke(input=SystemMessage(content=query).model_dump_json(), config=self.__config)
-            state["messages"].append(AIMessage(content=response.content))
-
-            # 상대방 소개
-            opponent_intro = f"나는 {self.__opponent_concept.role}, {self.__opponent_concept.group}다."
-            state["messages"].append(HumanMessage(content=opponent_intro))
-            response = self.__llm.invoke(input=state["messages"], config=self.__config)
-            state["messages"].append(AIMessage(content=response.content))
+            # 같은 매치업의 초기화 대화가 캐시되어 있으면 LLM 호출 없이 복제
+            if self.__matchup_cache is not None:
+                session = config["configurable"]
+                key = MatchupCache.make_key(session["concept"], session["opponent_concept"], session["language"])
+                messages = await self.__matchup_cache.get_or_create(
+                    key, lambda: self.__generate_init_messages(config)
+                )
+            else:
+                messages = await self.__generate_init_messages(config)
+            state["messages"].extend(messages)
+            state["context_start"] = len(state["messages"])
 
             # 초기화 완료 표시
             state["initialized"] = True
             return state
 
-        def process_input_node(state: ProcessState) -> ProcessState:
+        def process_input_node(state: ProcessState, config: RunnableConfig) -> ProcessState:
             # process가 미리 설정되어 있어야 함
             process = state.get("process")
             if not process:
                 raise AgentException("No process found in state")
 
+            self.__apply_pending_summary(state, config)
+
             if process.action == "chat":
+                opponent_concept: Concept = config["configurable"]["opponent_concept"]
                 chat_content = {
                     "speech": process.query,
-                    "role": self.__opponent_concept.role,
-                    "group": self.__opponent_concept.group
+                    "role": opponent_concept.role,
+                    "group": opponent_concept.group
                 }
                 state["messages"].append(HumanMessage(content=json.dumps(chat_content)))
 
             elif process.action == "analysis":
-                analysis_content = {
-                    "query": "상대방의 행동에 따른 상황을 분석하여 적절한 대답과 감정을 도출하라.",
-                    "opponent_actions": process.query
-                }
+                # 분석 지시문은 호출 시점에만 붙이고 기록에는 상대방 행동만 남김
+                analysis_content = {"opponent_actions": process.query}
                 state["messages"].append(SystemMessage(content=json.dumps(analysis_content)))
 
+            elif process.action == "react":
+                # 매치 이벤트 요약을 기록하고 채팅과 같은 형식으로 캐릭터의 반응 대사를 생성
+                match_content = {"match_events": process.query}
+                state["messages"].append(SystemMessage(content=json.dumps(match_content)))
+
             return state
 
-        def generate_chat_response_node(state: ProcessState) -> ProcessState:
+        async def generate_chat_response_node(state: ProcessState, config: RunnableConfig) -> ProcessState:
             try:
-                # 채팅 프롬프트 추가
-                state["messages"].append(self.__chat_prompt_message)
-
-                structured_llm = self.__llm.with_structured_output(schema=Response)
-                response = structured_llm.invoke(input=state["messages"], config=self.__config)
+                # 채팅 프롬프트는 이번 호출에만 추가 (기록에는 저장하지 않음)
+                llm_input = assemble_prompt(
+                    self.__context_messages(state, config),
+                    self.__prompts.chat_prompt_message(config["configurable"]["language"])
+                )
+                listener = _turn_listener.get()
+                if listener is None:
+                    response = await self.__ainvoke(self.__prompts.structured_llm, llm_input, config=config)
+                else:
+                    # 스트리밍 요청이면 구조화 출력 대신 원문 스트림을 조각 단위로 파싱 (기록에는 완성된 응답만 저장)
+                    response = await self.__limited(lambda: self.__stream_response(llm_input, config, listener))
 
                 response_content = {
                     "speech": response.speech,
@@ -140,6 +327,9 @@ class Agent:
                 }
                 state["messages"].append(AIMessage(content=json.dumps(response_content)))
                 return state
+            except AgentException:
+                # LLM 과부하는 대체 응답 대신 호출자에게 전달
+                raise
             except Exception as e:
                 logging.error(f"Chat response generation failed: {e}")
                 error_response = {
@@ -149,17 +339,22 @@ class Agent:
                 state["messages"].append(AIMessage(content=json.dumps(error_response)))
                 return state
 
-        def analysis_game_state_node(state: ProcessState) -> ProcessState:
+        async def analysis_game_state_node(state: ProcessState, config: RunnableConfig) -> ProcessState:
             try:
-                response = self.__llm.invoke(input=state["messages"], config=self.__config)
+                llm_input = assemble_prompt(
+                    self.__context_messages(state, config), self.__prompts.analysis_prompt_message()
+                )
+                response = await self.__ainvoke(self.__llm, llm_input, config=config)
                 state["messages"].append(AIMessage(content=response.content))
                 return state
+            except AgentException:
+                raise
             except Exception as e:
                 logging.error(f"Game state analysis failed: {e}")
                 state["messages"].append(AIMessage(content="분석을 수행할 수 없습니다."))
                 return state
 
-        def route_process(state: ProcessState) -> Literal["chat", "analysis", "done"]:
+        def route_process(state: ProcessState) -> Literal["chat", "analysis", "react", "done"]:
             process = state.get("process")
             if not process:
                 return "done"
@@ -192,6 +387,7 @@ class Agent:
         builder.add_conditional_edges("process_input", route_process, {
             "chat": "generate_chat_response",
             "analysis": "analysis_game_state",
+            "react": "generate_chat_response",
             "done": END
         })
         builder.add_edge("generate_chat_response", END)
@@ -199,57 +395,150 @@ class Agent:
 
         return builder.compile(checkpointer=self.__memory)
 
-    def chat(self, user_message: str) -> Response:
-        """채팅 메시지 처리"""
-        try:
-            # 현재 상태 가져오기
-            current_state = self.__get_current_state()
+    @property
+    def compiled(self) -> CompiledStateGraph:
+        """컴파일된 그래프"""
+        return self.__graph
 
-            # Process 설정하여 상태 생성
-            process = Process(action="chat", query=user_message)
-            state = ProcessState(
-                process=process,
-                messages=current_state.get("messages", []),
-                initialized=current_state.get("initialized", True)  # 이미 초기화됨
+    @property
+    def checkpointer(self) -> BaseCheckpointSaver:
+        """공유 체크포인터"""
+        return self.__memory
+
+    def delete_thread(self, thread_id: str):
+        """세션 대화 기록 삭제"""
+        self.__memory.delete_thread(thread_id)
+        self.__pending_summaries.pop(thread_id, None)
+        task = self.__summary_tasks.pop(thread_id, None)
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+
+
+async def _finish_pending_writes(error: BaseException):
+    """취소로 중단된 그래프 실행이 남긴 종료 작업(체크포인트 저장) 대기
+
+    LangGraph는 취소될 때 종료 작업을 CancelledError의 args에 붙여 넘기므로, 이를 기다려야 저장이 모두 끝난다.
+    """
+    if not isinstance(error, asyncio.CancelledError):
+        return
+    for arg in error.args:
+        if isinstance(arg, asyncio.Task):
+            try:
+                await asyncio.shield(arg)
+            except BaseException:
+                pass
+
+
+class Agent:
+    """세션 하나를 가리키는 가벼운 핸들 - thread_id와 캐릭터 정보만 보관하고 그래프는 AgentGraph를 공유"""
+
+    def __init__(
+            self,
+            graph: AgentGraph,
+            concept: Concept,
+            language: str,
+            opponent_concept: Concept,
+            thread_id: Optional[str] = None
+    ):
+        self.__graph: AgentGraph = graph
+        self.__language: str = language
+        self.__concept: Concept = concept
+        self.__opponent_concept: Concept = opponent_concept
+        # thread_id를 주면 체크포인터에 저장된 기존 대화를 이어감
+        self.__thread_id: str = thread_id or str(uuid.uuid4())
+        self.__config: RunnableConfig = AgentGraph.make_config(
+            self.__thread_id, concept, opponent_concept, language
+        )
+
+    @classmethod
+    async def create(cls, graph: AgentGraph, concept: Concept, language: str, opponent_concept: Concept) -> "Agent":
+        """Agent 생성 후 초기화까지 완료하여 반환 (이벤트 루프를 막지 않음)"""
+        agent = cls(graph=graph, concept=concept, language=language, opponent_concept=opponent_concept)
+        await agent.ainitialize()
+        return agent
+
+    async def ainitialize(self):
+        """에이전트 초기화 - init만 실행하고 멈춤"""
+        try:
+            # 초기화만 실행하는 상태
+            initial_state = ProcessState(
+                messages=[],
+                process=Process(action="done", query="init"),  # done으로 설정해서 초기화 후 바로 종료
+                initialized=False
             )
+            await self.__graph.ainvoke_init(input=initial_state, config=self.__config)
+            logging.info("Agent initialized successfully")
+        except AgentException:
+            raise
+        except Exception as e:
+            logging.error(f"Agent initialization failed: {e}")
+            raise AgentException(f"Failed to initialize agent: {e}")
 
-            result = self.__graph.invoke(input=state, config=self.__config)
+    def chat(self, user_message: str) -> Response:
+        """채팅 메시지 처리 (동기 호출용 - 실행 중인 이벤트 루프 밖에서만 사용)"""
+        return asyncio.run(self.achat(user_message))
 
-            # 마지막 메시지에서 응답 추출
-            if result["messages"]:
-                last_message = result["messages"][-1]
-                if isinstance(last_message, AIMessage):
-                    try:
-                        response_data = json.loads(last_message.content)
-                        return Response(
-                            speech=response_data.get("speech", "응답을 생성할 수 없습니다."),
-                            emotion=response_data.get("emotion", "당황")
-                        )
-                    except json.JSONDecodeError:
-                        return Response(speech=last_message.content, emotion="보통")
-
-            # 기본 응답
-            return Response(speech="응답을 생성할 수 없습니다.", emotion="당황")
+    async def achat(self, user_message: str, on_event: Optional[Callable[[str, str], None]] = None) -> Response:
+        """채팅 메시지 처리
 
+        on_event를 주면 응답을 스트리밍으로 생성하며 speech 조각("speech", 조각)과 완성된 감정("emotion", 값)을
+        도착하는 대로 전달한다. 반환값과 대화 기록은 스트리밍 여부와 관계없이 완성된 응답이다.
+        """
+        try:
+            # Process만 입력 - 대화 기록은 체크포인터에서 이어짐
+            process = Process(action="chat", query=user_message)
+            with turn_listener(on_event):
+                result = await self.__graph.ainvoke_turn(input={"process": process}, config=self.__config)
+            return self.__response_from(result)
+
+        except AgentException:
+            raise
         except Exception as e:
             logging.error(f"Chat processing failed: {e}")
             return Response(speech="오류가 발생했습니다.", emotion="당황")
 
+    async def areact(self, match_events: str) -> Response:
+        """매치 이벤트 요약에 대한 캐릭터의 반응 대사 생성"""
+        try:
+            process = Process(action="react", query=match_events)
+            result = await self.__graph.ainvoke_turn(input={"process": process}, config=self.__config)
+            return self.__response_from(result)
+
+        except AgentException:
+            raise
+        except Exception as e:
+            logging.error(f"Match reaction failed: {e}")
+            return Response(speech="오류가 발생했습니다.", emotion="당황")
+
+    @staticmethod
+    def __response_from(result: Dict[str, Any]) -> Response:
+        """그래프 실행 결과의 마지막 메시지에서 응답 추출"""
+        if result["messages"]:
+            last_message = result["messages"][-1]
+            if isinstance(last_message, AIMessage):
+                try:
+                    response_data = json.loads(last_message.content)
+                    return Response(
+                        speech=response_data.get("speech", "응답을 생성할 수 없습니다."),
+                        emotion=response_data.get("emotion", "당황")
+                    )
+                except json.JSONDecodeError:
+                    return Response(speech=last_message.content, emotion="보통")
+
+        # 기본 응답
+        return Response(speech="응답을 생성할 수 없습니다.", emotion="당황")
+
     def analyze_game_state(self, opponent_actions: str) -> str:
+        """게임 상태 분석 (동기 호출용 - 실행 중인 이벤트 루프 밖에서만 사용)"""
+        return asyncio.run(self.aanalyze_game_state(opponent_actions))
+
+    async def aanalyze_game_state(self, opponent_actions: str) -> str:
         """게임 상태 분석"""
         try:
-            # 현재 상태 가져오기
-            current_state = self.__get_current_state()
-
-            # Process 설정하여 상태 생성
+            # Process만 입력 - 대화 기록은 체크포인터에서 이어짐
             process = Process(action="analysis", query=opponent_actions)
-            state = ProcessState(
-                process=process,
-                messages=current_state.get("messages", []),
-                initialized=current_state.get("initialized", True)  # 이미 초기화됨
-            )
-
-            result = self.__graph.invoke(input=state, config=self.__config)
+            result = await self.__graph.ainvoke_turn(input={"process": process}, config=self.__config)
 
             # 마지막 메시지에서 분석 결과 추출
             if result["messages"]:
@@ -259,6 +548,8 @@ class Agent:
 
             return "분석을 수행할 수 없습니다."
 
+        except AgentException:
+            raise
         except Exception as e:
             logging.error(f"Game state analysis failed: {e}")
             return "분석 중 오류가 발생했습니다."
@@ -266,23 +557,27 @@ class Agent:
     def __get_current_state(self) -> dict:
         """현재 대화 상태 가져오기"""
         try:
-            # 메모리에서 현재 상태 조회
-            snapshot = self.__memory.get(self.__config)
-            if snapshot:
-                return snapshot
-            else:
-                return {"messages": [], "initialized": True}
+            snapshot = self.__graph.compiled.get_state(self.__config)
+            return snapshot.values or {"messages": [], "initialized": True}
         except Exception as e:
             logging.warning(f"Failed to get current state: {e}")
             return {"messages": [], "initialized": True}
 
     def reset_conversation(self):
+        """대화 기록 초기화 (동기 호출용 - 실행 중인 이벤트 루프 밖에서만 사용)"""
+        asyncio.run(self.areset_conversation())
+
+    async def areset_conversation(self):
         """대화 기록 초기화"""
         try:
-            # 새로운 thread_id 생성
-            self.__config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+            # 기존 기록을 지우고 새로운 thread_id 생성
+            self.__graph.delete_thread(self.__thread_id)
+            self.__thread_id = str(uuid.uuid4())
+            self.__config = AgentGraph.make_config(
+                self.__thread_id, self.__concept, self.__opponent_concept, self.__language
+            )
             # 에이전트 재초기화
-            self._initialize_agent()
+            await self.ainitialize()
             logging.info("Conversation reset successfully")
         except Exception as e:
             logging.error(f"Failed to reset conversation: {e}")
@@ -297,18 +592,30 @@ class Agent:
             logging.warning(f"Failed to get conversation history: {e}")
             return []
 
+    def close(self):
+        """세션 종료 - 공유 체크포인터에서 이 세션의 기록 삭제"""
+        try:
+            self.__graph.delete_thread(self.__thread_id)
+        except Exception as e:
+            logging.warning(f"Failed to delete conversation: {e}")
+
     def display_mermaid_image(self):
         """Mermaid 다이어그램 표시 (개발용)"""
         try:
             import io
             from PIL import Image
-            img_bytes = io.BytesIO(self.__graph.get_graph().draw_mermaid_png())
+            img_bytes = io.BytesIO(self.__graph.compiled.get_graph().draw_mermaid_png())
             Image.open(img_bytes).show()
         except ImportError:
             print("PIL이 설치되지 않아 다이어그램을 표시할 수 없습니다.")
         except Exception as e:
             print(f"다이어그램 표시 실패: {e}")
 
+    @property
+    def thread_id(self) -> str:
+        """체크포인터에서 이 세션을 구분하는 thread_id"""
+        return self.__thread_id
+
     @property
     def concept(self) -> Concept:
         """현재 캐릭터 컨셉 반환"""
@@ -0,0 +1,169 @@
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class LatestCheckpointSaver(InMemorySaver):
+    """스레드(세션)마다 최신 체크포인트 하나만 유지하는 메모리 체크포인터
+
+    기본 MemorySaver는 그래프 단계마다 전체 메시지 목록을 담은 체크포인트를 모두 보관하므로
+    세션 메모리가 턴 수의 제곱에 비례해 늘어난다. 이 체크포인터는 새 체크포인트를 저장할 때
+    이전 체크포인트와 그 pending write, 더 이상 참조되지 않는 채널 값을 함께 지워
+    세션 메모리를 현재 대화 크기에 비례하도록 유지한다.
+    체크포인트 이력 조회와 Send로 예약된 작업(부모 체크포인트의 write)은 지원하지 않는다.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # thread ID -> checkpoint NS -> 채널 -> 현재 저장된 값의 버전
+        self._channel_versions: Dict[str, Dict[str, Dict[str, Union[str, int, float]]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+
+    def put(
+            self,
+            config: RunnableConfig,
+            checkpoint: Checkpoint,
+            metadata: CheckpointMetadata,
+            new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+
+        # 이전 체크포인트와 그에 딸린 pending write 삭제
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        for checkpoint_id in [cid for cid in checkpoints if cid != checkpoint["id"]]:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        # 새 버전으로 교체된 채널의 이전 값 삭제
+        versions = self._channel_versions[thread_id][checkpoint_ns]
+        for channel, version in new_versions.items():
+            previous = versions.get(channel)
+            if previous is not None and previous != version:
+                self.blobs.pop((thread_id, checkpoint_ns, channel, previous), None)
+            versions[channel] = version
+
+        return next_config
+
+    def put_writes(
+            self,
+            config: RunnableConfig,
+            writes: Sequence[Tuple[str, Any]],
+            task_id: str,
+            task_path: str = ""
+    ) -> None:
+        # 이미 다음 체크포인트로 대체된 체크포인트의 write는 저장하지 않음 (비동기 저장 순서 역전 대비)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoints = self.storage.get(thread_id, {}).get(checkpoint_ns, {})
+        if config["configurable"]["checkpoint_id"] not in checkpoints:
+            return
+        super().put_writes(config, writes, task_id, task_path)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        result = super().get_tuple(config)
+        thread_id = config["configurable"]["thread_id"]
+
+        # 기본 구현이 defaultdict 조회로 만들어 둔 빈 항목 정리
+        if result is None:
+            if not any(self.storage.get(thread_id, {}).values()):
+                self.storage.pop(thread_id, None)
+        elif result.parent_config is not None:
+            parent = result.parent_config["configurable"]
+            key = (thread_id, parent["checkpoint_ns"], parent["checkpoint_id"])
+            if not self.writes.get(key):
+                self.writes.pop(key, None)
+        return result
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트, pending write, 채널 값 삭제 (전체 저장소를 훑지 않음)"""
+        self._drop_thread(thread_id)
+
+    def _drop_thread(self, thread_id: str) -> None:
+        """메모리에서 스레드 제거 (하위 클래스가 영속 저장소의 내용은 유지한 채 메모리만 비울 때도 사용)"""
+        namespaces = self.storage.pop(thread_id, {})
+        for checkpoint_ns, checkpoints in namespaces.items():
+            for checkpoint_id in checkpoints:
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        for checkpoint_ns, versions in self._channel_versions.pop(thread_id, {}).items():
+            for channel, version in versions.items():
+                self.blobs.pop((thread_id, checkpoint_ns, channel, version), None)
+
+    def thread_size(self, thread_id: str) -> int:
+        """스레드가 메모리에서 차지하는 직렬화된 바이트 수 (체크포인트 + 채널 값, 근사치)"""
+        size = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for checkpoint, metadata, _ in checkpoints.values():
+                size += len(checkpoint[1]) + len(metadata[1])
+        for checkpoint_ns, versions in self._channel_versions.get(thread_id, {}).items():
+            for channel, version in versions.items():
+                blob = self.blobs.get((thread_id, checkpoint_ns, channel, version))
+                if blob is not None:
+                    size += len(blob[1])
+        return size
+
+    def export_thread(self, thread_id: str) -> Dict[str, Any]:
+        """스레드의 최신 체크포인트와 채널 값을 직렬화된 상태 그대로 반환 (pending write 제외)
+
+        반환값은 serde로 직렬화할 수 있는 dict/list/bytes로만 이루어져 있어 import_thread로 복원할 수 있다.
+        """
+        exported = {}
+        for checkpoint_ns, checkpoints in self.storage.get(thread_id, {}).items():
+            if not checkpoints:
+                continue
+            checkpoint_id, (checkpoint, metadata, parent) = next(reversed(checkpoints.items()))
+            versions = self._channel_versions.get(thread_id, {}).get(checkpoint_ns, {})
+            exported[checkpoint_ns] = {
+                "checkpoint_id": checkpoint_id,
+                "checkpoint": list(checkpoint),
+                "metadata": list(metadata),
+                "parent": parent,
+                "channels": {
+                    channel: [version, *self.blobs[(thread_id, checkpoint_ns, channel, version)]]
+                    for channel, version in versions.items()
+                    if (thread_id, checkpoint_ns, channel, version) in self.blobs
+                }
+            }
+        return exported
+
+    def import_thread(self, thread_id: str, exported: Dict[str, Any]) -> None:
+        """export_thread 결과로 스레드 복원 (기존 내용은 대체)"""
+        self._drop_thread(thread_id)
+        for checkpoint_ns, saved in exported.items():
+            self.storage[thread_id][checkpoint_ns][saved["checkpoint_id"]] = (
+                tuple(saved["checkpoint"]), tuple(saved["metadata"]), saved["parent"]
+            )
+            versions = self._channel_versions[thread_id][checkpoint_ns]
+            for channel, (version, type_, value) in saved["channels"].items():
+                self.blobs[(thread_id, checkpoint_ns, channel, version)] = (type_, value)
+                versions[channel] = version
+
+    def rollback_thread(self, thread_id: str, exported: Dict[str, Any]) -> None:
+        """export_thread로 받아 둔 상태로 스레드를 되돌림 (중단된 턴이 남긴 체크포인트 제거)"""
+        if exported:
+            self.import_thread(thread_id, exported)
+        else:
+            self._drop_thread(thread_id)
+
+    def snapshot_thread(self, thread_id: str) -> bytes:
+        """스레드를 압축된 blob으로 만듦 (메모리의 내용은 유지)"""
+        type_, data = self.serde.dumps_typed(self.export_thread(thread_id))
+        return zlib.compress(type_.encode() + b"\n" + data)
+
+    def hibernate_thread(self, thread_id: str) -> bytes:
+        """스레드를 압축된 blob으로 만들고 메모리에서 제거"""
+        blob = self.snapshot_thread(thread_id)
+        self._drop_thread(thread_id)
+        return blob
+
+    def rehydrate_thread(self, thread_id: str, blob: bytes) -> None:
+        """hibernate_thread/snapshot_thread로 만든 blob에서 스레드 복원"""
+        type_, data = zlib.decompress(blob).split(b"\n", 1)
+        self.import_thread(thread_id, self.serde.loads_typed((type_.decode(), data)))
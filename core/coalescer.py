@@ -0,0 +1,69 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Batch(Generic[T]):
+    __slots__ = ("items", "task", "waiters")
+
+    def __init__(self):
+        self.items: List[str] = []
+        self.task: Optional["asyncio.Future[T]"] = None
+        self.waiters = 0
+
+
+class Coalescer(Generic[T]):
+    """세션별로 짧은 시간 안에 들어온 요청을 하나로 합쳐 한 번만 실행하고 결과를 모든 호출자에게 돌려줌
+
+    세션에 열린 묶음이 없으면 새 묶음을 열고 window초 동안 기다린 뒤 실행을 시작한다.
+    묶음은 run이 take()를 호출해 항목을 가져갈 때 닫히므로, 같은 세션의 앞선 작업이 실행 중이라
+    차례를 기다리는 동안 들어온 요청도 같은 묶음에 합쳐진다. 호출자가 모두 떠나면 묶음의 실행도 취소된다.
+    """
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._open: Dict[str, _Batch[T]] = {}
+        self.requests = 0
+        self.runs = 0
+
+    async def submit(self, key: str, item: str, run: Callable[[Callable[[], List[str]]], Awaitable[T]]) -> T:
+        """항목을 key의 열린 묶음에 넣고 묶음의 실행 결과를 기다림 (run은 묶음마다 한 번만 호출됨)"""
+        self.requests += 1
+        batch = self._open.get(key)
+        if batch is None:
+            batch = self._open[key] = _Batch()
+            batch.task = asyncio.ensure_future(self._drive(key, batch, run))
+        batch.items.append(item)
+        batch.waiters += 1
+        try:
+            return await asyncio.shield(batch.task)
+        except asyncio.CancelledError:
+            batch.waiters -= 1
+            if not batch.waiters and not batch.task.done():
+                # 결과를 기다리는 호출자가 없으면 실행하지 않음 (새 요청이 취소될 묶음에 합쳐지지 않도록 바로 닫음)
+                self._close(key, batch)
+                batch.task.cancel()
+            raise
+
+    def _close(self, key: str, batch: _Batch[T]):
+        if self._open.get(key) is batch:
+            del self._open[key]
+
+    async def _drive(self, key: str, batch: _Batch[T], run: Callable[[Callable[[], List[str]]], Awaitable[T]]) -> T:
+        def take() -> List[str]:
+            self._close(key, batch)
+            return list(batch.items)
+
+        try:
+            if self.window > 0:
+                await asyncio.sleep(self.window)
+            self.runs += 1
+            return await run(take)
+        finally:
+            self._close(key, batch)
+
+    @property
+    def pending(self) -> int:
+        """실행을 기다리며 요청을 받고 있는 묶음 수"""
+        return len(self._open)
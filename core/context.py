@@ -0,0 +1,54 @@
+from typing import List, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+from pydantic import BaseModel, Field
+
+
+class ContextPolicy(BaseModel):
+    """LLM에 보낼 대화 범위 정책
+
+    캐릭터 시트와 초기화 대화는 항상 보내고, 그 뒤의 대화는 최근 recent_turns 턴을
+    max_tokens 예산 안에서만 원문으로 보낸다. 범위 밖으로 밀려난 대화는 요약으로 대체한다.
+    """
+    recent_turns: int = Field(default=10, description="원문으로 보내는 최근 턴 수 (턴 = 메시지 2개)")
+    max_tokens: int = Field(default=4000, description="최근 대화에 쓸 추정 토큰 예산")
+    chars_per_token: float = Field(default=2.0, description="토큰 수 추정에 쓰는 토큰당 평균 글자 수")
+
+
+def estimate_tokens(messages: Sequence[BaseMessage], chars_per_token: float) -> int:
+    """글자 수 기반 토큰 수 추정 (LLM 토크나이저 호출 없이)"""
+    return sum(int(len(str(message.content)) / chars_per_token) + 4 for message in messages)
+
+
+def select_recent_start(dialogue: Sequence[BaseMessage], policy: ContextPolicy) -> int:
+    """dialogue 중 원문으로 보낼 구간의 시작 위치 반환"""
+    start = len(dialogue)
+    budget = policy.max_tokens
+    limit = max(len(dialogue) - policy.recent_turns * 2, 0)
+
+    while start > limit:
+        cost = estimate_tokens(dialogue[start - 1:start], policy.chars_per_token)
+        # 마지막 메시지(이번 턴 입력)는 예산과 무관하게 항상 포함
+        if cost > budget and start < len(dialogue):
+            break
+        budget -= cost
+        start -= 1
+
+    # 응답 메시지로 시작하지 않도록 경계를 뒤로 맞춤
+    while start < len(dialogue) - 1 and isinstance(dialogue[start], AIMessage):
+        start += 1
+    return start
+
+
+def build_context(
+        prefix: Sequence[BaseMessage],
+        summary: str,
+        dialogue: Sequence[BaseMessage],
+        start: int
+) -> List[BaseMessage]:
+    """초기화 대화 + 요약 + 최근 대화로 LLM 입력 기록 구성"""
+    messages = list(prefix)
+    if summary and start > 0:
+        messages.append(SystemMessage(content=f"이전 대화 요약: {summary}"))
+    messages.extend(dialogue[start:])
+    return messages
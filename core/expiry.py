@@ -0,0 +1,119 @@
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+TimerKey = Tuple[str, str]  # (session_id, 종류)
+
+
+class ExpiryScheduler:
+    """time.monotonic() 기준으로 세션별 만기 작업을 실행하는 heap 스케줄러 (asyncio 태스크)
+
+    만기 시각은 (session_id, 종류)마다 하나씩 dict에 기록하고, heap에는 그보다 이르거나 같은
+    항목만 넣어 둔다. 활동으로 만기가 늦춰질 때는 dict만 갱신하고, heap 항목이 꺼내질 때
+    실제 만기 시각이 남아 있으면 그 시각으로 다시 넣는다. 따라서 활동 기록은 O(1)이고
+    전체 세션을 훑는 작업은 없다.
+
+    on_expire(session_id, 종류)는 이벤트 루프에서 호출되며, 새 만기 시각을 반환하면 다시 예약한다.
+    """
+
+    def __init__(self, on_expire: Callable[[str, str], Optional[float]]):
+        self._on_expire = on_expire
+        self._lock = threading.Lock()
+        self._deadlines: Dict[TimerKey, float] = {}
+        self._queued: Dict[TimerKey, float] = {}  # heap에 들어 있는 가장 이른 항목
+        self._heap: List[Tuple[float, TimerKey]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    def start(self):
+        """현재 이벤트 루프에서 스케줄러 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    def stop(self):
+        """스케줄러 태스크 중지 (다른 스레드에서도 호출 가능)"""
+        if self._task is not None:
+            self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+            self._task = None
+
+    def schedule(self, session_id: str, kind: str, deadline: float):
+        """만기 시각 설정 (기존 값은 대체) - deadline은 time.monotonic() 기준"""
+        key = (session_id, kind)
+        with self._lock:
+            self._deadlines[key] = deadline
+            queued = self._queued.get(key)
+            if queued is not None and queued <= deadline:
+                return  # 더 이른 heap 항목이 꺼내질 때 다시 확인
+            self._queued[key] = deadline
+            heapq.heappush(self._heap, (deadline, key))
+            earliest = self._heap[0][1] == key
+        if earliest:
+            self._wake()
+
+    def cancel(self, session_id: str, *kinds: str):
+        """세션의 지정한 종류 만기 작업 취소 (heap 항목은 꺼내질 때 버려짐)"""
+        with self._lock:
+            for kind in kinds:
+                self._deadlines.pop((session_id, kind), None)
+
+    def deadline(self, session_id: str, kind: str) -> Optional[float]:
+        with self._lock:
+            return self._deadlines.get((session_id, kind))
+
+    def _wake(self):
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _pop_due(self, now: float) -> List[TimerKey]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                queued, key = heapq.heappop(self._heap)
+                if self._queued.get(key) == queued:
+                    del self._queued[key]
+                deadline = self._deadlines.get(key)
+                if deadline is None or key in self._queued:
+                    continue  # 취소되었거나 다른 heap 항목이 남아 있음
+                if deadline > now:
+                    # 활동으로 늦춰진 만기 - 실제 시각으로 다시 넣음
+                    self._queued[key] = deadline
+                    heapq.heappush(self._heap, (deadline, key))
+                    continue
+                del self._deadlines[key]
+                due.append(key)
+        return due
+
+    async def _run(self):
+        while True:
+            # 대기 전에 먼저 clear해야 그 사이에 들어온 더 이른 예약을 놓치지 않음
+            self._wakeup.clear()
+            with self._lock:
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            for session_id, kind in self._pop_due(time.monotonic()):
+                self.fired += 1
+                try:
+                    rearm = self._on_expire(session_id, kind)
+                except Exception as e:
+                    logging.error(f"Expiry handler failed for {session_id} ({kind}): {e}")
+                    continue
+                if rearm is not None:
+                    self.schedule(session_id, kind, rearm)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._deadlines)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, TypeVar
+
+from .agent import AgentException
+
+T = TypeVar("T")
+
+
+class LLMOverloadedException(AgentException):
+    """LLM 호출 대기열이 가득 찼거나 대기 시간이 초과되었을 때 발생"""
+    pass
+
+
+class LLMLimiter:
+    """LLM 동시 호출 수 제한 - 최대 max_concurrent개를 실행하고 나머지는 제한된 대기열에서 FIFO로 대기
+
+    대기열이 가득 차면 기다리지 않고 바로 LLMOverloadedException을 던지고,
+    queue_timeout초 안에 차례가 오지 않은 호출도 같은 예외로 포기한다.
+    하나의 이벤트 루프에서만 사용한다.
+    """
+
+    def __init__(self, max_concurrent: int = 16, max_queue: int = 64, queue_timeout: float = 10.0):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_queue < 0 or queue_timeout <= 0:
+            raise ValueError("max_queue must be >= 0 and queue_timeout must be > 0")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # 메트릭
+        self.admitted = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def _acquire(self):
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise LLMOverloadedException(
+                f"LLM is overloaded ({self._in_flight} in flight, {len(self._waiters)} queued)"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            # 시간 초과와 동시에 자리를 넘겨받았으면 그대로 사용
+            if not waiter.done() or waiter.cancelled():
+                self._waiters.remove(waiter)
+                waiter.cancel()
+                self.timeouts += 1
+                raise LLMOverloadedException(f"LLM queue wait exceeded {self.queue_timeout}s")
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 자리를 넘겨받은 뒤 취소되었으면 다음 대기자에게 넘김
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+                waiter.cancel()
+            raise
+
+        waited = time.monotonic() - started
+        self._wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        self.admitted += 1
+
+    def _release(self):
+        # 자리를 줄이지 않고 다음 대기자에게 바로 넘김 (새로 도착한 호출이 끼어들지 않음)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        """차례가 되면 work를 실행하여 결과 반환"""
+        await self._acquire()
+        try:
+            return await work()
+        finally:
+            self._release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """동시 실행/대기 수, 누적 거절·시간 초과 수와 대기 시간"""
+        return {
+            "llm_in_flight": self._in_flight,
+            "llm_queue_depth": len(self._waiters),
+            "llm_max_concurrent": self.max_concurrent,
+            "llm_max_queue": self.max_queue,
+            "llm_admitted": self.admitted,
+            "llm_rejected": self.rejected,
+            "llm_queue_timeouts": self.timeouts,
+            "avg_llm_wait_ms": self._wait_seconds * 1000 / self.admitted if self.admitted else 0.0,
+            "max_llm_wait_ms": self._max_wait_seconds * 1000
+        }
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from .agent import AgentException
+
+T = TypeVar("T")
+
+
+class SessionBusyException(AgentException):
+    """세션의 대기 작업이 한도를 넘었을 때 발생"""
+    pass
+
+
+class SessionMailbox:
+    """세션 단위 작업 큐 - 같은 세션의 턴은 도착 순서대로 하나씩, 다른 세션과는 동시에 실행"""
+
+    def __init__(self, session_id: str, max_pending: int = 8):
+        self.session_id = session_id
+        self.max_pending = max_pending
+        # asyncio.Lock은 대기자를 FIFO로 깨우므로 제출 순서가 곧 실행 순서
+        self._lock = asyncio.Lock()
+        self._pending = 0
+
+    @property
+    def depth(self) -> int:
+        """실행 중인 작업을 포함한 대기 작업 수"""
+        return self._pending
+
+    async def submit(self, work: Callable[[], Awaitable[T]]) -> T:
+        """작업을 큐에 넣고 차례가 되면 실행하여 결과 반환"""
+        if self._pending >= self.max_pending:
+            raise SessionBusyException(
+                f"Session {self.session_id} has too many pending requests ({self._pending})"
+            )
+
+        self._pending += 1
+        try:
+            async with self._lock:
+                return await work()
+        finally:
+            self._pending -= 1
@@ -0,0 +1,256 @@
+import time
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class MatchEventType(str, Enum):
+    """매치 이벤트 종류"""
+    HIT = "HIT"
+    BLOCK = "BLOCK"
+    COMBO = "COMBO"
+    HP_CHANGE = "HP_CHANGE"
+    ROUND_START = "ROUND_START"
+    ROUND_END = "ROUND_END"
+    KO = "KO"
+
+
+class MatchEvent(BaseModel):
+    """게임에서 보낸 매치 이벤트 하나 - by_opponent는 행동한 쪽(HIT, COMBO), 가드한 쪽(BLOCK),
+    체력이 바뀐 쪽(HP_CHANGE), 이긴 쪽(ROUND_END, KO)이 상대방인지 여부"""
+    type: MatchEventType
+    by_opponent: bool = False
+    move: str = ""
+    special: bool = False
+    damage: int = 0
+    combo_hits: int = 0
+    hp: int = 0
+    max_hp: int = 0
+    round: int = 0
+
+
+class MatchAction(str, Enum):
+    """이벤트로 생성할 출력"""
+    SPEECH = "SPEECH"      # 캐릭터의 반응 대사
+    ANALYSIS = "ANALYSIS"  # 게임 상태 분석
+
+
+class MatchTrigger(BaseModel):
+    """정책이 생성을 결정한 출력 - summary는 지난 출력 이후 쌓인 이벤트 요약"""
+    action: MatchAction
+    event_type: MatchEventType = Field(description="생성을 일으킨 이벤트 종류")
+    summary: str
+    events: int = Field(description="요약에 반영된 이벤트 수")
+
+
+_CRITICAL = (MatchEventType.ROUND_START, MatchEventType.ROUND_END, MatchEventType.KO)
+
+
+def _rank(action: MatchAction, critical: bool) -> int:
+    if action == MatchAction.ANALYSIS:
+        return 0
+    return 2 if critical else 1
+
+
+def _side(by_opponent: bool) -> str:
+    return "상대" if by_opponent else "나"
+
+
+class _MatchState:
+    """세션 하나의 이벤트 누적 상태 - 적중/가드는 횟수와 피해량만 세고, 주요 이벤트만 문장으로 남김"""
+
+    __slots__ = ("round", "events", "hits", "damage", "blocks", "hp", "notes", "dropped_notes", "low_hp_sides",
+                 "last_speech", "last_analysis", "busy", "deferred")
+
+    def __init__(self):
+        self.round = 0
+        self.events = 0
+        self.hits = {False: 0, True: 0}
+        self.damage = {False: 0, True: 0}
+        self.blocks = {False: 0, True: 0}
+        self.hp: Dict[bool, Tuple[int, int]] = {}
+        self.notes: List[str] = []
+        self.dropped_notes = 0
+        self.low_hp_sides = set()
+        self.last_speech = float("-inf")
+        self.last_analysis = float("-inf")
+        self.busy = False
+        self.deferred: Optional[Tuple[MatchAction, MatchEventType, bool]] = None
+
+    def note(self, text: str, max_notes: int):
+        if len(self.notes) >= max_notes:
+            self.notes.pop(0)
+            self.dropped_notes += 1
+        self.notes.append(text)
+
+    def take_summary(self) -> Tuple[str, int]:
+        """지난 출력 이후의 이벤트 요약과 이벤트 수를 꺼내고 누적값을 비움 (라운드와 체력은 유지)"""
+        lines = [f"[라운드 {self.round}]"] if self.round else []
+        for side in (False, True):
+            parts = []
+            if self.hits[side]:
+                parts.append(f"적중 {self.hits[side]}회 (피해 {self.damage[side]})")
+            if self.blocks[side]:
+                parts.append(f"가드 {self.blocks[side]}회")
+            if parts:
+                lines.append(f"{_side(side)}: {', '.join(parts)}")
+        if self.dropped_notes:
+            lines.append(f"(앞선 주요 이벤트 {self.dropped_notes}건 생략)")
+        lines.extend(self.notes)
+        for side, (hp, max_hp) in sorted(self.hp.items()):
+            lines.append(f"{_side(side)} 체력 {hp}/{max_hp}" if max_hp else f"{_side(side)} 체력 {hp}")
+
+        events = self.events
+        self.events = 0
+        self.hits = {False: 0, True: 0}
+        self.damage = {False: 0, True: 0}
+        self.blocks = {False: 0, True: 0}
+        self.notes = []
+        self.dropped_notes = 0
+        return "\n".join(lines), events
+
+
+class MatchPolicy:
+    """매치 이벤트마다 대사나 분석을 생성할지 정하는 세션별 정책
+
+    - ROUND_START, ROUND_END, KO: critical_interval초(짧은 최소 간격)에 한 번까지 대사
+    - combo_hits 이상 콤보, 필살기 적중, 체력이 low_hp_ratio 이하로 처음 떨어짐: speech_interval초에 한 번까지 대사
+    - 그 밖의 이벤트: analysis_after_events개 이상 쌓이고 analysis_interval초가 지났으면 분석
+    생성하지 않은 이벤트는 요약에 쌓였다가 다음 출력에 함께 반영된다. 세션마다 출력은 한 번에 하나만 생성하며,
+    생성 중에 결정된 출력은 하나로 합쳐 두었다가 finish 때 돌려준다. 하나의 이벤트 루프에서만 사용한다.
+    """
+
+    def __init__(
+            self,
+            speech_interval: float = 3.0,
+            critical_interval: float = 1.0,
+            analysis_interval: float = 10.0,
+            analysis_after_events: int = 30,
+            combo_hits: int = 4,
+            low_hp_ratio: float = 0.3,
+            max_notes: int = 20
+    ):
+        self.speech_interval = speech_interval
+        self.critical_interval = critical_interval
+        self.analysis_interval = analysis_interval
+        self.analysis_after_events = analysis_after_events
+        self.combo_hits = combo_hits
+        self.low_hp_ratio = low_hp_ratio
+        self.max_notes = max_notes
+        self._states: Dict[str, _MatchState] = {}
+
+    def observe(self, session_id: str, event: MatchEvent, now: Optional[float] = None) -> Optional[MatchTrigger]:
+        """이벤트를 누적하고, 지금 생성할 출력이 있으면 반환 (세션의 출력이 생성 중이면 미뤄 둠)"""
+        now = time.monotonic() if now is None else now
+        state = self._states.setdefault(session_id, _MatchState())
+        notable = self.__record(state, event)
+
+        decision = self.__decide(state, event, notable, now)
+        if decision is None:
+            return None
+        action, critical = decision
+        if state.busy:
+            # 주요 이벤트 대사 > 대사 > 분석 순으로 하나만 남김
+            if state.deferred is None or _rank(action, critical) > _rank(state.deferred[0], state.deferred[2]):
+                state.deferred = (action, event.type, critical)
+            return None
+        return self.__fire(state, action, event.type, now)
+
+    def finish(self, session_id: str, now: Optional[float] = None) -> Optional[MatchTrigger]:
+        """세션의 출력 생성이 끝남 - 그동안 미뤄 둔 출력이 아직 유효하면 반환"""
+        state = self._states.get(session_id)
+        if state is None:
+            return None
+        now = time.monotonic() if now is None else now
+        state.busy = False
+        deferred, state.deferred = state.deferred, None
+        if deferred is None:
+            return None
+        action, event_type, critical = deferred
+        if not self.__interval_passed(state, action, now, critical):
+            return None
+        return self.__fire(state, action, event_type, now)
+
+    def forget(self, session_id: str):
+        """세션의 누적 상태 제거"""
+        self._states.pop(session_id, None)
+
+    def __record(self, state: _MatchState, event: MatchEvent) -> bool:
+        """이벤트를 누적 상태에 반영 - 대사를 낼 만한 주요 이벤트인지 반환"""
+        state.events += 1
+        side = _side(event.by_opponent)
+        move = f" ({event.move})" if event.move else ""
+        if event.round:
+            state.round = event.round
+
+        if event.type == MatchEventType.HIT:
+            state.hits[event.by_opponent] += 1
+            state.damage[event.by_opponent] += event.damage
+            if event.special:
+                state.note(f"{side}의 필살기 적중{move}, 피해 {event.damage}", self.max_notes)
+                return True
+
+        elif event.type == MatchEventType.BLOCK:
+            state.blocks[event.by_opponent] += 1
+
+        elif event.type == MatchEventType.COMBO:
+            state.hits[event.by_opponent] += event.combo_hits
+            state.damage[event.by_opponent] += event.damage
+            if event.special or event.combo_hits >= self.combo_hits:
+                special = " 필살기" if event.special else ""
+                state.note(f"{side}의 {event.combo_hits}히트{special} 콤보{move}, 피해 {event.damage}", self.max_notes)
+                return True
+
+        elif event.type == MatchEventType.HP_CHANGE:
+            state.hp[event.by_opponent] = (event.hp, event.max_hp)
+            low = event.max_hp > 0 and event.hp <= event.max_hp * self.low_hp_ratio
+            if low and event.by_opponent not in state.low_hp_sides:
+                state.low_hp_sides.add(event.by_opponent)
+                state.note(f"{side}의 체력이 위험함 ({event.hp}/{event.max_hp})", self.max_notes)
+                return True
+
+        elif event.type == MatchEventType.ROUND_START:
+            state.low_hp_sides.clear()
+            state.hp.clear()
+            state.note(f"라운드 {state.round} 시작" if state.round else "라운드 시작", self.max_notes)
+
+        elif event.type == MatchEventType.ROUND_END:
+            state.note(f"라운드 {state.round} 종료 - {side}의 승리" if state.round else f"라운드 종료 - {side}의 승리",
+                       self.max_notes)
+
+        elif event.type == MatchEventType.KO:
+            state.note(f"{side}의 KO 승리{move}", self.max_notes)
+
+        return False
+
+    def __decide(self, state: _MatchState, event: MatchEvent, notable: bool,
+                 now: float) -> Optional[Tuple[MatchAction, bool]]:
+        """(생성할 출력, 주요 이벤트의 짧은 간격을 쓰는지) 또는 None
+
+        생성 중이면 주요 이벤트는 미뤄 두고 간격은 finish 때 확인한다.
+        간격 안에 들어와 버려진 이벤트도 요약에 남아 다음 출력에 반영된다.
+        """
+        if event.type in _CRITICAL:
+            if state.busy or self.__interval_passed(state, MatchAction.SPEECH, now, critical=True):
+                return MatchAction.SPEECH, True
+            return None
+        if notable and self.__interval_passed(state, MatchAction.SPEECH, now):
+            return MatchAction.SPEECH, False
+        if state.events >= self.analysis_after_events and self.__interval_passed(state, MatchAction.ANALYSIS, now):
+            return MatchAction.ANALYSIS, False
+        return None
+
+    def __interval_passed(self, state: _MatchState, action: MatchAction, now: float, critical: bool = False) -> bool:
+        if action == MatchAction.SPEECH:
+            return now - state.last_speech >= (self.critical_interval if critical else self.speech_interval)
+        return now - state.last_analysis >= self.analysis_interval
+
+    def __fire(self, state: _MatchState, action: MatchAction, event_type: MatchEventType, now: float) -> MatchTrigger:
+        summary, events = state.take_summary()
+        state.busy = True
+        if action == MatchAction.SPEECH:
+            state.last_speech = now
+        else:
+            state.last_analysis = now
+        return MatchTrigger(action=action, event_type=event_type, summary=summary, events=events)
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+
+from models.concept import Concept
+
+MatchupKey = Tuple[str, str, str, str]
+
+
+class MatchupCache:
+    """(캐릭터, 상대, 언어) 조합별 초기화 대화를 한 번만 생성하여 세션마다 복제해 주는 캐시
+
+    cache_dir를 지정하면 생성된 대화를 JSON 파일로도 저장하여 재시작 후에도 재사용한다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self._snapshots: Dict[MatchupKey, List[BaseMessage]] = {}
+        self._inflight: Dict[MatchupKey, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(concept: Concept, opponent_concept: Concept, language: str) -> MatchupKey:
+        """조합 키 생성 - 캐릭터 정의가 바뀌면 키도 바뀌도록 컨셉 내용의 해시를 포함"""
+        digest = hashlib.sha256(
+            (concept.model_dump_json() + opponent_concept.model_dump_json()).encode("utf-8")
+        ).hexdigest()[:16]
+        return concept.role, opponent_concept.role, language, digest
+
+    async def get_or_create(
+            self,
+            key: MatchupKey,
+            factory: Callable[[], Awaitable[List[BaseMessage]]]
+    ) -> List[BaseMessage]:
+        """캐시된 초기화 대화의 복사본 반환 - 없으면 factory로 한 번만 생성 (동시 요청은 결과를 공유)"""
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._load(key)
+                if snapshot is not None:
+                    self._snapshots[key] = snapshot
+
+            if snapshot is not None:
+                self.hits += 1
+                return self._fork(snapshot)
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+
+        if not owner:
+            return self._fork(await asyncio.shield(future))
+
+        try:
+            snapshot = await factory()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            # 대기 중인 다른 세션에도 실패를 전달하고, 다음 요청은 다시 생성을 시도
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # 대기자가 없어도 "never retrieved" 경고가 남지 않도록
+            else:
+                future.cancel()
+            raise
+
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._inflight.pop(key, None)
+        future.set_result(snapshot)
+        self._save(key, snapshot)
+        return self._fork(snapshot)
+
+    @staticmethod
+    def _fork(snapshot: List[BaseMessage]) -> List[BaseMessage]:
+        """세션별 복사본 - 캐시 원본은 절대 수정되지 않도록 메시지 단위로 복사"""
+        return [message.model_copy() for message in snapshot]
+
+    def _path(self, key: MatchupKey) -> str:
+        name = hashlib.sha256(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _load(self, key: MatchupKey) -> Optional[List[BaseMessage]]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return messages_from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Failed to load matchup snapshot {key}: {e}")
+            return None
+
+    def _save(self, key: MatchupKey, snapshot: List[BaseMessage]):
+        if not self.cache_dir:
+            return
+        try:
+            path = self._path(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(messages_to_dict(snapshot), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning(f"Failed to save matchup snapshot {key}: {e}")
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 파일은 유지)"""
+        with self._lock:
+            self._snapshots.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._snapshots)
@@ -0,0 +1,110 @@
+import json
+import threading
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
+
+from models.concept import Concept
+from models.response import Response
+
+
+ANALYSIS_INSTRUCTION = "상대방의 행동에 따른 상황을 분석하여 적절한 대답과 감정을 도출하라."
+
+SUMMARY_INSTRUCTION = ("너는 대전 격투 게임 캐릭터의 기억을 정리한다. 기존 요약과 이후 대화를 합쳐 "
+                       "상대방의 말과 행동, 캐릭터의 반응과 감정 변화를 간결하게 요약하라. 요약문만 출력하라.")
+
+
+def normalize_whitespace(text: str) -> str:
+    """여러 줄 문자열의 들여쓰기와 빈 줄 제거"""
+    return "\n".join(line.strip() for line in text.strip().splitlines() if line.strip())
+
+
+def assemble_prompt(history: Sequence[BaseMessage], *instructions: BaseMessage) -> List[BaseMessage]:
+    """LLM 호출 입력 조립 - 저장된 대화 기록 뒤에 이번 호출에만 쓰는 지시문을 붙임
+
+    지시문은 호출 시점에만 추가되고 체크포인트에는 남지 않으므로, 프롬프트 크기는
+    턴 수 x 지시문 크기가 아니라 실제 대화 길이에 비례한다.
+    """
+    return [*history, *instructions]
+
+
+def build_summary_prompt(previous_summary: str, messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    """롤링 요약 생성용 입력 - 기존 요약에 새로 밀려난 대화를 합침"""
+    transcript = "\n".join(f"{message.type}: {message.content}" for message in messages)
+    return [
+        SystemMessage(content=SUMMARY_INSTRUCTION),
+        HumanMessage(content=f"기존 요약: {previous_summary or '(없음)'}\n\n이후 대화:\n{transcript}")
+    ]
+
+
+class PromptRegistry:
+    """서버 시작 시 한 번만 만들어 두는 정적 프롬프트 모음
+
+    - 캐릭터 시트: 공백을 정리한 Concept JSON
+    - 언어별 채팅 지시문(SystemMessage), 분석 지시문, 캐릭터 소개 지시문
+    - 구조화 출력 runnable (llm.with_structured_output)
+
+    미리 등록하지 않은 언어는 처음 요청될 때 한 번 렌더링하여 보관한다.
+    """
+
+    def __init__(self, llm: BaseChatModel, characters: Mapping[str, Concept], languages: Iterable[str] = ()):
+        self.__lock = threading.Lock()
+        self.__character_sheets: Dict[str, str] = {
+            role: self.__render_character_sheet(concept) for role, concept in characters.items()
+        }
+        self.__format_instructions: str = PydanticOutputParser(pydantic_object=Response).get_format_instructions()
+        self.__chat_prompt_template = PromptTemplate(
+            template="Must answer in {language}. Wrap the output in `json` tags.\n{format_instruction}",
+            input_variables=["language"],
+            partial_variables={"format_instruction": self.__format_instructions}
+        )
+        self.__chat_prompt_messages: Dict[str, SystemMessage] = {}
+        self.__analysis_prompt_message = SystemMessage(content=json.dumps({"query": ANALYSIS_INSTRUCTION}))
+        self.__structured_llm: Runnable = llm.with_structured_output(schema=Response)
+
+        for language in languages:
+            self.chat_prompt_message(language)
+
+    @staticmethod
+    def __render_character_sheet(concept: Concept) -> str:
+        normalized = concept.model_copy(update={
+            "backstory": normalize_whitespace(concept.backstory),
+            "personality": normalize_whitespace(concept.personality)
+        })
+        return normalized.model_dump_json()
+
+    def character_sheet(self, concept: Concept) -> str:
+        """캐릭터 시트 반환 (등록되지 않은 캐릭터는 렌더링 후 보관)"""
+        sheet = self.__character_sheets.get(concept.role)
+        if sheet is None:
+            sheet = self.__render_character_sheet(concept)
+            with self.__lock:
+                self.__character_sheets[concept.role] = sheet
+        return sheet
+
+    def init_prompt(self, language: str, concept: Concept) -> str:
+        """캐릭터 소개 지시문"""
+        return (f"모든 대답은 다음 언어로 답하라. {language}. 너는 {concept.role}이다. 상대방과 너는 같은 존재일 수 있다. "
+                f"\n캐릭터 정보:{self.character_sheet(concept)}")
+
+    def chat_prompt_message(self, language: str) -> SystemMessage:
+        """언어별 채팅 응답 형식 지시문"""
+        message = self.__chat_prompt_messages.get(language)
+        if message is None:
+            message = SystemMessage(self.__chat_prompt_template.invoke(input={"language": language}).to_string())
+            with self.__lock:
+                self.__chat_prompt_messages[language] = message
+        return message
+
+    def analysis_prompt_message(self) -> SystemMessage:
+        """게임 상태 분석 지시문"""
+        return self.__analysis_prompt_message
+
+    @property
+    def structured_llm(self) -> Runnable:
+        """Response 스키마로 구조화된 출력을 내는 runnable"""
+        return self.__structured_llm
@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .agent import Agent
+
+
+class _SessionEntry:
+    __slots__ = ("agent", "last_activity")
+
+    def __init__(self, agent: Agent, last_activity: float):
+        self.agent = agent
+        self.last_activity = last_activity  # time.monotonic() 기준
+
+
+class SessionRegistry:
+    """세션 ID 해시로 나눈 stripe마다 락을 따로 두는 세션 레지스트리 (session_id -> Agent)
+
+    조회는 해당 stripe의 락만 잡으므로 서로 다른 세션의 요청이 하나의 전역 락에서 줄 서지 않는다.
+    마지막 활동 시각은 세션 항목 안의 float 하나로, 조회한 항목에 바로 기록하므로 락이 필요 없다.
+    등록·제거처럼 여러 목록을 함께 바꾸는 작업은 호출하는 쪽(SessionManager)의 락에서 수행한다.
+
+    dict처럼 쓸 수 있으며, 순회용 메서드(keys/values/items)는 stripe를 하나씩 잠그며 만든 스냅샷을 반환한다.
+    """
+
+    def __init__(self, stripes: int = 16):
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stripes: List[Dict[str, _SessionEntry]] = [{} for _ in range(stripes)]
+
+    def _index(self, session_id: str) -> int:
+        return hash(session_id) % len(self._stripes)
+
+    def lookup(self, session_id: str, touch: bool = False) -> Optional[Agent]:
+        """세션의 Agent 반환 (없으면 None) - touch면 마지막 활동 시각도 갱신"""
+        index = self._index(session_id)
+        with self._locks[index]:
+            entry = self._stripes[index].get(session_id)
+        if entry is None:
+            return None
+        if touch:
+            entry.last_activity = time.monotonic()
+        return entry.agent
+
+    def register(self, session_id: str, agent: Agent, last_activity: Optional[float] = None):
+        """세션 등록 (기존 항목은 대체) - last_activity는 time.monotonic() 기준, 없으면 현재"""
+        index = self._index(session_id)
+        entry = _SessionEntry(agent, time.monotonic() if last_activity is None else last_activity)
+        with self._locks[index]:
+            self._stripes[index][session_id] = entry
+
+    def touch(self, session_id: str):
+        """마지막 활동 시각 갱신 (없는 세션은 무시)"""
+        self.lookup(session_id, touch=True)
+
+    def last_activity(self, session_id: str) -> Optional[float]:
+        """마지막 활동 시각 (time.monotonic() 기준, 없으면 None)"""
+        index = self._index(session_id)
+        with self._locks[index]:
+            entry = self._stripes[index].get(session_id)
+        return entry.last_activity if entry is not None else None
+
+    def activity_items(self) -> List[Tuple[str, float]]:
+        """(session_id, 마지막 활동 시각) 스냅샷"""
+        items = []
+        for lock, stripe in zip(self._locks, self._stripes):
+            with lock:
+                items.extend((session_id, entry.last_activity) for session_id, entry in stripe.items())
+        return items
+
+    def get(self, session_id: str, default: Optional[Agent] = None) -> Optional[Agent]:
+        agent = self.lookup(session_id)
+        return default if agent is None else agent
+
+    def pop(self, session_id: str, default: Optional[Agent] = None) -> Optional[Agent]:
+        index = self._index(session_id)
+        with self._locks[index]:
+            entry = self._stripes[index].pop(session_id, None)
+        return default if entry is None else entry.agent
+
+    def items(self) -> List[Tuple[str, Agent]]:
+        items = []
+        for lock, stripe in zip(self._locks, self._stripes):
+            with lock:
+                items.extend((session_id, entry.agent) for session_id, entry in stripe.items())
+        return items
+
+    def keys(self) -> List[str]:
+        return [session_id for session_id, _ in self.items()]
+
+    def values(self) -> List[Agent]:
+        return [agent for _, agent in self.items()]
+
+    def clear(self):
+        for lock, stripe in zip(self._locks, self._stripes):
+            with lock:
+                stripe.clear()
+
+    def __getitem__(self, session_id: str) -> Agent:
+        agent = self.lookup(session_id)
+        if agent is None:
+            raise KeyError(session_id)
+        return agent
+
+    def __setitem__(self, session_id: str, agent: Agent):
+        self.register(session_id, agent)
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.lookup(session_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
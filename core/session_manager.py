@@ -1,171 +1,1039 @@
+import asyncio
 import logging
 import threading
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, Optional, List, Set, Tuple, TypeVar
 
 from langchain_core.language_models import BaseChatModel
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
-from .agent import Agent, AgentException
+from .agent import Agent, AgentException, AgentGraph, DeadlineExceededException, turn_deadline
+from .checkpoint import LatestCheckpointSaver
+from .coalescer import Coalescer
 from .concepts import CHARACTERS
+from .expiry import ExpiryScheduler
+from .limiter import LLMLimiter, LLMOverloadedException
+from .mailbox import SessionMailbox
+from .registry import SessionRegistry
+from .context import ContextPolicy
+from .matchup_cache import MatchupCache
+from .prompts import PromptRegistry
+from .session_store import SQLiteSessionStore
+
+T = TypeVar("T")
+
+
+class SessionState(str, Enum):
+    """세션 준비 상태"""
+    WARMING = "WARMING"  # 백그라운드에서 캐릭터 소개 진행 중
+    READY = "READY"
+    FAILED = "FAILED"
+
+
+class SessionEventType(str, Enum):
+    """세션이 사라질 때 구독자에게 보내는 이벤트 종류"""
+    EXPIRED_IDLE = "EXPIRED_IDLE"          # 유휴 TTL 만료
+    EXPIRED_ABSOLUTE = "EXPIRED_ABSOLUTE"  # 생성 후 최대 수명 만료
+    EVICTED = "EVICTED"                    # 세션 상한 때문에 제거
+    ENDED = "ENDED"                        # EndSession 등 명시적 제거
+
+
+class SessionDrainingException(AgentException):
+    """드레인 중이라 새 세션을 받지 않을 때 발생"""
+    pass
 
 
 class SessionManager:
     """Agent 세션을 관리하는 클래스"""
 
-    def __init__(self, llm: BaseChatModel, session_timeout_minutes: int = 60):
+    def __init__(
+            self,
+            llm: BaseChatModel,
+            session_timeout_minutes: float = 60,
+            max_pending_turns: int = 8,
+            matchup_cache: Optional[MatchupCache] = None,
+            prompts: Optional[PromptRegistry] = None,
+            context_policy: Optional[ContextPolicy] = None,
+            checkpointer: Optional[BaseCheckpointSaver] = None,
+            session_store: Optional[SQLiteSessionStore] = None,
+            hibernate_after_minutes: float = 0,
+            max_sessions: int = 0,
+            max_memory_mb: float = 0,
+            eviction_policy: str = "hibernate",
+            absolute_timeout_minutes: float = 0,
+            registry_stripes: int = 16,
+            llm_limiter: Optional[LLMLimiter] = None,
+            analysis_coalesce_seconds: float = 0.0
+    ):
+        """session_store를 주면 세션과 대화 기록을 SQLite에 영속화하고 체크포인터로도 사용한다.
+        메모리에 없는 세션은 조회될 때 저장소에서 다시 불러온다.
+
+        hibernate_after_minutes(0이면 끔) 동안 활동이 없는 세션은 압축된 blob으로 내려 두었다가
+        다음 조회 때 투명하게 복원한다. 체크포인터가 LatestCheckpointSaver 계열일 때만 동작한다.
+
+        메모리에 올라와 있는 세션 수가 max_sessions를 넘거나 세션 기록의 추정 크기 합이 max_memory_mb를
+        넘으면(0이면 제한 없음) 가장 오래 쓰이지 않은 세션부터 eviction_policy에 따라
+        휴면("hibernate")시키거나 제거("remove")한다.
+
+        세션 만료는 time.monotonic() 기준 heap 스케줄러(asyncio 태스크)가 처리한다. 유휴 TTL
+        (session_timeout_minutes)과 생성 후 최대 수명(absolute_timeout_minutes, 0이면 없음)은
+        create_session에서 세션마다 바꿀 수 있고, 만료·제거는 subscribe_events로 구독할 수 있다.
+
+        세션 조회(get_session, submit)는 registry_stripes개로 나눈 레지스트리에서 전역 락 없이 처리하고,
+        전역 락은 등록·제거·휴면·복원처럼 여러 목록을 함께 바꾸는 경우에만 잡는다.
+
+        llm_limiter를 주면 Agent 노드의 LLM 호출이 동시 호출 수 제한과 제한된 대기열을 거치고,
+        대기열이 가득 차거나 대기 시간이 초과되면 LLMOverloadedException이 호출자에게 전달된다.
+
+        analyze_game_state는 같은 세션의 분석 요청을 analysis_coalesce_seconds 동안 모으고, 앞선 턴이
+        실행 중인 동안 들어온 요청도 합쳐 상대 행동을 한 번에 분석한다."""
         self.llm = llm
-        self.sessions: Dict[str, Agent] = {}
-        self.session_timestamps: Dict[str, datetime] = {}
+        self.matchup_cache = matchup_cache if matchup_cache is not None else MatchupCache()
+        self.session_store = session_store
+        self.llm_limiter = llm_limiter
+        # 모든 세션이 하나의 그래프와 체크포인터를 공유 (세션은 thread_id로 구분)
+        self.agent_graph = AgentGraph(
+            llm=llm, matchup_cache=self.matchup_cache, prompts=prompts, context_policy=context_policy,
+            checkpointer=session_store if session_store is not None else checkpointer,
+            limiter=llm_limiter
+        )
+        # 세션 Agent와 마지막 활동 시각 (stripe별 락)
+        self.sessions = SessionRegistry(stripes=registry_stripes)
+        self.session_created_at: Dict[str, datetime] = {}
+        self.session_mailboxes: Dict[str, SessionMailbox] = {}
+        self.session_states: Dict[str, SessionState] = {}
+        self._warmup_tasks: Dict[str, asyncio.Task] = {}
+        self._warmup_errors: Dict[str, str] = {}
+        self._reserved_session_ids: Set[str] = set()  # 초기화 중인 세션 ID
         self.session_timeout = timedelta(minutes=session_timeout_minutes)
+        self.absolute_timeout = timedelta(minutes=absolute_timeout_minutes)
+        # 세션별 TTL 재정의 (session_id -> (유휴 TTL 초, 최대 수명 초), 0이면 기본값)
+        self._session_ttls: Dict[str, Tuple[float, float]] = {}
+        self.max_pending_turns = max_pending_turns
         self._lock = threading.RLock()
 
-        # 세션 정리를 위한 타이머 설정
-        self._cleanup_timer = None
-        self._start_cleanup_timer()
+        # 휴면 세션 (session_id -> 세션 정보 + 압축된 대화 기록, 저장소를 쓰면 blob은 None)
+        self._hibernated: Dict[str, Dict[str, Any]] = {}
+        self.hibernate_after = timedelta(minutes=hibernate_after_minutes)
+        self.hibernations = 0
+        self.rehydrations = 0
+        self._hibernate_seconds = 0.0
+        self._rehydrate_seconds = 0.0
+        self._can_hibernate = isinstance(self.agent_graph.checkpointer, LatestCheckpointSaver)
+        if hibernate_after_minutes > 0 and not self._can_hibernate:
+            logging.warning("Session hibernation requires LatestCheckpointSaver; hibernation disabled")
+            self.hibernate_after = timedelta(0)
+
+        # 세션 수/메모리 상한과 세션별 추정 크기 (session_id -> 바이트)
+        if eviction_policy not in ("hibernate", "remove"):
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        self.max_sessions = max_sessions
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.eviction_policy = eviction_policy if self._can_hibernate else "remove"
+        self.session_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._hibernated_bytes = 0
+        self.evictions = 0
+
+        # 만료/휴면 스케줄러와 세션 이벤트 구독자 (이벤트 루프에서 처음 쓰일 때 시작)
+        self._expiry = ExpiryScheduler(self._on_deadline)
+        self._store_sweep_task: Optional[asyncio.Task] = None
+        self._event_subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+        # 드레인 중이면 새 세션을 받지 않음 (배포 전 세션 내보내기)
+        self._draining = False
 
-    def _start_cleanup_timer(self):
-        """주기적으로 만료된 세션을 정리하는 타이머 시작"""
-        def cleanup():
-            self._cleanup_expired_sessions()
-            self._start_cleanup_timer()  # 다음 정리 스케줄링
+        # 호출자가 포기해 중단된 턴 수 (취소 / 마감 시각 초과)
+        self.cancelled_turns = 0
+        self.deadline_exceeded_turns = 0
 
-        if self._cleanup_timer:
-            self._cleanup_timer.cancel()
+        # 세션별 상대 행동 분석 요청 묶음
+        self._analysis_coalescer: Coalescer[str] = Coalescer(window=analysis_coalesce_seconds)
 
-        # 10분마다 정리 수행
-        self._cleanup_timer = threading.Timer(600.0, cleanup)
-        self._cleanup_timer.daemon = True
-        self._cleanup_timer.start()
+    def _ensure_background_tasks(self):
+        """만료 스케줄러와 저장소 정리 태스크를 현재 이벤트 루프에서 시작 (이미 실행 중이면 무시)"""
+        self._expiry.start()
+        if self.session_store is not None and (self._store_sweep_task is None or self._store_sweep_task.done()):
+            self._store_sweep_task = asyncio.get_running_loop().create_task(self._sweep_store())
 
-    def _cleanup_expired_sessions(self):
-        """만료된 세션들을 정리"""
+    def _schedule_expiry(self, session_id: str, idle_since: float, created_at: float):
+        """세션의 유휴/최대 수명/휴면 만기 예약 - 인자는 time.monotonic() 기준 시각 (락 안에서 호출)"""
+        idle_ttl, absolute_ttl = self._ttls(session_id)
+        if idle_ttl:
+            self._expiry.schedule(session_id, "idle", idle_since + idle_ttl)
+        if absolute_ttl:
+            self._expiry.schedule(session_id, "absolute", created_at + absolute_ttl)
+        if self.hibernate_after:
+            self._expiry.schedule(session_id, "hibernate", idle_since + self.hibernate_after.total_seconds())
+
+    def _ttls(self, session_id: str) -> Tuple[float, float]:
+        """(유휴 TTL 초, 최대 수명 초) - 재정의가 없으면 기본값, 0이면 해당 만료 없음"""
+        idle_ttl, absolute_ttl = self._session_ttls.get(session_id, (0, 0))
+        return (idle_ttl or self.session_timeout.total_seconds(),
+                absolute_ttl or self.absolute_timeout.total_seconds())
+
+    def _on_deadline(self, session_id: str, kind: str) -> Optional[float]:
+        """만기 처리 (이벤트 루프에서 호출) - 진행 중인 턴이 있으면 잠시 뒤로 미룸"""
         with self._lock:
-            current_time = datetime.now()
-            expired_sessions = []
+            busy = session_id in self.sessions and (
+                self.session_mailboxes[session_id].depth > 0
+                or self.session_states[session_id] == SessionState.WARMING
+            )
+
+            # 활동할 때는 만기를 다시 예약하지 않으므로 실제 만기는 여기서 마지막 활동 시각으로 계산
+            last_activity = self.sessions.last_activity(session_id)
+            if last_activity is not None and kind in ("idle", "hibernate"):
+                ttl = self._ttls(session_id)[0] if kind == "idle" else self.hibernate_after.total_seconds()
+                if last_activity + ttl > time.monotonic():
+                    return last_activity + ttl
+
+            if last_activity is None and session_id in self._hibernated and kind in ("idle", "absolute"):
+                # 휴면 세션은 등록 목록에 활동 시각이 없으므로 휴면 기록(벽시계 시각)으로 실제 만기를 다시 계산
+                record = self._hibernated[session_id]
+                idle_ttl, absolute_ttl = self._ttls(session_id)
+                expires_at = record["last_activity"] + idle_ttl if kind == "idle" else record["created_at"] + absolute_ttl
+                remaining = expires_at - time.time()
+                if remaining > 0:
+                    return time.monotonic() + remaining
 
-            for session_id, timestamp in self.session_timestamps.items():
-                if current_time - timestamp > self.session_timeout:
-                    expired_sessions.append(session_id)
+            if kind == "hibernate":
+                if session_id not in self.sessions:
+                    return None
+                if busy:
+                    return time.monotonic() + self.hibernate_after.total_seconds()
+                if self.session_states[session_id] == SessionState.READY:
+                    self._hibernate_session(session_id)
+                return None
 
-            for session_id in expired_sessions:
+            if busy:
+                return time.monotonic() + 5.0
+            if session_id in self.sessions:
                 self._remove_session(session_id)
-                logging.info(f"Expired session removed: {session_id}")
+            elif session_id in self._hibernated:
+                self._discard_hibernated(session_id)
+            else:
+                return None
+
+        event_type = SessionEventType.EXPIRED_IDLE if kind == "idle" else SessionEventType.EXPIRED_ABSOLUTE
+        logging.info(f"Session expired ({kind}): {session_id}")
+        self._emit_event(session_id, event_type)
+        return None
+
+    async def _sweep_store(self):
+        """메모리에 올라온 적 없는 저장된 세션의 만료와 세션 없는 스레드 정리 (10분마다, 저장소를 쓸 때만)"""
+        while True:
+            await asyncio.sleep(600.0)
+            try:
+                expired = await asyncio.to_thread(self._remove_expired_stored_sessions)
+                # 세션 없이 남은 스레드 (기본 유휴 TTL이 지나도록 어떤 세션에도 등록되지 않은 것)
+                orphans = await asyncio.to_thread(
+                    self.session_store.delete_orphan_threads, time.time() - self.session_timeout.total_seconds()
+                )
+            except Exception as e:
+                logging.error(f"Session store sweep failed: {e}")
+                continue
+            if orphans:
+                logging.info(f"Session store sweep removed {orphans} orphaned threads")
+            for session_id, event_type in expired:
+                self._emit_event(session_id, event_type)
+
+    def _remove_expired_stored_sessions(self) -> List[Tuple[str, SessionEventType]]:
+        """기본 유휴 TTL이 지난 저장된 세션 중 메모리에 없는 세션을 복원하지 않고 삭제
+
+        TTL을 재정의한 세션도 여기서는 기본 유휴 TTL이 지난 뒤에야 후보가 된다.
+        그 전에 요청이 오면 _restore_session이 만료 여부를 확인하여 정리한다.
+        """
+        expired = []
+        for session_id in self.session_store.expired_session_ids(time.time() - self.session_timeout.total_seconds()):
+            with self._lock:
+                # 메모리나 휴면 목록에 있는 세션은 스케줄러가 처리
+                if session_id in self.sessions or session_id in self._hibernated:
+                    continue
+                record = self.session_store.load_session(session_id)
+                event_type = self._expired_event(record) if record is not None else None
+                if event_type is None:
+                    continue
+                self.session_store.delete_session(session_id)
+                self.agent_graph.delete_thread(record["thread_id"])
+                expired.append((session_id, event_type))
+        return expired
+
+    def subscribe_events(self, max_queue: int = 1000) -> asyncio.Queue:
+        """세션 만료·제거 이벤트 구독 - 현재 이벤트 루프의 큐를 반환 (가득 차면 새 이벤트는 버림)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        with self._lock:
+            self._event_subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe_events(self, queue: asyncio.Queue):
+        """이벤트 구독 해제"""
+        with self._lock:
+            self._event_subscribers = [(loop, q) for loop, q in self._event_subscribers if q is not queue]
+
+    def _emit_event(self, session_id: str, event_type: SessionEventType):
+        """구독자에게 세션 이벤트 전달 (어느 스레드에서든 호출 가능)"""
+        event = {"session_id": session_id, "type": event_type, "timestamp": datetime.now().isoformat()}
+        with self._lock:
+            subscribers = list(self._event_subscribers)
+        for loop, queue in subscribers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._deliver_event, queue, event)
+
+    @staticmethod
+    def _deliver_event(queue: asyncio.Queue, event: Dict[str, Any]):
+        if queue.full():
+            logging.warning(f"Session event dropped (subscriber queue full): {event['session_id']}")
+            return
+        queue.put_nowait(event)
+
+    def hibernate_idle_sessions(self, idle_for: Optional[timedelta] = None) -> int:
+        """idle_for(기본값은 설정된 유휴 기준) 넘게 활동이 없는 세션 휴면 - 준비 완료 상태이고
+        대기 중인 턴이 없는 세션만 대상이며, 휴면시킨 세션 수를 반환"""
+        with self._lock:
+            cutoff = time.monotonic() - (self.hibernate_after if idle_for is None else idle_for).total_seconds()
+            idle_sessions = [
+                session_id for session_id, last_activity in self.sessions.activity_items()
+                if last_activity < cutoff
+                and self.session_states.get(session_id) == SessionState.READY
+                and self.session_mailboxes[session_id].depth == 0
+            ]
+            for session_id in idle_sessions:
+                self._hibernate_session(session_id)
+
+        if idle_sessions:
+            logging.info(f"Hibernated {len(idle_sessions)} idle sessions ({len(self.sessions)} active)")
+        return len(idle_sessions)
+
+    def _hibernate_session(self, session_id: str):
+        """세션을 압축된 blob으로 내리고 메모리에서 제거 (내부 메서드, 락 안에서 호출)"""
+        started = time.perf_counter()
+        agent = self.sessions[session_id]
+        record = self._session_record(session_id)
+        if self.session_store is not None:
+            # 저장소에 이미 기록되므로 메모리에서만 내림
+            self.session_store.release_thread(agent.thread_id)
+            record["blob"] = None
+        else:
+            record["blob"] = self.agent_graph.checkpointer.hibernate_thread(agent.thread_id)
+        self._hibernated[session_id] = record
+        self._hibernated_bytes += len(record["blob"] or b"")
+        self._forget_session(session_id)
+        self._expiry.cancel(session_id, "hibernate")
+        self.hibernations += 1
+        self._hibernate_seconds += time.perf_counter() - started
 
     def _remove_session(self, session_id: str):
         """세션 제거 (내부 메서드)"""
+        agent = self.sessions.get(session_id)
+        if agent is not None:
+            agent.close()
+        if self.session_store is not None:
+            self.session_store.delete_session(session_id)
+        self._forget_session(session_id)
+        self._expiry.cancel(session_id, "idle", "absolute", "hibernate")
+        self._session_ttls.pop(session_id, None)
+
+    def _discard_hibernated(self, session_id: str):
+        """휴면 세션 제거 (내부 메서드, 락 안에서 호출)"""
+        record = self._hibernated.pop(session_id)
+        self._hibernated_bytes -= len(record["blob"] or b"")
+        self.agent_graph.delete_thread(record["thread_id"])
+        if self.session_store is not None:
+            self.session_store.delete_session(session_id)
+        self._expiry.cancel(session_id, "idle", "absolute", "hibernate")
+        self._session_ttls.pop(session_id, None)
+
+    def _forget_session(self, session_id: str):
+        """세션을 메모리의 모든 목록에서 제거 (대화 기록은 건드리지 않음, 락 안에서 호출)"""
         self.sessions.pop(session_id, None)
-        self.session_timestamps.pop(session_id, None)
+        self._total_bytes -= self.session_bytes.pop(session_id, 0)
+        self.session_created_at.pop(session_id, None)
+        self.session_mailboxes.pop(session_id, None)
+        self.session_states.pop(session_id, None)
+        self._warmup_errors.pop(session_id, None)
+        warmup = self._warmup_tasks.pop(session_id, None)
+        if warmup is not None:
+            # 정리 타이머 스레드에서도 호출되므로 태스크의 루프에서 취소
+            warmup.get_loop().call_soon_threadsafe(warmup.cancel)
+
+    def _register_session(
+            self,
+            session_id: str,
+            agent: Agent,
+            state: SessionState,
+            created_at: Optional[datetime] = None,
+            last_activity: Optional[datetime] = None,
+            idle_ttl: float = 0,
+            absolute_ttl: float = 0
+    ):
+        """세션 등록 (내부 메서드, 락 안에서 호출) - 저장소에서 복원하는 경우 저장된 시각을 넘김
+
+        만기는 monotonic 시계로 예약하고, 저장된 벽시계 시각은 경과 시간으로만 환산한다.
+        """
+        restored = created_at is not None
+        now = datetime.now()
+        monotonic_now = time.monotonic()
+        idle_since = monotonic_now - max((now - (last_activity or now)).total_seconds(), 0)
+        self.session_mailboxes[session_id] = SessionMailbox(session_id, max_pending=self.max_pending_turns)
+        self.session_states[session_id] = state
+        self.session_created_at[session_id] = created_at or now
+        if idle_ttl or absolute_ttl:
+            self._session_ttls[session_id] = (idle_ttl, absolute_ttl)
+        # 락 없는 조회가 세션을 볼 수 있도록 다른 목록을 채운 뒤 마지막에 공개
+        self.sessions.register(session_id, agent, last_activity=idle_since)
+
+        self._schedule_expiry(
+            session_id,
+            idle_since=idle_since,
+            created_at=monotonic_now - max((now - self.session_created_at[session_id]).total_seconds(), 0)
+        )
+
+        if self.session_store is not None and not restored:
+            self.session_store.save_session(self._session_record(session_id))
+        self._account_session(session_id)
+        self._enforce_limits(protect=session_id)
+
+    def _account_session(self, session_id: str):
+        """세션의 추정 크기 갱신 - 체크포인터에 직렬화되어 있는 대화 기록 크기 (내부 메서드, 락 안에서 호출)"""
+        agent = self.sessions.get(session_id)
+        if agent is None or not self._can_hibernate:
+            return
+        size = self.agent_graph.checkpointer.thread_size(agent.thread_id)
+        self._total_bytes += size - self.session_bytes.get(session_id, 0)
+        self.session_bytes[session_id] = size
+
+    def _over_limits(self) -> bool:
+        if self.max_sessions and len(self.sessions) > self.max_sessions:
+            return True
+        return bool(self.max_memory_bytes) and self._total_bytes + self._hibernated_bytes > self.max_memory_bytes
+
+    def _enforce_limits(self, protect: Optional[str] = None):
+        """상한을 넘었으면 가장 오래 쓰이지 않은 세션부터 휴면 또는 제거 (내부 메서드, 락 안에서 호출)
 
-    def _update_session_timestamp(self, session_id: str):
-        """세션의 마지막 활동 시간 업데이트"""
-        self.session_timestamps[session_id] = datetime.now()
+        진행 중인 턴이 있거나 초기화 중인 세션, protect로 지정한 세션은 건드리지 않는다.
+        휴면으로도 메모리 상한을 맞추지 못하면 가장 오래된 휴면 세션을 제거한다.
+        """
+        if not self._over_limits():
+            return
 
-    def create_session(
+        candidates = sorted(
+            (last_activity, session_id) for session_id, last_activity in self.sessions.activity_items()
+            if session_id != protect
+            and self.session_states.get(session_id) == SessionState.READY
+            and self.session_mailboxes[session_id].depth == 0
+        )
+        for _, session_id in candidates:
+            if not self._over_limits():
+                break
+            if self.eviction_policy == "hibernate":
+                self._hibernate_session(session_id)
+            else:
+                self._remove_session(session_id)
+                self._emit_event(session_id, SessionEventType.EVICTED)
+            self.evictions += 1
+            logging.info(f"Session evicted ({self.eviction_policy}): {session_id}")
+
+        if self._over_limits() and self._hibernated_bytes:
+            # 저장소에 있는 휴면 세션(blob 없음)은 메모리를 차지하지 않으므로 제외
+            in_memory = [sid for sid, record in self._hibernated.items() if record["blob"] is not None]
+            for session_id in sorted(in_memory, key=lambda sid: self._hibernated[sid]["last_activity"]):
+                if not self._over_limits():
+                    break
+                self._discard_hibernated(session_id)
+                self._emit_event(session_id, SessionEventType.EVICTED)
+                self.evictions += 1
+                logging.info(f"Hibernated session evicted: {session_id}")
+
+        if self._over_limits():
+            logging.warning(f"Session limits exceeded with no evictable session ({len(self.sessions)} active)")
+
+    def _session_record(self, session_id: str) -> Dict[str, Any]:
+        """세션을 복원하는 데 필요한 정보 (내부 메서드, 락 안에서 호출)"""
+        agent = self.sessions[session_id]
+        return {
+            "session_id": session_id,
+            "thread_id": agent.thread_id,
+            "character_role": agent.concept.role,
+            "opponent_role": agent.opponent_concept.role,
+            "language": agent.language,
+            "created_at": self.session_created_at[session_id].timestamp(),
+            "last_activity": self._last_activity(session_id).timestamp(),
+            "idle_ttl": self._session_ttls.get(session_id, (0, 0))[0],
+            "absolute_ttl": self._session_ttls.get(session_id, (0, 0))[1]
+        }
+
+    def _restore_session(self, session_id: str) -> bool:
+        """메모리에 없는 세션을 휴면 목록이나 저장소에서 불러와 등록 (내부 메서드, 락 안에서 호출)
+
+        저장소에서 불러올 때는 세션 핸들만 만들고, 대화 기록은 첫 턴에서 체크포인터가 필요할 때 읽어 온다.
+        """
+        if session_id in self.sessions:
+            return True
+        if session_id in self._hibernated:
+            return self._rehydrate_session(session_id)
+        if self.session_store is None or session_id in self._reserved_session_ids:
+            return False
+
+        record = self.session_store.load_session(session_id)
+        if record is None:
+            return False
+
+        # 서버가 내려가 있던 동안 만료된 세션은 복원하지 않고 정리
+        expired = self._expired_event(record)
+        if expired is not None:
+            self.session_store.delete_session(session_id)
+            self.agent_graph.delete_thread(record["thread_id"])
+            self._emit_event(session_id, expired)
+            return False
+        return self._register_record(record)
+
+    def _expired_event(self, record: Dict[str, Any]) -> Optional[SessionEventType]:
+        """저장된 세션 정보의 TTL이 이미 지났으면 해당 만료 이벤트 종류 반환"""
+        now = time.time()
+        idle_ttl = record.get("idle_ttl") or self.session_timeout.total_seconds()
+        absolute_ttl = record.get("absolute_ttl") or self.absolute_timeout.total_seconds()
+        if absolute_ttl and record["created_at"] + absolute_ttl <= now:
+            return SessionEventType.EXPIRED_ABSOLUTE
+        if idle_ttl and record["last_activity"] + idle_ttl <= now:
+            return SessionEventType.EXPIRED_IDLE
+        return None
+
+    def _session_known(self, session_id: str) -> bool:
+        """메모리, 휴면 목록, 저장소 중 어디에든 있는 세션인지 여부 (복원하지 않음, 락 안에서 호출)"""
+        if session_id in self.sessions or session_id in self._hibernated:
+            return True
+        return self.session_store is not None and self.session_store.load_session(session_id) is not None
+
+    def _rehydrate_session(self, session_id: str) -> bool:
+        """휴면 세션 복원 (내부 메서드, 락 안에서 호출)"""
+        started = time.perf_counter()
+        record = self._hibernated.pop(session_id)
+        blob = record.pop("blob")
+        self._hibernated_bytes -= len(blob or b"")
+        if blob is not None:
+            self.agent_graph.checkpointer.rehydrate_thread(record["thread_id"], blob)
+        restored = self._register_record(record)
+        self.rehydrations += 1
+        self._rehydrate_seconds += time.perf_counter() - started
+        return restored
+
+    def _register_record(self, record: Dict[str, Any]) -> bool:
+        """저장된 세션 정보로 Agent 핸들을 만들어 등록 (내부 메서드, 락 안에서 호출)"""
+        session_id = record["session_id"]
+        if record["character_role"] not in CHARACTERS or record["opponent_role"] not in CHARACTERS:
+            logging.warning(f"Stored session {session_id} refers to an unknown character")
+            return False
+
+        agent = Agent(
+            graph=self.agent_graph,
+            concept=CHARACTERS[record["character_role"]],
+            language=record["language"],
+            opponent_concept=CHARACTERS[record["opponent_role"]],
+            thread_id=record["thread_id"]
+        )
+        self._register_session(
+            session_id, agent, SessionState.READY,
+            created_at=datetime.fromtimestamp(record["created_at"]),
+            last_activity=datetime.fromtimestamp(record["last_activity"]),
+            idle_ttl=record.get("idle_ttl", 0),
+            absolute_ttl=record.get("absolute_ttl", 0)
+        )
+        logging.info(f"Session restored: {session_id}")
+        return True
+
+    def _last_activity(self, session_id: str) -> datetime:
+        """마지막 활동 시각 (monotonic 기준 기록을 벽시계 시각으로 환산)"""
+        idle = time.monotonic() - self.sessions.last_activity(session_id)
+        return datetime.now() - timedelta(seconds=idle)
+
+    async def create_session(
             self,
             session_id: Optional[str] = None,
             character_role: str = "바르곤",
             opponent_role: str = "나크티스",
-            language: str = "korean"
+            language: str = "korean",
+            background: bool = False,
+            idle_timeout_seconds: float = 0,
+            max_lifetime_seconds: float = 0
     ) -> str:
-        """새로운 세션 생성"""
+        """새로운 세션 생성
+
+        전역 락은 ID 예약과 등록에만 잡고, LLM 호출이 포함된 Agent 초기화는 락 밖에서 수행한다.
+        background가 True면 WARMING 상태로 즉시 등록하고 초기화는 백그라운드에서 진행한다.
+        idle_timeout_seconds/max_lifetime_seconds로 이 세션의 TTL을 바꿀 수 있다 (0이면 서버 기본값).
+        """
+        self._ensure_background_tasks()
+        if self._draining:
+            raise SessionDrainingException("Server is draining; create the session on another instance")
+        ttls = (idle_timeout_seconds, max_lifetime_seconds)
+        # 캐릭터 검증
+        if character_role not in CHARACTERS:
+            raise AgentException(f"Unknown character: {character_role}")
+        if opponent_role not in CHARACTERS:
+            raise AgentException(f"Unknown opponent: {opponent_role}")
+
         with self._lock:
-            # 세션 ID 생성 또는 검증
+            # 세션 ID 생성 또는 검증 후 예약
             if session_id is None:
                 session_id = str(uuid.uuid4())
-            elif session_id in self.sessions:
+            elif session_id in self._reserved_session_ids or self._session_known(session_id):
                 raise AgentException(f"Session {session_id} already exists")
+            self._reserved_session_ids.add(session_id)
 
-            # 캐릭터 검증
-            if character_role not in CHARACTERS:
-                raise AgentException(f"Unknown character: {character_role}")
-            if opponent_role not in CHARACTERS:
-                raise AgentException(f"Unknown opponent: {opponent_role}")
+        if background:
+            return self._create_session_in_background(session_id, character_role, opponent_role, language, ttls)
 
-            try:
-                # Agent 인스턴스 생성
-                concept = CHARACTERS[character_role]
-                opponent_concept = CHARACTERS[opponent_role]
-
-                agent = Agent(
-                    llm=self.llm,
-                    concept=concept,
-                    language=language,
-                    opponent_concept=opponent_concept
-                )
+        agent: Optional[Agent] = None
+        try:
+            # Agent 인스턴스 생성 (락 밖에서 LLM 초기화 수행)
+            concept = CHARACTERS[character_role]
+            opponent_concept = CHARACTERS[opponent_role]
 
-                # 세션 등록
-                self.sessions[session_id] = agent
-                self._update_session_timestamp(session_id)
+            agent = await Agent.create(
+                graph=self.agent_graph,
+                concept=concept,
+                language=language,
+                opponent_concept=opponent_concept
+            )
+        except LLMOverloadedException:
+            # 과부하로 거절된 초기화의 스레드는 AgentGraph.ainvoke_init에서 이미 삭제됨
+            raise
+        except Exception as e:
+            logging.error(f"Failed to create session: {e}")
+            raise AgentException(f"Failed to create session: {e}")
+        finally:
+            with self._lock:
+                # 예약 해제와 등록을 한 번에 수행하여 원자적으로 공개 (실패/취소 시에는 예약만 해제)
+                self._reserved_session_ids.discard(session_id)
+                if agent is not None:
+                    self._register_session(session_id, agent, SessionState.READY, idle_ttl=ttls[0], absolute_ttl=ttls[1])
 
-                logging.info(f"Session created: {session_id}, Character: {character_role}, Opponent: {opponent_role}")
-                return session_id
+        logging.info(f"Session created: {session_id}, Character: {character_role}, Opponent: {opponent_role}")
+        return session_id
 
-            except Exception as e:
-                logging.error(f"Failed to create session: {e}")
-                raise AgentException(f"Failed to create session: {e}")
+    def _create_session_in_background(
+            self,
+            session_id: str,
+            character_role: str,
+            opponent_role: str,
+            language: str,
+            ttls: Tuple[float, float]
+    ) -> str:
+        """WARMING 상태로 세션을 등록하고 초기화 작업을 백그라운드로 시작"""
+        agent = Agent(
+            graph=self.agent_graph,
+            concept=CHARACTERS[character_role],
+            language=language,
+            opponent_concept=CHARACTERS[opponent_role]
+        )
+
+        with self._lock:
+            self._reserved_session_ids.discard(session_id)
+            self._register_session(session_id, agent, SessionState.WARMING, idle_ttl=ttls[0], absolute_ttl=ttls[1])
+            warmup = asyncio.create_task(self._warm_up_session(session_id, agent))
+            self._warmup_tasks[session_id] = warmup
+
+        logging.info(f"Session warming up: {session_id}, Character: {character_role}, Opponent: {opponent_role}")
+        return session_id
+
+    async def _warm_up_session(self, session_id: str, agent: Agent):
+        """백그라운드 초기화 - 결과에 따라 READY 또는 FAILED로 전환"""
+        try:
+            await agent.ainitialize()
+            state, error = SessionState.READY, None
+        except Exception as e:
+            logging.error(f"Session warm-up failed: {session_id}: {e}")
+            state, error = SessionState.FAILED, str(e)
+
+        with self._lock:
+            if self.sessions.get(session_id) is not agent:
+                # 초기화 도중 세션이 제거됨 - 제거 이후에 저장된 초기화 체크포인트가 남지 않도록 스레드 삭제
+                self.agent_graph.delete_thread(agent.thread_id)
+                return
+            if error is not None:
+                # FAILED 세션은 대화할 수 없으므로 TTL까지 기다리지 않고 초기화 도중의 기록을 바로 버림
+                self.agent_graph.delete_thread(agent.thread_id)
+                self._warmup_errors[session_id] = error
+            self.session_states[session_id] = state
+            self._warmup_tasks.pop(session_id, None)
+            self._account_session(session_id)
 
     def get_session(self, session_id: str) -> Agent:
-        """세션의 Agent 인스턴스 반환"""
+        """세션의 Agent 인스턴스 반환 (메모리에 없으면 저장소에서 불러옴)
+
+        메모리에 있는 세션은 해당 stripe의 락만 잡고 반환하며, 복원이 필요할 때만 전역 락을 잡는다.
+        """
+        # 활동 시각은 조회한 항목에 바로 기록 - 유휴/휴면 만기는 만기 처리 때 다시 계산됨
+        agent = self.sessions.lookup(session_id, touch=True)
+        if agent is None:
+            with self._lock:
+                if not self._restore_session(session_id):
+                    raise AgentException(f"Session {session_id} not found")
+                agent = self.sessions.lookup(session_id, touch=True)
+        if self.session_store is not None:
+            self.session_store.touch_session(session_id, time.time())
+        return agent
+
+    async def submit(
+            self,
+            session_id: str,
+            work: Callable[[Agent], Awaitable[T]],
+            timeout: Optional[float] = None
+    ) -> T:
+        """세션의 작업 큐에 턴을 넣고 순서대로 실행 - 같은 세션의 턴은 직렬, 세션 간에는 병렬
+
+        timeout(초)을 주면 큐 대기를 포함해 그 시간 안에 끝나야 하며, 남은 시간이 턴 안의 LLM 호출
+        timeout으로 쓰인다. 넘기면 DeadlineExceededException이 발생하고 대화 기록은 턴 이전으로 돌아간다.
+        """
+        self._ensure_background_tasks()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        agent = self.get_session(session_id)
+        mailbox = self.session_mailboxes.get(session_id)
+        warmup = self._warmup_tasks.get(session_id)
+        if mailbox is None:
+            # 조회 직후 다른 스레드에서 휴면/제거된 경우 전역 락 안에서 다시 조회
+            with self._lock:
+                if not self._restore_session(session_id):
+                    raise AgentException(f"Session {session_id} not found")
+                agent = self.sessions[session_id]
+                mailbox = self.session_mailboxes[session_id]
+                warmup = self._warmup_tasks.get(session_id)
+
+        async def run() -> T:
+            # 백그라운드 초기화 중이면 완료될 때까지 대기
+            if warmup is not None:
+                await asyncio.shield(warmup)
+            if self.session_states.get(session_id) == SessionState.FAILED:
+                raise AgentException(
+                    f"Session {session_id} failed to initialize: {self._warmup_errors.get(session_id, '')}"
+                )
+            try:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise DeadlineExceededException(f"Deadline exceeded while session {session_id} was queued")
+                with turn_deadline(deadline):
+                    return await work(agent)
+            except DeadlineExceededException:
+                self.deadline_exceeded_turns += 1
+                raise
+            except asyncio.CancelledError:
+                # gRPC는 마감 시각이 지나도 핸들러를 취소하므로 시각으로 구분
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.deadline_exceeded_turns += 1
+                else:
+                    self.cancelled_turns += 1
+                raise
+            finally:
+                with self._lock:
+                    if self.sessions.get(session_id) is agent:
+                        self._account_session(session_id)
+                        self._enforce_limits(protect=session_id)
+
+        return await mailbox.submit(run)
+
+    async def analyze_game_state(self, session_id: str, opponent_actions: str, timeout: Optional[float] = None) -> str:
+        """상대 행동 분석 - 같은 세션에 연달아 들어온 행동은 도착 순서대로 합쳐 한 번만 분석하고 같은 결과를 돌려줌
+
+        합쳐지는 요청은 분석 묶음이 열린 뒤 coalesce 창이 지나기 전이나 앞선 턴이 끝나기를 기다리는 동안 들어온
+        것이다. timeout은 묶음을 연 첫 요청 기준이다.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        async def run(take: Callable[[], List[str]]) -> str:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            return await self.submit(
+                session_id, lambda agent: agent.aanalyze_game_state("\n".join(take())), timeout=remaining
+            )
+
+        return await self._analysis_coalescer.submit(session_id, opponent_actions, run)
+
+    def get_session_state(self, session_id: str) -> SessionState:
+        """세션 준비 상태 반환"""
         with self._lock:
-            if session_id not in self.sessions:
+            if not self._restore_session(session_id):
                 raise AgentException(f"Session {session_id} not found")
+            return self.session_states[session_id]
 
-            self._update_session_timestamp(session_id)
-            return self.sessions[session_id]
+    def get_session_error(self, session_id: str) -> str:
+        """백그라운드 초기화 실패 사유 반환 (실패하지 않았으면 빈 문자열)"""
+        with self._lock:
+            return self._warmup_errors.get(session_id, "")
+
+    def get_queue_depth(self, session_id: str) -> int:
+        """세션의 대기 중인 턴 수 반환"""
+        with self._lock:
+            if not self._restore_session(session_id):
+                raise AgentException(f"Session {session_id} not found")
+            return self.session_mailboxes[session_id].depth
 
     def remove_session(self, session_id: str) -> bool:
         """세션 제거"""
         with self._lock:
-            if session_id in self.sessions:
+            if session_id in self._hibernated:
+                self._discard_hibernated(session_id)
+            elif self._restore_session(session_id):
                 self._remove_session(session_id)
-                logging.info(f"Session removed: {session_id}")
-                return True
-            return False
+            else:
+                return False
+
+        logging.info(f"Session removed: {session_id}")
+        self._emit_event(session_id, SessionEventType.ENDED)
+        return True
 
     def list_sessions(self) -> List[str]:
-        """활성 세션 목록 반환"""
+        """활성 세션 목록 반환 (저장소를 쓰면 메모리에 없는 세션 포함)"""
         with self._lock:
-            return list(self.sessions.keys())
+            if self.session_store is None:
+                return list(self.sessions.keys()) + list(self._hibernated.keys())
+            return list(set(self.sessions) | set(self._hibernated) | set(self.session_store.list_session_ids()))
 
     def session_exists(self, session_id: str) -> bool:
         """세션 존재 여부 확인"""
         with self._lock:
-            return session_id in self.sessions
+            return self._session_known(session_id)
 
     def get_session_info(self, session_id: str) -> Dict:
-        """세션 정보 반환"""
+        """세션 정보 반환 (휴면 세션은 복원하지 않고 저장된 정보로 응답)"""
         with self._lock:
-            if session_id not in self.sessions:
+            record = self._hibernated.get(session_id)
+            if record is not None:
+                return {
+                    "session_id": session_id,
+                    "character_role": record["character_role"],
+                    "opponent_role": record["opponent_role"],
+                    "language": record["language"],
+                    "created_at": datetime.fromtimestamp(record["created_at"]).isoformat(),
+                    "last_activity": datetime.fromtimestamp(record["last_activity"]).isoformat(),
+                    "queue_depth": 0,
+                    "state": SessionState.READY.value,
+                    "hibernated": True,
+                    "bytes": len(record["blob"] or b"")
+                }
+
+            if not self._restore_session(session_id):
                 raise AgentException(f"Session {session_id} not found")
 
             agent = self.sessions[session_id]
-            timestamp = self.session_timestamps[session_id]
 
             return {
                 "session_id": session_id,
                 "character_role": agent.concept.role,
                 "opponent_role": agent.opponent_concept.role,
                 "language": agent.language,
-                "created_at": timestamp.isoformat(),
-                "last_activity": timestamp.isoformat()
+                "created_at": self.session_created_at[session_id].isoformat(),
+                "last_activity": self._last_activity(session_id).isoformat(),
+                "queue_depth": self.session_mailboxes[session_id].depth,
+                "state": self.session_states[session_id].value,
+                "hibernated": False,
+                "bytes": self.session_bytes.get(session_id, 0)
             }
 
     def get_all_sessions_info(self) -> List[Dict]:
         """모든 세션 정보 반환"""
         with self._lock:
-            return [self.get_session_info(session_id) for session_id in self.sessions.keys()]
+            return [self.get_session_info(session_id) for session_id in self.list_sessions()]
+
+    def get_turn_stats(self) -> Dict[str, Any]:
+        """호출자가 포기해 중단된 누적 턴 수 (취소와 마감 시각 초과를 구분)와 분석 요청/실제 분석 횟수"""
+        return {
+            "cancelled_turns": self.cancelled_turns,
+            "deadline_exceeded_turns": self.deadline_exceeded_turns,
+            "analysis_requests": self._analysis_coalescer.requests,
+            "analysis_runs": self._analysis_coalescer.runs
+        }
+
+    def get_llm_stats(self) -> Dict[str, Any]:
+        """LLM 동시 호출 제한의 실행/대기 수와 대기 시간 (limiter가 없으면 빈 dict)"""
+        return self.llm_limiter.get_stats() if self.llm_limiter is not None else {}
+
+    def get_hibernation_stats(self) -> Dict[str, Any]:
+        """활성/휴면 세션 수와 휴면·복원 횟수 및 평균 소요 시간"""
+        with self._lock:
+            return {
+                "active_sessions": len(self.sessions),
+                "hibernated_sessions": len(self._hibernated),
+                "hibernations": self.hibernations,
+                "rehydrations": self.rehydrations,
+                "avg_hibernate_ms": self._hibernate_seconds / self.hibernations * 1000 if self.hibernations else 0.0,
+                "avg_rehydrate_ms": self._rehydrate_seconds / self.rehydrations * 1000 if self.rehydrations else 0.0,
+                "hibernated_bytes": self._hibernated_bytes
+            }
+
+    def get_memory_accounting(self, top_n: int = 10) -> Dict[str, Any]:
+        """세션 추정 크기 합계, 상한, 누적 eviction 수와 가장 큰 세션 top_n개"""
+        with self._lock:
+            sizes = [(size, session_id, False) for session_id, size in self.session_bytes.items()]
+            sizes.extend(
+                (len(record["blob"] or b""), session_id, True) for session_id, record in self._hibernated.items()
+            )
+            largest = sorted(sizes, reverse=True)[:top_n]
+            return {
+                "active_bytes": self._total_bytes,
+                "hibernated_bytes": self._hibernated_bytes,
+                "max_sessions": self.max_sessions,
+                "max_memory_bytes": self.max_memory_bytes,
+                "evictions": self.evictions,
+                "largest_sessions": [
+                    {"session_id": session_id, "bytes": size, "hibernated": hibernated}
+                    for size, session_id, hibernated in largest
+                ]
+            }
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def start_drain(self):
+        """새 세션 생성 중단 - 기존 세션의 턴은 계속 처리"""
+        if not self._draining:
+            self._draining = True
+            logging.info("Session manager draining: InitSession is no longer accepted")
+
+    async def drain(self, timeout: float = 30.0) -> bool:
+        """새 세션 생성을 막고 진행 중인 턴과 백그라운드 초기화가 끝날 때까지 대기 (시간 안에 끝나면 True)"""
+        self.start_drain()
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                in_flight = sum(mailbox.depth for mailbox in self.session_mailboxes.values())
+                in_flight += len(self._warmup_tasks) + len(self._reserved_session_ids)
+            if not in_flight:
+                return True
+            if time.monotonic() >= deadline:
+                logging.warning(f"Drain timed out with {in_flight} turns or initializations in flight")
+                return False
+            await asyncio.sleep(0.05)
+
+    async def wait_for_warmups(self, timeout: float = 30.0) -> bool:
+        """진행 중인 백그라운드 초기화가 끝날 때까지 대기 (시간 안에 끝나면 True)
+
+        export_sessions는 초기화 중인 세션을 내보내지 않으므로, 세션을 옮기기 전에 기다려
+        WARMING 세션이 이전 노드에 남지 않도록 한다. 새 세션 생성은 막지 않는다.
+        """
+        with self._lock:
+            warmups = list(self._warmup_tasks.values())
+        if not warmups:
+            return True
+        _, pending = await asyncio.wait(warmups, timeout=timeout)
+        if pending:
+            logging.warning(f"Export wait timed out with {len(pending)} sessions still warming up")
+            return False
+        return True
+
+    def _require_snapshots(self):
+        if not self._can_hibernate:
+            raise AgentException("Session export/import requires LatestCheckpointSaver (CHECKPOINT_RETENTION=latest)")
+
+    def export_sessions(self) -> Iterator[Dict[str, Any]]:
+        """모든 세션(활성, 휴면, 저장소에만 있는 세션)의 정보와 압축된 대화 기록을 하나씩 반환
+
+        각 항목은 세션 정보(캐릭터, 언어, 시각, TTL)와 "blob"(snapshot_thread 결과)으로 이루어지며
+        import_sessions로 다른 인스턴스에서 복원할 수 있다. 초기화 중이거나 실패한 세션은 제외하므로
+        세션을 옮길 때는 먼저 wait_for_warmups(또는 drain)로 진행 중인 초기화를 기다린다.
+        """
+        self._require_snapshots()
+        checkpointer = self.agent_graph.checkpointer
+        for session_id in self.list_sessions():
+            with self._lock:
+                if session_id in self.sessions:
+                    if self.session_states[session_id] != SessionState.READY:
+                        logging.warning(f"Session {session_id} is not ready; not exported")
+                        continue
+                    record = self._session_record(session_id)
+                    record["blob"] = checkpointer.snapshot_thread(record["thread_id"])
+                else:
+                    record = self._hibernated.get(session_id)
+                    if record is None and self.session_store is not None:
+                        record = self.session_store.load_session(session_id)
+                    if record is None:
+                        continue
+                    record = dict(record)
+                    if record.get("blob") is None:
+                        # 저장소에만 있는 대화 기록은 읽어서 내보낸 뒤 다시 메모리에서 내림
+                        record["blob"] = checkpointer.snapshot_thread(record["thread_id"])
+                        self.session_store.release_thread(record["thread_id"])
+            yield record
+
+    def import_sessions(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """export_sessions 결과로 세션 복원 - 이미 있거나 만료된 세션, 알 수 없는 캐릭터는 건너뜀
+
+        대화 기록은 휴면 상태(저장소를 쓰면 저장소)에 넣어 두고 첫 요청 때 복원하므로
+        많은 세션을 한 번에 가져와도 Agent를 만들지 않는다.
+        반환값의 imported_session_ids는 실제로 가져온 세션 ID 목록이다 (건너뛴 세션은 빠짐).
+        """
+        self._require_snapshots()
+        imported: List[str] = []
+        skipped = 0
+        for record in records:
+            record = dict(record)
+            session_id = record["session_id"]
+            with self._lock:
+                if (session_id in self._reserved_session_ids or self._session_known(session_id)
+                        or record["character_role"] not in CHARACTERS or record["opponent_role"] not in CHARACTERS
+                        or self._expired_event(record) is not None):
+                    skipped += 1
+                    continue
+                self._import_record(record)
+                imported.append(session_id)
+
+        with self._lock:
+            self._enforce_limits()
+        logging.info(f"Sessions imported: {len(imported)} (skipped {skipped})")
+        return {"imported": len(imported), "skipped": skipped, "imported_session_ids": imported}
+
+    def _import_record(self, record: Dict[str, Any]):
+        """가져온 세션을 휴면 목록이나 저장소에 등록 (내부 메서드, 락 안에서 호출)"""
+        session_id = record["session_id"]
+        blob = record.pop("blob")
+        if self.session_store is not None:
+            self.agent_graph.checkpointer.rehydrate_thread(record["thread_id"], blob)
+            self.session_store.release_thread(record["thread_id"])
+            self.session_store.save_session(record)
+            return
+
+        record["blob"] = blob
+        self._hibernated[session_id] = record
+        self._hibernated_bytes += len(blob)
+        if record.get("idle_ttl") or record.get("absolute_ttl"):
+            self._session_ttls[session_id] = (record.get("idle_ttl", 0), record.get("absolute_ttl", 0))
+        monotonic_now, now = time.monotonic(), time.time()
+        self._schedule_expiry(
+            session_id,
+            idle_since=monotonic_now - max(now - record["last_activity"], 0),
+            created_at=monotonic_now - max(now - record["created_at"], 0)
+        )
 
     def shutdown(self):
         """세션 매니저 종료"""
         with self._lock:
-            if self._cleanup_timer:
-                self._cleanup_timer.cancel()
+            self._expiry.stop()
+            if self._store_sweep_task is not None:
+                self._store_sweep_task.get_loop().call_soon_threadsafe(self._store_sweep_task.cancel)
+            for warmup in self._warmup_tasks.values():
+                warmup.get_loop().call_soon_threadsafe(warmup.cancel)
+            self._warmup_tasks.clear()
+            self._warmup_errors.clear()
+            self.session_states.clear()
+            if self.session_store is not None:
+                # 저장된 세션은 남겨 두고 남은 변경만 기록 (재시작 후 복원)
+                self.session_store.close()
+            else:
+                for agent in self.sessions.values():
+                    agent.close()
             self.sessions.clear()
-            self.session_timestamps.clear()
+            self._hibernated.clear()
+            self.session_bytes.clear()
+            self._total_bytes = 0
+            self._hibernated_bytes = 0
+            self.session_created_at.clear()
+            self.session_mailboxes.clear()
+            self._session_ttls.clear()
+            self._reserved_session_ids.clear()
             logging.info("SessionManager shutdown completed")
 
     def __len__(self) -> int:
         """활성 세션 수 반환"""
         with self._lock:
-            return len(self.sessions)
\ No newline at end of file
+            return len(self.list_sessions())
\ No newline at end of file
@@ -0,0 +1,392 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+
+from .checkpoint import LatestCheckpointSaver
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    data_type TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    thread_id TEXT NOT NULL,
+    character_role TEXT NOT NULL,
+    opponent_role TEXT NOT NULL,
+    language TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_activity REAL NOT NULL,
+    idle_ttl REAL NOT NULL DEFAULT 0,
+    absolute_ttl REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_last_activity ON sessions (last_activity);
+"""
+
+SESSION_FIELDS = ("session_id", "thread_id", "character_role", "opponent_role", "language", "created_at", "last_activity",
+                  "idle_ttl", "absolute_ttl")
+
+# 이전 버전 DB에 없는 세션 컬럼 (컬럼 -> 정의)
+SESSION_MIGRATIONS = {
+    "idle_ttl": "REAL NOT NULL DEFAULT 0",
+    "absolute_ttl": "REAL NOT NULL DEFAULT 0"
+}
+
+
+class SQLiteSessionStore(LatestCheckpointSaver):
+    """SQLite(WAL)에 세션을 영속화하는 체크포인터 겸 세션 메타데이터 저장소
+
+    - 최근에 쓰인 hot_capacity개 스레드는 메모리(LatestCheckpointSaver)에 디코딩된 상태로 유지하고,
+      그보다 오래 쓰이지 않은 스레드는 디스크에만 남겨 두었다가 다음 조회 때 다시 읽는다.
+    - 쓰기는 바로 디스크로 가지 않고 백그라운드 스레드가 flush_interval마다 모아서
+      한 트랜잭션으로 기록한다 (write-behind). 프로세스가 비정상 종료되면 마지막
+      flush_interval 동안의 변경은 잃을 수 있다.
+    - 세션 메타데이터(캐릭터, 언어, 시각)를 함께 저장하여 재시작 후에도 세션을 복원할 수 있다.
+    """
+
+    def __init__(self, path: str, hot_capacity: int = 1000, flush_interval: float = 0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.hot_capacity = hot_capacity
+        self.flush_interval = flush_interval
+
+        self._lock = threading.RLock()  # 메모리 저장소와 변경 목록 보호
+        self._recent: "OrderedDict[str, None]" = OrderedDict()  # 메모리에 있는 스레드 (LRU 순)
+        self._dirty_threads: Set[str] = set()
+        self._deleted_threads: Set[str] = set()
+        self._released_threads: Set[str] = set()  # 용량과 무관하게 메모리에서 내릴 스레드
+        self._dirty_sessions: Dict[str, Optional[Dict[str, Any]]] = {}  # None이면 삭제
+        self._touched_sessions: Dict[str, float] = {}  # session_id -> 마지막 활동 시각
+        # 기록 중인(아직 커밋되지 않은) 삭제와 세션 변경 - 커밋 전 조회가 디스크의 옛 내용을 읽지 않도록
+        self._flushing_deleted_threads: Set[str] = set()
+        self._flushing_sessions: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        self.flushes = 0
+        self.cold_loads = 0
+        self.evictions = 0
+
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+        self._migrate()
+        self._read_lock = threading.Lock()
+        self._reader = self._connect()
+
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="session-store-flush", daemon=True)
+        self._flusher.start()
+
+    def _migrate(self):
+        """이전 버전에서 만든 sessions 테이블에 빠진 컬럼 추가"""
+        columns = {row[1] for row in self._writer.execute("PRAGMA table_info(sessions)")}
+        for column, definition in SESSION_MIGRATIONS.items():
+            if column not in columns:
+                self._writer.execute(f"ALTER TABLE sessions ADD COLUMN {column} {definition}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ---- 체크포인터 ----
+
+    def put(
+            self,
+            config: RunnableConfig,
+            checkpoint: Checkpoint,
+            metadata: CheckpointMetadata,
+            new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+            self._dirty_threads.add(thread_id)
+            self._deleted_threads.discard(thread_id)
+            self._touch(thread_id)
+        return next_config
+
+    def put_writes(
+            self,
+            config: RunnableConfig,
+            writes: Sequence[Tuple[str, Any]],
+            task_id: str,
+            task_path: str = ""
+    ) -> None:
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            cold = thread_id not in self.storage and not self._is_deleted(thread_id)
+        if cold:
+            self._load_thread(thread_id)
+
+        with self._lock:
+            result = super().get_tuple(config)
+            if result is not None:
+                self._touch(thread_id)
+            return result
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            super().delete_thread(thread_id)
+            self._recent.pop(thread_id, None)
+            self._released_threads.discard(thread_id)
+            self._dirty_threads.discard(thread_id)
+            self._deleted_threads.add(thread_id)
+
+    def export_thread(self, thread_id: str) -> Dict[str, Any]:
+        """메모리에 없는 스레드는 디스크에서 읽어 온 뒤 내보냄"""
+        with self._lock:
+            cold = thread_id not in self.storage and not self._is_deleted(thread_id)
+        if cold:
+            self._load_thread(thread_id)
+        with self._lock:
+            return super().export_thread(thread_id)
+
+    def rehydrate_thread(self, thread_id: str, blob: bytes) -> None:
+        """blob에서 스레드를 복원하고 다음 flush 때 디스크에 기록 (다른 인스턴스에서 가져온 세션)"""
+        with self._lock:
+            super().rehydrate_thread(thread_id, blob)
+            self._dirty_threads.add(thread_id)
+            self._deleted_threads.discard(thread_id)
+            self._touch(thread_id)
+
+    def rollback_thread(self, thread_id: str, exported: Dict[str, Any]) -> None:
+        """되돌린 상태를 다음 flush 때 디스크에도 기록"""
+        with self._lock:
+            super().rollback_thread(thread_id, exported)
+            self._dirty_threads.add(thread_id)
+            self._touch(thread_id)
+
+    def release_thread(self, thread_id: str):
+        """스레드를 디스크에 기록한 뒤 메모리에서 내림 (다음 조회 때 다시 읽음)"""
+        with self._lock:
+            if thread_id in self._recent:
+                self._released_threads.add(thread_id)
+
+    def _is_deleted(self, thread_id: str) -> bool:
+        """삭제되었지만 아직 디스크에 반영되지 않은 스레드인지 여부 (락 안에서 호출)"""
+        return thread_id in self._deleted_threads or thread_id in self._flushing_deleted_threads
+
+    def _touch(self, thread_id: str):
+        """LRU 순서 갱신 (락 안에서 호출)"""
+        self._recent[thread_id] = None
+        self._recent.move_to_end(thread_id)
+        self._released_threads.discard(thread_id)
+
+    def _load_thread(self, thread_id: str):
+        """디스크에 있는 스레드를 메모리로 읽어 들임"""
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT data_type, data FROM threads WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+        if row is None:
+            return
+
+        data = self.serde.loads_typed((row[0], row[1]))
+        with self._lock:
+            # 읽는 동안 다른 작업이 스레드를 만들거나 지웠으면 그 결과를 유지
+            if thread_id in self.storage or self._is_deleted(thread_id):
+                return
+            self.import_thread(thread_id, data)
+            self._touch(thread_id)
+            self.cold_loads += 1
+
+    # ---- 세션 메타데이터 ----
+
+    def save_session(self, record: Dict[str, Any]):
+        """세션 메타데이터 저장 (다음 flush 때 기록)"""
+        with self._lock:
+            self._dirty_sessions[record["session_id"]] = dict(record)
+            self._touched_sessions.pop(record["session_id"], None)
+
+    def touch_session(self, session_id: str, last_activity: float):
+        """세션의 마지막 활동 시각 갱신 (다음 flush 때 기록)"""
+        with self._lock:
+            record = self._dirty_sessions.get(session_id)
+            if record is not None:
+                record["last_activity"] = last_activity
+            elif session_id not in self._dirty_sessions:
+                self._touched_sessions[session_id] = last_activity
+
+    def delete_session(self, session_id: str):
+        """세션 메타데이터 삭제 (다음 flush 때 기록)"""
+        with self._lock:
+            self._dirty_sessions[session_id] = None
+            self._touched_sessions.pop(session_id, None)
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 메타데이터 조회 (아직 기록되지 않은 변경 포함)"""
+        with self._lock:
+            for pending in (self._dirty_sessions, self._flushing_sessions):
+                if session_id in pending:
+                    record = pending[session_id]
+                    return dict(record) if record is not None else None
+            touched = self._touched_sessions.get(session_id)
+
+        with self._read_lock:
+            row = self._reader.execute(
+                f"SELECT {', '.join(SESSION_FIELDS)} FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(SESSION_FIELDS, row))
+        if touched is not None:
+            record["last_activity"] = touched
+        return record
+
+    def list_session_ids(self) -> List[str]:
+        """저장된 모든 세션 ID (아직 기록되지 않은 변경 포함)"""
+        with self._read_lock:
+            stored = {row[0] for row in self._reader.execute("SELECT session_id FROM sessions")}
+        with self._lock:
+            for pending in (self._flushing_sessions, self._dirty_sessions):
+                for session_id, record in pending.items():
+                    if record is None:
+                        stored.discard(session_id)
+                    else:
+                        stored.add(session_id)
+        return list(stored)
+
+    def expired_session_ids(self, cutoff: float) -> List[str]:
+        """마지막 활동 시각이 cutoff 이전인 세션 ID (메모리에 올라와 있지 않은 세션 포함)"""
+        self.flush()
+        with self._read_lock:
+            return [row[0] for row in self._reader.execute(
+                "SELECT session_id FROM sessions WHERE last_activity < ?", (cutoff,)
+            )]
+
+    def delete_orphan_threads(self, cutoff: float) -> int:
+        """어떤 세션도 가리키지 않고 cutoff 이전에 마지막으로 기록된 스레드 삭제 - 삭제한 수 반환
+
+        초기화가 실패했거나, 스레드는 기록됐지만 세션 메타데이터를 기록하기 전에 프로세스가 종료되어
+        남은 스레드를 정리한다. 메모리에 있는 스레드(초기화 중인 세션 등)와 기록 대기 중인 세션의 스레드는 제외한다.
+        """
+        self.flush()
+        with self._read_lock:
+            candidates = [row[0] for row in self._reader.execute(
+                "SELECT thread_id FROM threads WHERE updated_at < ? "
+                "AND thread_id NOT IN (SELECT thread_id FROM sessions)", (cutoff,)
+            )]
+        with self._lock:
+            pending = {record["thread_id"] for records in (self._dirty_sessions, self._flushing_sessions)
+                       for record in records.values() if record is not None}
+            orphans = [thread_id for thread_id in candidates if thread_id not in self.storage and thread_id not in pending]
+            self._deleted_threads.update(orphans)
+        return len(orphans)
+
+    # ---- 기록 ----
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Session store flush failed: {e}")
+
+    def flush(self):
+        """모인 변경을 한 트랜잭션으로 기록하고, 용량을 넘은 오래된 스레드를 메모리에서 내림"""
+        with self._write_lock:
+            with self._lock:
+                threads = {thread_id: self.export_thread(thread_id) for thread_id in self._dirty_threads}
+                deleted_threads = list(self._deleted_threads)
+                sessions = self._dirty_sessions
+                touched = self._touched_sessions
+                self._dirty_threads = set()
+                self._deleted_threads = set()
+                self._dirty_sessions = {}
+                self._touched_sessions = {}
+                self._flushing_deleted_threads = set(deleted_threads)
+                self._flushing_sessions = sessions
+
+            if threads or deleted_threads or sessions or touched:
+                now = time.time()
+                # 직렬화는 락 밖에서 수행
+                rows = [(thread_id, *self.serde.dumps_typed(data), now) for thread_id, data in threads.items()]
+                try:
+                    self._writer.execute("BEGIN")
+                    self._writer.executemany(
+                        "INSERT OR REPLACE INTO threads (thread_id, data_type, data, updated_at) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+                    self._writer.executemany(
+                        "DELETE FROM threads WHERE thread_id = ?", [(thread_id,) for thread_id in deleted_threads]
+                    )
+                    self._writer.executemany(
+                        f"INSERT OR REPLACE INTO sessions ({', '.join(SESSION_FIELDS)}) "
+                        f"VALUES ({', '.join('?' * len(SESSION_FIELDS))})",
+                        [tuple(record[field] for field in SESSION_FIELDS)
+                         for record in sessions.values() if record is not None]
+                    )
+                    self._writer.executemany(
+                        "DELETE FROM sessions WHERE session_id = ?",
+                        [(session_id,) for session_id, record in sessions.items() if record is None]
+                    )
+                    self._writer.executemany(
+                        "UPDATE sessions SET last_activity = ? WHERE session_id = ?",
+                        [(last_activity, session_id) for session_id, last_activity in touched.items()]
+                    )
+                    self._writer.execute("COMMIT")
+                except Exception:
+                    self._writer.execute("ROLLBACK")
+                    # 기록하지 못한 변경은 다음 flush에서 다시 시도 (그 사이 새로 생긴 변경이 우선)
+                    with self._lock:
+                        self._dirty_threads.update(t for t in threads if t in self.storage)
+                        self._deleted_threads.update(t for t in deleted_threads if t not in self.storage)
+                        for session_id, record in sessions.items():
+                            self._dirty_sessions.setdefault(session_id, record)
+                        for session_id, last_activity in touched.items():
+                            self._touched_sessions.setdefault(session_id, last_activity)
+                    raise
+                finally:
+                    with self._lock:
+                        self._flushing_deleted_threads = set()
+                        self._flushing_sessions = {}
+                self.flushes += 1
+
+            self._evict()
+
+    def _evict(self):
+        """release_thread로 요청된 스레드와, hot_capacity를 넘는 만큼 가장 오래 쓰이지 않은 스레드를
+        메모리에서 내림 (디스크에 기록된 것만)"""
+        with self._lock:
+            released = {thread_id for thread_id in self._released_threads if thread_id not in self._dirty_threads}
+            self._released_threads -= released
+            victims = list(released)
+            overflow = len(self._recent) - len(released) - self.hot_capacity
+            for thread_id in self._recent:
+                if overflow <= 0:
+                    break
+                if thread_id not in self._dirty_threads and thread_id not in released:
+                    victims.append(thread_id)
+                    overflow -= 1
+            for thread_id in victims:
+                del self._recent[thread_id]
+                # 메모리에서만 삭제 (디스크 기록은 유지)
+                self._drop_thread(thread_id)
+            self.evictions += len(victims)
+
+    @property
+    def hot_threads(self) -> int:
+        """메모리에 올라와 있는 스레드 수"""
+        with self._lock:
+            return len(self._recent)
+
+    def close(self):
+        """flush 스레드를 멈추고 남은 변경을 기록한 뒤 연결을 닫음"""
+        self._stop.set()
+        self._flusher.join()
+        self.flush()
+        self._writer.close()
+        self._reader.close()
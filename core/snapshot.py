@@ -0,0 +1,48 @@
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+SNAPSHOT_MAGIC = b"chatbot-sessions/1\n"
+
+_serde = JsonPlusSerializer()
+_length = struct.Struct(">I")
+
+
+def write_snapshot(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """세션 정보 목록을 스냅샷 파일로 기록하고 기록한 세션 수를 반환
+
+    세션마다 길이 + 직렬화 타입 + 데이터로 이어 붙이므로 읽을 때 한 세션씩 처리할 수 있다.
+    임시 파일에 모두 쓴 뒤 교체하므로 중간에 실패해도 기존 스냅샷은 남는다.
+    """
+    count = 0
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        for record in records:
+            type_, data = _serde.dumps_typed(record)
+            payload = type_.encode() + b"\n" + data
+            file.write(_length.pack(len(payload)))
+            file.write(payload)
+            count += 1
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    return count
+
+
+def read_snapshot(path: str) -> Iterator[Dict[str, Any]]:
+    """write_snapshot으로 기록한 세션 정보를 하나씩 읽음"""
+    with open(path, "rb") as file:
+        if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a session snapshot")
+        while True:
+            header = file.read(_length.size)
+            if not header:
+                return
+            if len(header) != _length.size:
+                raise ValueError(f"{path} is truncated")
+            payload = file.read(_length.unpack(header)[0])
+            type_, data = payload.split(b"\n", 1)
+            yield _serde.loads_typed((type_.decode(), data))
@@ -0,0 +1,179 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.response import Response
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_WHITESPACE = " \t\r\n"
+
+
+def chunk_text(chunk: Any) -> str:
+    """스트리밍 메시지 조각의 텍스트 (content가 part 목록인 모델도 처리)"""
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    return "".join(part if isinstance(part, str) else part.get("text", "") for part in content)
+
+
+class ResponseStreamParser:
+    """`{speech, emotion}` JSON을 조각 단위로 읽으며 필드 값을 뽑아내는 파서
+
+    feed로 텍스트 조각을 넣으면 지금까지 확정된 이벤트를 돌려준다.
+    - ("speech", 조각): speech 문자열에서 새로 디코딩된 부분 (이스케이프는 완성된 뒤에만 내보냄)
+    - ("emotion", 값): emotion 문자열이 닫히는 즉시 전체 값
+
+    첫 '{' 앞의 텍스트(```json 같은 코드 펜스)는 무시하고, 최상위 객체의 다른 키와 문자열이 아닌 값은 건너뛴다.
+    """
+
+    def __init__(self, stream_fields: Tuple[str, ...] = ("speech",), fields: Tuple[str, ...] = ("speech", "emotion")):
+        self.stream_fields = stream_fields
+        self.fields = fields
+        self.values: Dict[str, str] = {}
+        self.done = False
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"  # start, key, colon, value, string, skip, after_value
+        self._key: Optional[str] = None
+        self._reading_key = False
+        self._current: List[str] = []
+        self._skip_depth = 0
+        self._skip_in_string = False
+        self._skip_escape = False
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        self._buffer += text
+        events: List[Tuple[str, str]] = []
+        buffer = self._buffer
+        while self._pos < len(buffer) and not self.done:
+            char = buffer[self._pos]
+            state = self._state
+
+            if state == "start":
+                if char == "{":
+                    self._state = "key"
+                self._pos += 1
+
+            elif state == "key":
+                if char == '"':
+                    self._state, self._reading_key, self._current = "string", True, []
+                elif char == "}":
+                    self.done = True
+                self._pos += 1
+
+            elif state == "colon":
+                if char == ":":
+                    self._state = "value"
+                self._pos += 1
+
+            elif state == "value":
+                if char in _WHITESPACE:
+                    self._pos += 1
+                elif char == '"':
+                    self._state, self._reading_key, self._current = "string", False, []
+                    self._pos += 1
+                else:
+                    self._state, self._skip_depth = "skip", 0
+                    self._skip_in_string = self._skip_escape = False
+
+            elif state == "string":
+                decoded = self._read_string(buffer)
+                if decoded is None:
+                    break  # 이스케이프가 조각 경계에서 잘림 - 다음 조각을 기다림
+                chunk, closed = decoded
+                if self._reading_key:
+                    self._current.append(chunk)
+                    if closed:
+                        self._key = "".join(self._current)
+                        self._state = "colon"
+                else:
+                    if chunk:
+                        self._current.append(chunk)
+                        if self._key in self.stream_fields:
+                            events.append((self._key, chunk))
+                    if closed:
+                        if self._key in self.fields:
+                            self.values[self._key] = "".join(self._current)
+                            if self._key not in self.stream_fields:
+                                events.append((self._key, self.values[self._key]))
+                        self._state = "after_value"
+
+            elif state == "skip":
+                self._skip_value(char)
+                if self._state == "skip":
+                    self._pos += 1
+
+            elif state == "after_value":
+                if char == ",":
+                    self._state = "key"
+                elif char == "}":
+                    self.done = True
+                self._pos += 1
+
+        # 처리한 부분은 버림
+        self._buffer = buffer[self._pos:]
+        self._pos = 0
+        return events
+
+    def _read_string(self, buffer: str) -> Optional[Tuple[str, bool]]:
+        """현재 위치부터 문자열 값을 디코딩 - (디코딩된 텍스트, 문자열이 닫혔는지), 이스케이프가 잘렸으면 None"""
+        out: List[str] = []
+        pos = self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self._pos = pos + 1
+                return "".join(out), True
+            if char != "\\":
+                out.append(char)
+                pos += 1
+                continue
+
+            if pos + 1 >= len(buffer):
+                break
+            escape = buffer[pos + 1]
+            if escape != "u":
+                out.append(_ESCAPES.get(escape, escape))
+                pos += 2
+                continue
+            if pos + 6 > len(buffer):
+                break
+            code = int(buffer[pos + 2:pos + 6], 16)
+            if 0xD800 <= code < 0xDC00:
+                # 서로게이트 쌍은 뒤쪽 절반까지 받은 뒤에 디코딩
+                if pos + 12 > len(buffer):
+                    break
+                low = int(buffer[pos + 8:pos + 12], 16)
+                out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                pos += 12
+            else:
+                out.append(chr(code))
+                pos += 6
+
+        if pos == self._pos and not out:
+            return None if pos < len(buffer) else ("", False)
+        self._pos = pos
+        return "".join(out), False
+
+    def _skip_value(self, char: str):
+        """문자열이 아닌 값(숫자, 객체, 배열 등)을 다음 ',' 또는 '}'까지 건너뜀"""
+        if self._skip_in_string:
+            if self._skip_escape:
+                self._skip_escape = False
+            elif char == "\\":
+                self._skip_escape = True
+            elif char == '"':
+                self._skip_in_string = False
+        elif char == '"':
+            self._skip_in_string = True
+        elif char in "{[":
+            self._skip_depth += 1
+        elif char in "]}" and self._skip_depth:
+            self._skip_depth -= 1
+        elif char in ",}" and not self._skip_depth:
+            self._state = "after_value"
+
+    def result(self) -> Response:
+        """완성된 응답 - 필드가 모두 닫히지 않았으면 ValueError"""
+        missing = [field for field in self.fields if field not in self.values]
+        if missing:
+            raise ValueError(f"Streamed response is missing {', '.join(missing)}")
+        return Response(**{field: self.values[field] for field in self.fields})
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rchatbot.proto\x12\x07\x63hatbot\"%\n\x12HealthCheckRequest\x12\x0f\n\x07service\x18\x01 \x01(\t\"\xa2\x01\n\x13HealthCheckResponse\x12:\n\x06status\x18\x01 \x01(\x0e\x32*.chatbot.HealthCheckResponse.ServingStatus\"O\n\rServingStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\x12\x13\n\x0fSERVICE_UNKNOWN\x10\x03\"i\n\x12InitSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x16\n\x0e\x63haracter_role\x18\x02 \x01(\t\x12\x15\n\ropponent_role\x18\x03 \x01(\t\x12\x10\n\x08language\x18\x04 \x01(\t\"Q\n\x13InitSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\"7\n\x0b\x43hatRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x14\n\x0cuser_message\x18\x02 \x01(\t\"W\n\x0c\x43hatResponse\x12\x0e\n\x06speech\x18\x01 \x01(\t\x12\x0f\n\x07\x65motion\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\x15\n\rerror_message\x18\x04 \x01(\t\"?\n\x0f\x41nalysisRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x18\n\x10opponent_actions\x18\x02 \x01(\t\"L\n\x10\x41nalysisResponse\x12\x10\n\x08\x61nalysis\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\'\n\x11\x45ndSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"<\n\x12\x45ndSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\x15\n\x13ListSessionsRequest\"+\n\x14ListSessionsResponse\x12\x13\n\x0bsession_ids\x18\x01 \x03(\t2\xb1\x03\n\x14\x43haracterChatService\x12H\n\x0bInitSession\x12\x1b.chatbot.InitSessionRequest\x1a\x1c.chatbot.InitSessionResponse\x12\x33\n\x04\x43hat\x12\x14.chatbot.ChatRequest\x1a\x15.chatbot.ChatResponse\x12G\n\x10\x41nalyzeGameState\x12\x18.chatbot.AnalysisRequest\x1a\x19.chatbot.AnalysisResponse\x12\x45\n\nEndSession\x12\x1a.chatbot.EndSessionRequest\x1a\x1b.chatbot.EndSessionResponse\x12K\n\x0cListSessions\x12\x1c.chatbot.ListSessionsRequest\x1a\x1d.chatbot.ListSessionsResponse\x12=\n\nStreamChat\x12\x14.chatbot.ChatRequest\x1a\x15.chatbot.ChatResponse(\x01\x30\x01\x32\x92\x01\n\x06Health\x12\x42\n\x05\x43heck\x12\x1b.chatbot.HealthCheckRequest\x1a\x1c.chatbot.HealthCheckResponse\x12\x44\n\x05Watch\x12\x1b.chatbot.HealthCheckRequest\x1a\x1c.chatbot.HealthCheckResponse0\x01\x42\tZ\x07\x63hatbotb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rchatbot.proto\x12\x07\x63hatbot\"%\n\x12HealthCheckRequest\x12\x0f\n\x07service\x18\x01 \x01(\t\"\xa2\x01\n\x13HealthCheckResponse\x12:\n\x06status\x18\x01 \x01(\x0e\x32*.chatbot.HealthCheckResponse.ServingStatus\"O\n\rServingStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\x12\x13\n\x0fSERVICE_UNKNOWN\x10\x03\"\xbe\x01\n\x12InitSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x16\n\x0e\x63haracter_role\x18\x02 \x01(\t\x12\x15\n\ropponent_role\x18\x03 \x01(\t\x12\x10\n\x08language\x18\x04 \x01(\t\x12\x17\n\x0f\x62\x61\x63kground_init\x18\x05 \x01(\x08\x12\x1c\n\x14idle_timeout_seconds\x18\x06 \x01(\x05\x12\x1c\n\x14max_lifetime_seconds\x18\x07 \x01(\x05\"w\n\x13InitSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12$\n\x05state\x18\x04 \x01(\x0e\x32\x15.chatbot.SessionState\"K\n\x0b\x43hatRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x14\n\x0cuser_message\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\t\"\x7f\n\x0c\x43hatResponse\x12\x0e\n\x06speech\x18\x01 \x01(\t\x12\x0f\n\x07\x65motion\x18\x02 \x01(\t\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\x15\n\rerror_message\x18\x04 \x01(\t\x12\x12\n\nrequest_id\x18\x05 \x01(\t\x12\x12\n\nsession_id\x18\x06 \x01(\t\"~\n\x0f\x43hatStreamEvent\x12\x14\n\x0cspeech_delta\x18\x01 \x01(\t\x12\x0f\n\x07\x65motion\x18\x02 \x01(\t\x12\x0c\n\x04\x64one\x18\x03 \x01(\x08\x12\x0e\n\x06speech\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rerror_message\x18\x06 \x01(\t\"?\n\x0f\x41nalysisRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x18\n\x10opponent_actions\x18\x02 \x01(\t\"L\n\x10\x41nalysisResponse\x12\x10\n\x08\x61nalysis\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\'\n\x11\x45ndSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"<\n\x12\x45ndSessionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"\x15\n\x13ListSessionsRequest\"+\n\x14ListSessionsResponse\x12\x13\n\x0bsession_ids\x18\x01 \x03(\t\"*\n\x14SessionStatusRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"e\n\x15SessionStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12$\n\x05state\x18\x02 \x01(\x0e\x32\x15.chatbot.SessionState\x12\x15\n\rerror_message\x18\x03 \x01(\t\"$\n\x13SessionStatsRequest\x12\r\n\x05top_n\x18\x01 \x01(\x05\"E\n\x0cSessionUsage\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\r\n\x05\x62ytes\x18\x02 \x01(\x03\x12\x12\n\nhibernated\x18\x03 \x01(\x08\"\xdf\x05\n\x14SessionStatsResponse\x12\x17\n\x0f\x61\x63tive_sessions\x18\x01 \x01(\x05\x12\x1b\n\x13hibernated_sessions\x18\x02 \x01(\x05\x12\x14\n\x0chibernations\x18\x03 \x01(\x03\x12\x14\n\x0crehydrations\x18\x04 \x01(\x03\x12\x18\n\x10\x61vg_hibernate_ms\x18\x05 \x01(\x01\x12\x18\n\x10\x61vg_rehydrate_ms\x18\x06 \x01(\x01\x12\x18\n\x10hibernated_bytes\x18\x07 \x01(\x03\x12\x14\n\x0c\x61\x63tive_bytes\x18\x08 \x01(\x03\x12\x14\n\x0cmax_sessions\x18\t \x01(\x05\x12\x18\n\x10max_memory_bytes\x18\n \x01(\x03\x12\x11\n\tevictions\x18\x0b \x01(\x03\x12/\n\x10largest_sessions\x18\x0c \x03(\x0b\x32\x15.chatbot.SessionUsage\x12\x15\n\rllm_in_flight\x18\r \x01(\x05\x12\x17\n\x0fllm_queue_depth\x18\x0e \x01(\x05\x12\x1a\n\x12llm_max_concurrent\x18\x0f \x01(\x05\x12\x15\n\rllm_max_queue\x18\x10 \x01(\x05\x12\x14\n\x0cllm_admitted\x18\x11 \x01(\x03\x12\x14\n\x0cllm_rejected\x18\x12 \x01(\x03\x12\x1a\n\x12llm_queue_timeouts\x18\x13 \x01(\x03\x12\x17\n\x0f\x61vg_llm_wait_ms\x18\x14 \x01(\x01\x12\x17\n\x0fmax_llm_wait_ms\x18\x15 \x01(\x01\x12\x17\n\x0f\x63\x61ncelled_turns\x18\x16 \x01(\x03\x12\x1f\n\x17\x64\x65\x61\x64line_exceeded_turns\x18\x17 \x01(\x03\x12\x19\n\x11\x61nalysis_requests\x18\x18 \x01(\x03\x12\x15\n\ranalysis_runs\x18\x19 \x01(\x03\x12\x14\n\x0cmatch_events\x18\x1a \x01(\x03\x12\x16\n\x0ematch_speeches\x18\x1b \x01(\x03\x12\x16\n\x0ematch_analyses\x18\x1c \x01(\x03\"+\n\x14SessionEventsRequest\x12\x13\n\x0bsession_ids\x18\x01 \x03(\t\"^\n\x0cSessionEvent\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\'\n\x04type\x18\x02 \x01(\x0e\x32\x19.chatbot.SessionEventType\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"E\n\x15\x45xportSessionsRequest\x12\r\n\x05\x64rain\x18\x01 \x01(\x08\x12\x1d\n\x15\x64rain_timeout_seconds\x18\x02 \x01(\x01\"\xdd\x01\n\x0fSessionSnapshot\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x11\n\tthread_id\x18\x02 \x01(\t\x12\x16\n\x0e\x63haracter_role\x18\x03 \x01(\t\x12\x15\n\ropponent_role\x18\x04 \x01(\t\x12\x10\n\x08language\x18\x05 \x01(\t\x12\x12\n\ncreated_at\x18\x06 \x01(\x01\x12\x15\n\rlast_activity\x18\x07 \x01(\x01\x12\x10\n\x08idle_ttl\x18\x08 \x01(\x01\x12\x14\n\x0c\x61\x62solute_ttl\x18\t \x01(\x01\x12\x0f\n\x07history\x18\n \x01(\x0c\"Y\n\x16ImportSessionsResponse\x12\x10\n\x08imported\x18\x01 \x01(\x05\x12\x0f\n\x07skipped\x18\x02 \x01(\x05\x12\x1c\n\x14imported_session_ids\x18\x03 \x03(\t\"H\n\x17\x42\x61tchInitSessionRequest\x12-\n\x08requests\x18\x01 \x03(\x0b\x32\x1b.chatbot.InitSessionRequest\"a\n\x18\x42\x61tchInitSessionResponse\x12/\n\tresponses\x18\x01 \x03(\x0b\x32\x1c.chatbot.InitSessionResponse\x12\x14\n\x0cstatus_codes\x18\x02 \x03(\x05\":\n\x10\x42\x61tchChatRequest\x12&\n\x08requests\x18\x01 \x03(\x0b\x32\x14.chatbot.ChatRequest\"S\n\x11\x42\x61tchChatResponse\x12(\n\tresponses\x18\x01 \x03(\x0b\x32\x15.chatbot.ChatResponse\x12\x14\n\x0cstatus_codes\x18\x02 \x03(\x05\"B\n\x14\x42\x61tchAnalysisRequest\x12*\n\x08requests\x18\x01 \x03(\x0b\x32\x18.chatbot.AnalysisRequest\"[\n\x15\x42\x61tchAnalysisResponse\x12,\n\tresponses\x18\x01 \x03(\x0b\x32\x19.chatbot.AnalysisResponse\x12\x14\n\x0cstatus_codes\x18\x02 \x03(\x05\"\xca\x01\n\nMatchEvent\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12%\n\x04type\x18\x02 \x01(\x0e\x32\x17.chatbot.MatchEventType\x12\x13\n\x0b\x62y_opponent\x18\x03 \x01(\x08\x12\x0c\n\x04move\x18\x04 \x01(\t\x12\x0f\n\x07special\x18\x05 \x01(\x08\x12\x0e\n\x06\x64\x61mage\x18\x06 \x01(\x05\x12\x12\n\ncombo_hits\x18\x07 \x01(\x05\x12\n\n\x02hp\x18\x08 \x01(\x05\x12\x0e\n\x06max_hp\x18\t \x01(\x05\x12\r\n\x05round\x18\n \x01(\x05\"\xde\x01\n\x0bMatchOutput\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12&\n\x04type\x18\x02 \x01(\x0e\x32\x18.chatbot.MatchOutputType\x12(\n\x07trigger\x18\x03 \x01(\x0e\x32\x17.chatbot.MatchEventType\x12\x0e\n\x06\x65vents\x18\x04 \x01(\x05\x12\x0e\n\x06speech\x18\x05 \x01(\t\x12\x0f\n\x07\x65motion\x18\x06 \x01(\t\x12\x10\n\x08\x61nalysis\x18\x07 \x01(\t\x12\x0f\n\x07success\x18\x08 \x01(\x08\x12\x15\n\rerror_message\x18\t \x01(\t*M\n\x0cSessionState\x12\x19\n\x15SESSION_STATE_UNKNOWN\x10\x00\x12\x0b\n\x07WARMING\x10\x01\x12\t\n\x05READY\x10\x02\x12\n\n\x06\x46\x41ILED\x10\x03*m\n\x10SessionEventType\x12\x19\n\x15SESSION_EVENT_UNKNOWN\x10\x00\x12\x10\n\x0c\x45XPIRED_IDLE\x10\x01\x12\x14\n\x10\x45XPIRED_ABSOLUTE\x10\x02\x12\x0b\n\x07\x45VICTED\x10\x03\x12\t\n\x05\x45NDED\x10\x04*\x7f\n\x0eMatchEventType\x12\x17\n\x13MATCH_EVENT_UNKNOWN\x10\x00\x12\x07\n\x03HIT\x10\x01\x12\t\n\x05\x42LOCK\x10\x02\x12\t\n\x05\x43OMBO\x10\x03\x12\r\n\tHP_CHANGE\x10\x04\x12\x0f\n\x0bROUND_START\x10\x05\x12\r\n\tROUND_END\x10\x06\x12\x06\n\x02KO\x10\x07*E\n\x0fMatchOutputType\x12\x18\n\x14MATCH_OUTPUT_UNKNOWN\x10\x00\x12\n\n\x06SPEECH\x10\x01\x12\x0c\n\x08\x41NALYSIS\x10\x02\x32\xb2\t\n\x14\x43haracterChatService\x12H\n\x0bInitSession\x12\x1b.chatbot.InitSessionRequest\x1a\x1c.chatbot.InitSessionResponse\x12\x33\n\x04\x43hat\x12\x14.chatbot.ChatRequest\x1a\x15.chatbot.ChatResponse\x12>\n\nChatStream\x12\x14.chatbot.ChatRequest\x1a\x18.chatbot.ChatStreamEvent0\x01\x12G\n\x10\x41nalyzeGameState\x12\x18.chatbot.AnalysisRequest\x1a\x19.chatbot.AnalysisResponse\x12\x45\n\nEndSession\x12\x1a.chatbot.EndSessionRequest\x1a\x1b.chatbot.EndSessionResponse\x12K\n\x0cListSessions\x12\x1c.chatbot.ListSessionsRequest\x1a\x1d.chatbot.ListSessionsResponse\x12=\n\nStreamChat\x12\x14.chatbot.ChatRequest\x1a\x15.chatbot.ChatResponse(\x01\x30\x01\x12Q\n\x10GetSessionStatus\x12\x1d.chatbot.SessionStatusRequest\x1a\x1e.chatbot.SessionStatusResponse\x12N\n\x0fGetSessionStats\x12\x1c.chatbot.SessionStatsRequest\x1a\x1d.chatbot.SessionStatsResponse\x12L\n\x12WatchSessionEvents\x12\x1d.chatbot.SessionEventsRequest\x1a\x15.chatbot.SessionEvent0\x01\x12L\n\x0e\x45xportSessions\x12\x1e.chatbot.ExportSessionsRequest\x1a\x18.chatbot.SessionSnapshot0\x01\x12M\n\x0eImportSessions\x12\x18.chatbot.SessionSnapshot\x1a\x1f.chatbot.ImportSessionsResponse(\x01\x12W\n\x10\x42\x61tchInitSession\x12 .chatbot.BatchInitSessionRequest\x1a!.chatbot.BatchInitSessionResponse\x12\x42\n\tBatchChat\x12\x19.chatbot.BatchChatRequest\x1a\x1a.chatbot.BatchChatResponse\x12V\n\x15\x42\x61tchAnalyzeGameState\x12\x1d.chatbot.BatchAnalysisRequest\x1a\x1e.chatbot.BatchAnalysisResponse\x12<\n\x0bStreamMatch\x12\x13.chatbot.MatchEvent\x1a\x14.chatbot.MatchOutput(\x01\x30\x01\x32\x92\x01\n\x06Health\x12\x42\n\x05\x43heck\x12\x1b.chatbot.HealthCheckRequest\x1a\x1c.chatbot.HealthCheckResponse\x12\x44\n\x05Watch\x12\x1b.chatbot.HealthCheckRequest\x1a\x1c.chatbot.HealthCheckResponse0\x01\x42\tZ\x07\x63hatbotb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,34 +32,80 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chatbot_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z\007chatbot'
+  _globals['_SESSIONSTATE']._serialized_start=3622
+  _globals['_SESSIONSTATE']._serialized_end=3699
+  _globals['_SESSIONEVENTTYPE']._serialized_start=3701
+  _globals['_SESSIONEVENTTYPE']._serialized_end=3810
+  _globals['_MATCHEVENTTYPE']._serialized_start=3812
+  _globals['_MATCHEVENTTYPE']._serialized_end=3939
+  _globals['_MATCHOUTPUTTYPE']._serialized_start=3941
+  _globals['_MATCHOUTPUTTYPE']._serialized_end=4010
   _globals['_HEALTHCHECKREQUEST']._serialized_start=26
   _globals['_HEALTHCHECKREQUEST']._serialized_end=63
   _globals['_HEALTHCHECKRESPONSE']._serialized_start=66
   _globals['_HEALTHCHECKRESPONSE']._serialized_end=228
   _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_start=149
   _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_end=228
-  _globals['_INITSESSIONREQUEST']._serialized_start=230
-  _globals['_INITSESSIONREQUEST']._serialized_end=335
-  _globals['_INITSESSIONRESPONSE']._serialized_start=337
-  _globals['_INITSESSIONRESPONSE']._serialized_end=418
-  _globals['_CHATREQUEST']._serialized_start=420
-  _globals['_CHATREQUEST']._serialized_end=475
-  _globals['_CHATRESPONSE']._serialized_start=477
-  _globals['_CHATRESPONSE']._serialized_end=564
-  _globals['_ANALYSISREQUEST']._serialized_start=566
-  _globals['_ANALYSISREQUEST']._serialized_end=629
-  _globals['_ANALYSISRESPONSE']._serialized_start=631
-  _globals['_ANALYSISRESPONSE']._serialized_end=707
-  _globals['_ENDSESSIONREQUEST']._serialized_start=709
-  _globals['_ENDSESSIONREQUEST']._serialized_end=748
-  _globals['_ENDSESSIONRESPONSE']._serialized_start=750
-  _globals['_ENDSESSIONRESPONSE']._serialized_end=810
-  _globals['_LISTSESSIONSREQUEST']._serialized_start=812
-  _globals['_LISTSESSIONSREQUEST']._serialized_end=833
-  _globals['_LISTSESSIONSRESPONSE']._serialized_start=835
-  _globals['_LISTSESSIONSRESPONSE']._serialized_end=878
-  _globals['_CHARACTERCHATSERVICE']._serialized_start=881
-  _globals['_CHARACTERCHATSERVICE']._serialized_end=1314
-  _globals['_HEALTH']._serialized_start=1317
-  _globals['_HEALTH']._serialized_end=1463
+  _globals['_INITSESSIONREQUEST']._serialized_start=231
+  _globals['_INITSESSIONREQUEST']._serialized_end=421
+  _globals['_INITSESSIONRESPONSE']._serialized_start=423
+  _globals['_INITSESSIONRESPONSE']._serialized_end=542
+  _globals['_CHATREQUEST']._serialized_start=544
+  _globals['_CHATREQUEST']._serialized_end=619
+  _globals['_CHATRESPONSE']._serialized_start=621
+  _globals['_CHATRESPONSE']._serialized_end=748
+  _globals['_CHATSTREAMEVENT']._serialized_start=750
+  _globals['_CHATSTREAMEVENT']._serialized_end=876
+  _globals['_ANALYSISREQUEST']._serialized_start=878
+  _globals['_ANALYSISREQUEST']._serialized_end=941
+  _globals['_ANALYSISRESPONSE']._serialized_start=943
+  _globals['_ANALYSISRESPONSE']._serialized_end=1019
+  _globals['_ENDSESSIONREQUEST']._serialized_start=1021
+  _globals['_ENDSESSIONREQUEST']._serialized_end=1060
+  _globals['_ENDSESSIONRESPONSE']._serialized_start=1062
+  _globals['_ENDSESSIONRESPONSE']._serialized_end=1122
+  _globals['_LISTSESSIONSREQUEST']._serialized_start=1124
+  _globals['_LISTSESSIONSREQUEST']._serialized_end=1145
+  _globals['_LISTSESSIONSRESPONSE']._serialized_start=1147
+  _globals['_LISTSESSIONSRESPONSE']._serialized_end=1190
+  _globals['_SESSIONSTATUSREQUEST']._serialized_start=1192
+  _globals['_SESSIONSTATUSREQUEST']._serialized_end=1234
+  _globals['_SESSIONSTATUSRESPONSE']._serialized_start=1236
+  _globals['_SESSIONSTATUSRESPONSE']._serialized_end=1337
+  _globals['_SESSIONSTATSREQUEST']._serialized_start=1339
+  _globals['_SESSIONSTATSREQUEST']._serialized_end=1375
+  _globals['_SESSIONUSAGE']._serialized_start=1377
+  _globals['_SESSIONUSAGE']._serialized_end=1446
+  _globals['_SESSIONSTATSRESPONSE']._serialized_start=1449
+  _globals['_SESSIONSTATSRESPONSE']._serialized_end=2184
+  _globals['_SESSIONEVENTSREQUEST']._serialized_start=2186
+  _globals['_SESSIONEVENTSREQUEST']._serialized_end=2229
+  _globals['_SESSIONEVENT']._serialized_start=2231
+  _globals['_SESSIONEVENT']._serialized_end=2325
+  _globals['_EXPORTSESSIONSREQUEST']._serialized_start=2327
+  _globals['_EXPORTSESSIONSREQUEST']._serialized_end=2396
+  _globals['_SESSIONSNAPSHOT']._serialized_start=2399
+  _globals['_SESSIONSNAPSHOT']._serialized_end=2620
+  _globals['_IMPORTSESSIONSRESPONSE']._serialized_start=2622
+  _globals['_IMPORTSESSIONSRESPONSE']._serialized_end=2711
+  _globals['_BATCHINITSESSIONREQUEST']._serialized_start=2713
+  _globals['_BATCHINITSESSIONREQUEST']._serialized_end=2785
+  _globals['_BATCHINITSESSIONRESPONSE']._serialized_start=2787
+  _globals['_BATCHINITSESSIONRESPONSE']._serialized_end=2884
+  _globals['_BATCHCHATREQUEST']._serialized_start=2886
+  _globals['_BATCHCHATREQUEST']._serialized_end=2944
+  _globals['_BATCHCHATRESPONSE']._serialized_start=2946
+  _globals['_BATCHCHATRESPONSE']._serialized_end=3029
+  _globals['_BATCHANALYSISREQUEST']._serialized_start=3031
+  _globals['_BATCHANALYSISREQUEST']._serialized_end=3097
+  _globals['_BATCHANALYSISRESPONSE']._serialized_start=3099
+  _globals['_BATCHANALYSISRESPONSE']._serialized_end=3190
+  _globals['_MATCHEVENT']._serialized_start=3193
+  _globals['_MATCHEVENT']._serialized_end=3395
+  _globals['_MATCHOUTPUT']._serialized_start=3398
+  _globals['_MATCHOUTPUT']._serialized_end=3620
+  _globals['_CHARACTERCHATSERVICE']._serialized_start=4013
+  _globals['_CHARACTERCHATSERVICE']._serialized_end=5215
+  _globals['_HEALTH']._serialized_start=5218
+  _globals['_HEALTH']._serialized_end=5364
 # @@protoc_insertion_point(module_scope)
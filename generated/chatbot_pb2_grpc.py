@@ -45,6 +45,11 @@ class CharacterChatServiceStub(object):
                 request_serializer=chatbot__pb2.ChatRequest.SerializeToString,
                 response_deserializer=chatbot__pb2.ChatResponse.FromString,
                 _registered_method=True)
+        self.ChatStream = channel.unary_stream(
+                '/chatbot.CharacterChatService/ChatStream',
+                request_serializer=chatbot__pb2.ChatRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.ChatStreamEvent.FromString,
+                _registered_method=True)
         self.AnalyzeGameState = channel.unary_unary(
                 '/chatbot.CharacterChatService/AnalyzeGameState',
                 request_serializer=chatbot__pb2.AnalysisRequest.SerializeToString,
@@ -65,6 +70,51 @@ class CharacterChatServiceStub(object):
                 request_serializer=chatbot__pb2.ChatRequest.SerializeToString,
                 response_deserializer=chatbot__pb2.ChatResponse.FromString,
                 _registered_method=True)
+        self.GetSessionStatus = channel.unary_unary(
+                '/chatbot.CharacterChatService/GetSessionStatus',
+                request_serializer=chatbot__pb2.SessionStatusRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.SessionStatusResponse.FromString,
+                _registered_method=True)
+        self.GetSessionStats = channel.unary_unary(
+                '/chatbot.CharacterChatService/GetSessionStats',
+                request_serializer=chatbot__pb2.SessionStatsRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.SessionStatsResponse.FromString,
+                _registered_method=True)
+        self.WatchSessionEvents = channel.unary_stream(
+                '/chatbot.CharacterChatService/WatchSessionEvents',
+                request_serializer=chatbot__pb2.SessionEventsRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.SessionEvent.FromString,
+                _registered_method=True)
+        self.ExportSessions = channel.unary_stream(
+                '/chatbot.CharacterChatService/ExportSessions',
+                request_serializer=chatbot__pb2.ExportSessionsRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.SessionSnapshot.FromString,
+                _registered_method=True)
+        self.ImportSessions = channel.stream_unary(
+                '/chatbot.CharacterChatService/ImportSessions',
+                request_serializer=chatbot__pb2.SessionSnapshot.SerializeToString,
+                response_deserializer=chatbot__pb2.ImportSessionsResponse.FromString,
+                _registered_method=True)
+        self.BatchInitSession = channel.unary_unary(
+                '/chatbot.CharacterChatService/BatchInitSession',
+                request_serializer=chatbot__pb2.BatchInitSessionRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.BatchInitSessionResponse.FromString,
+                _registered_method=True)
+        self.BatchChat = channel.unary_unary(
+                '/chatbot.CharacterChatService/BatchChat',
+                request_serializer=chatbot__pb2.BatchChatRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.BatchChatResponse.FromString,
+                _registered_method=True)
+        self.BatchAnalyzeGameState = channel.unary_unary(
+                '/chatbot.CharacterChatService/BatchAnalyzeGameState',
+                request_serializer=chatbot__pb2.BatchAnalysisRequest.SerializeToString,
+                response_deserializer=chatbot__pb2.BatchAnalysisResponse.FromString,
+                _registered_method=True)
+        self.StreamMatch = channel.stream_stream(
+                '/chatbot.CharacterChatService/StreamMatch',
+                request_serializer=chatbot__pb2.MatchEvent.SerializeToString,
+                response_deserializer=chatbot__pb2.MatchOutput.FromString,
+                _registered_method=True)
 
 
 class CharacterChatServiceServicer(object):
@@ -85,6 +135,13 @@ class CharacterChatServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ChatStream(self, request, context):
+        """채팅 대화 (토큰 스트리밍) - 대사 조각은 생성되는 대로, 감정은 완성되는 즉시 전송
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AnalyzeGameState(self, request, context):
         """게임 상태 분석
         """
@@ -107,7 +164,70 @@ class CharacterChatServiceServicer(object):
         raise NotImplementedError('Method not implemented!')
 
     def StreamChat(self, request_iterator, context):
-        """스트림 채팅 (실시간)
+        """스트림 채팅 (실시간) - 세션 간에는 동시에 처리되어 응답 순서가 요청 순서와 다를 수 있음 (같은 세션은 순서 유지)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSessionStatus(self, request, context):
+        """세션 준비 상태 조회
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSessionStats(self, request, context):
+        """세션 통계 조회 (활성/휴면 세션 수, 휴면·복원 횟수와 소요 시간, 메모리 사용량과 가장 큰 세션)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchSessionEvents(self, request, context):
+        """세션 이벤트 구독 (만료, 상한에 의한 제거, 종료)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportSessions(self, request, context):
+        """세션 내보내기 (drain이면 새 세션을 막고 진행 중인 턴이 끝난 뒤 내보냄)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportSessions(self, request_iterator, context):
+        """ExportSessions로 받은 세션 가져오기
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchInitSession(self, request, context):
+        """여러 세션 일괄 초기화 - 항목별 결과를 요청 순서대로 반환
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchChat(self, request, context):
+        """여러 세션 일괄 채팅 - 항목별 결과를 요청 순서대로 반환
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchAnalyzeGameState(self, request, context):
+        """여러 세션 일괄 게임 상태 분석 - 항목별 결과를 요청 순서대로 반환
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamMatch(self, request_iterator, context):
+        """매치 이벤트 스트림 - 프레임 단위 이벤트를 보내면 서버 정책이 고른 이벤트에서만 대사/분석을 생성
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -126,6 +246,11 @@ def add_CharacterChatServiceServicer_to_server(servicer, server):
                     request_deserializer=chatbot__pb2.ChatRequest.FromString,
                     response_serializer=chatbot__pb2.ChatResponse.SerializeToString,
             ),
+            'ChatStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ChatStream,
+                    request_deserializer=chatbot__pb2.ChatRequest.FromString,
+                    response_serializer=chatbot__pb2.ChatStreamEvent.SerializeToString,
+            ),
             'AnalyzeGameState': grpc.unary_unary_rpc_method_handler(
                     servicer.AnalyzeGameState,
                     request_deserializer=chatbot__pb2.AnalysisRequest.FromString,
@@ -146,6 +271,51 @@ def add_CharacterChatServiceServicer_to_server(servicer, server):
                     request_deserializer=chatbot__pb2.ChatRequest.FromString,
                     response_serializer=chatbot__pb2.ChatResponse.SerializeToString,
             ),
+            'GetSessionStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetSessionStatus,
+                    request_deserializer=chatbot__pb2.SessionStatusRequest.FromString,
+                    response_serializer=chatbot__pb2.SessionStatusResponse.SerializeToString,
+            ),
+            'GetSessionStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetSessionStats,
+                    request_deserializer=chatbot__pb2.SessionStatsRequest.FromString,
+                    response_serializer=chatbot__pb2.SessionStatsResponse.SerializeToString,
+            ),
+            'WatchSessionEvents': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchSessionEvents,
+                    request_deserializer=chatbot__pb2.SessionEventsRequest.FromString,
+                    response_serializer=chatbot__pb2.SessionEvent.SerializeToString,
+            ),
+            'ExportSessions': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportSessions,
+                    request_deserializer=chatbot__pb2.ExportSessionsRequest.FromString,
+                    response_serializer=chatbot__pb2.SessionSnapshot.SerializeToString,
+            ),
+            'ImportSessions': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportSessions,
+                    request_deserializer=chatbot__pb2.SessionSnapshot.FromString,
+                    response_serializer=chatbot__pb2.ImportSessionsResponse.SerializeToString,
+            ),
+            'BatchInitSession': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchInitSession,
+                    request_deserializer=chatbot__pb2.BatchInitSessionRequest.FromString,
+                    response_serializer=chatbot__pb2.BatchInitSessionResponse.SerializeToString,
+            ),
+            'BatchChat': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchChat,
+                    request_deserializer=chatbot__pb2.BatchChatRequest.FromString,
+                    response_serializer=chatbot__pb2.BatchChatResponse.SerializeToString,
+            ),
+            'BatchAnalyzeGameState': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchAnalyzeGameState,
+                    request_deserializer=chatbot__pb2.BatchAnalysisRequest.FromString,
+                    response_serializer=chatbot__pb2.BatchAnalysisResponse.SerializeToString,
+            ),
+            'StreamMatch': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamMatch,
+                    request_deserializer=chatbot__pb2.MatchEvent.FromString,
+                    response_serializer=chatbot__pb2.MatchOutput.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'chatbot.CharacterChatService', rpc_method_handlers)
@@ -212,6 +382,33 @@ class CharacterChatService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ChatStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chatbot.CharacterChatService/ChatStream',
+            chatbot__pb2.ChatRequest.SerializeToString,
+            chatbot__pb2.ChatStreamEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def AnalyzeGameState(request,
             target,
@@ -320,6 +517,249 @@ class CharacterChatService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetSessionStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chatbot.CharacterChatService/GetSessionStatus',
+            chatbot__pb2.SessionStatusRequest.SerializeToString,
+            chatbot__pb2.SessionStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetSessionStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chatbot.CharacterChatService/GetSessionStats',
+            chatbot__pb2.SessionStatsRequest.SerializeToString,
+            chatbot__pb2.SessionStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchSessionEvents(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chatbot.CharacterChatService/WatchSessionEvents',
+            chatbot__pb2.SessionEventsRequest.SerializeToString,
+            chatbot__pb2.SessionEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ExportSessions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chatbot.CharacterChatService/ExportSessions',
+            chatbot__pb2.ExportSessionsRequest.SerializeToString,
+            chatbot__pb2.SessionSnapshot.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ImportSessions(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/chatbot.CharacterChatService/ImportSessions',
+            chatbot__pb2.SessionSnapshot.SerializeToString,
+            chatbot__pb2.ImportSessionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchInitSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chatbot.CharacterChatService/BatchInitSession',
+            chatbot__pb2.BatchInitSessionRequest.SerializeToString,
+            chatbot__pb2.BatchInitSessionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchChat(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chatbot.CharacterChatService/BatchChat',
+            chatbot__pb2.BatchChatRequest.SerializeToString,
+            chatbot__pb2.BatchChatResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchAnalyzeGameState(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chatbot.CharacterChatService/BatchAnalyzeGameState',
+            chatbot__pb2.BatchAnalysisRequest.SerializeToString,
+            chatbot__pb2.BatchAnalysisResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamMatch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/chatbot.CharacterChatService/StreamMatch',
+            chatbot__pb2.MatchEvent.SerializeToString,
+            chatbot__pb2.MatchOutput.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class HealthStub(object):
     """Health Service - 서비스 상태 관리
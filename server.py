@@ -1,17 +1,34 @@
+import argparse
 import asyncio
+import functools
 import logging
+import multiprocessing
+import os
 import signal
 import sys
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict
+from typing import Callable, Dict, List, Optional
 
 import grpc
 from grpc import aio
 
+from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
-
+from langgraph.checkpoint.memory import MemorySaver
+
+from core.checkpoint import LatestCheckpointSaver
+from core.concepts import CHARACTERS
+from core.context import ContextPolicy
+from core.matchup_cache import MatchupCache
+from core.prompts import PromptRegistry
+from core.limiter import LLMLimiter
+from core.match_policy import MatchPolicy
+from core.session_store import SQLiteSessionStore
 from core.session_manager import SessionManager
+from core.snapshot import read_snapshot, write_snapshot
 from services.character_chat_service import CharacterChatServicer
+from services.gateway import SessionGateway, read_backends
+from services.session_router import SessionRouter
 from utils.config import Config
 
 # 실제 protobuf 사용 시 임포트
@@ -96,12 +113,22 @@ class HealthServicer(chatbot_pb2_grpc.HealthServicer):
 class GRPCServer:
     """gRPC 서버 클래스"""
 
-    def __init__(self, port: int = 50051, max_workers: int = 10):
+    def __init__(
+            self,
+            port: int = 50051,
+            max_workers: int = 10,
+            host: str = "[::]",
+            llm_factory: Optional[Callable[[], BaseChatModel]] = None
+    ):
         self.port = port
         self.max_workers = max_workers
+        self.host = host
+        self.llm_factory = llm_factory
         self.server = None
         self.session_manager = None
         self.health_servicer = None
+        self.snapshot_path = ""
+        self.drain_timeout = 30.0
         self._shutdown_event = asyncio.Event()
 
         # 로깅 설정
@@ -113,6 +140,8 @@ class GRPCServer:
 
     async def _create_llm(self):
         """LLM 인스턴스 생성"""
+        if self.llm_factory is not None:
+            return self.llm_factory()
         config = Config()
         return ChatGoogleGenerativeAI(
             model=config.model,
@@ -124,8 +153,36 @@ class GRPCServer:
         """서버 시작"""
         try:
             # LLM 및 세션 매니저 초기화
+            config = Config()
             llm = await self._create_llm()
-            self.session_manager = SessionManager(llm=llm, session_timeout_minutes=60)
+            self.session_manager = SessionManager(
+                llm=llm,
+                session_timeout_minutes=config.session_timeout_minutes,
+                absolute_timeout_minutes=config.session_absolute_timeout_minutes,
+                max_pending_turns=config.session_max_pending_turns,
+                matchup_cache=MatchupCache(cache_dir=config.matchup_cache_dir or None),
+                prompts=PromptRegistry(llm, CHARACTERS, languages=config.prompt_languages),
+                context_policy=ContextPolicy(
+                    recent_turns=config.context_recent_turns, max_tokens=config.context_max_tokens
+                ) if config.context_recent_turns > 0 else None,
+                checkpointer=MemorySaver() if config.checkpoint_retention == "all" else LatestCheckpointSaver(),
+                session_store=SQLiteSessionStore(
+                    config.session_store_path, hot_capacity=config.session_hot_capacity
+                ) if config.session_store_path else None,
+                hibernate_after_minutes=config.session_hibernate_minutes,
+                max_sessions=config.session_max_active,
+                max_memory_mb=config.session_max_memory_mb,
+                eviction_policy=config.session_eviction_policy,
+                registry_stripes=config.session_registry_stripes,
+                llm_limiter=LLMLimiter(
+                    max_concurrent=config.llm_max_concurrent, max_queue=config.llm_max_queue,
+                    queue_timeout=config.llm_queue_timeout_seconds
+                ) if config.llm_max_concurrent > 0 else None,
+                analysis_coalesce_seconds=config.analysis_coalesce_ms / 1000
+            )
+            self.snapshot_path = config.session_snapshot_path
+            self.drain_timeout = config.session_drain_timeout_seconds
+            self._import_snapshot()
 
             # gRPC 서버 생성
             self.server = aio.server(ThreadPoolExecutor(max_workers=self.max_workers))
@@ -135,11 +192,23 @@ class GRPCServer:
             chatbot_pb2_grpc.add_HealthServicer_to_server(self.health_servicer, self.server)
 
             # 메인 서비스 등록
-            service_impl = CharacterChatServicer(self.session_manager)
+            service_impl = CharacterChatServicer(
+                self.session_manager, stream_chat_concurrency=config.stream_chat_concurrency,
+                batch_max_items=config.batch_max_items, batch_parallelism=config.batch_parallelism,
+                match_policy_factory=functools.partial(
+                    MatchPolicy,
+                    speech_interval=config.match_speech_interval_seconds,
+                    critical_interval=config.match_critical_interval_seconds,
+                    analysis_interval=config.match_analysis_interval_seconds,
+                    analysis_after_events=config.match_analysis_after_events,
+                    combo_hits=config.match_combo_hits,
+                    low_hp_ratio=config.match_low_hp_ratio
+                )
+            )
             chatbot_pb2_grpc.add_CharacterChatServiceServicer_to_server(service_impl, self.server)
 
             # 리스닝 포트 설정
-            listen_addr = f'[::]:{self.port}'
+            listen_addr = f'{self.host}:{self.port}'
             self.server.add_insecure_port(listen_addr)
 
             # 서버 시작
@@ -184,15 +253,36 @@ class GRPCServer:
         # 종료 이벤트 설정
         self._shutdown_event.set()
 
+    def _import_snapshot(self):
+        """이전 인스턴스가 남긴 세션 스냅샷 가져오기 - 다시 가져오지 않도록 파일 이름을 바꿈"""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        result = self.session_manager.import_sessions(read_snapshot(self.snapshot_path))
+        os.replace(self.snapshot_path, f"{self.snapshot_path}.imported")
+        self.logger.info(f"세션 스냅샷을 가져왔습니다: {result['imported']}개 (건너뜀 {result['skipped']}개)")
+
     async def _cleanup(self):
-        """정리 작업"""
+        """정리 작업 - 드레인 후 세션을 스냅샷으로 기록"""
+        if self.session_manager:
+            # 새 세션은 받지 않고 진행 중인 턴은 마저 처리
+            self.session_manager.start_drain()
+
         if self.server:
             self.logger.info("gRPC 서버를 종료합니다...")
             try:
-                await self.server.stop(grace=5.0)
+                await self.server.stop(grace=max(self.drain_timeout, 5.0))
             except Exception as e:
                 self.logger.error(f"서버 종료 중 오류: {e}")
 
+        if self.session_manager and self.snapshot_path:
+            try:
+                if not await self.session_manager.drain(timeout=5.0):
+                    self.logger.warning("진행 중인 작업이 남은 상태로 세션을 기록합니다")
+                count = write_snapshot(self.snapshot_path, self.session_manager.export_sessions())
+                self.logger.info(f"세션 {count}개를 {self.snapshot_path}에 기록했습니다")
+            except Exception as e:
+                self.logger.error(f"세션 스냅샷 기록 중 오류: {e}")
+
         if self.session_manager:
             try:
                 self.session_manager.shutdown()
@@ -201,12 +291,30 @@ class GRPCServer:
 
         self.logger.info("서버 종료 완료")
 
+    async def _start_router_server(self, router: SessionRouter) -> str:
+        """router가 CharacterChatService를 처리하는 gRPC 서버 시작 - 리스닝 주소 반환"""
+        self.server = aio.server()
+        self.server.add_generic_rpc_handlers((router.handler(),))
+        self.health_servicer = HealthServicer()
+        chatbot_pb2_grpc.add_HealthServicer_to_server(self.health_servicer, self.server)
+
+        listen_addr = f'{self.host}:{self.port}'
+        self.server.add_insecure_port(listen_addr)
+        await self.server.start()
+
+        self.health_servicer.set_status("", chatbot_pb2.HealthCheckResponse.SERVING)
+        self.health_servicer.set_status("chatbot.CharacterChatService",
+                                        chatbot_pb2.HealthCheckResponse.SERVING)
+        return listen_addr
+
     def _setup_signal_handlers(self):
         """시그널 핸들러 설정"""
+        loop = asyncio.get_running_loop()
+
         def signal_handler(signum, frame):
             self.logger.info(f"종료 시그널 수신: {signum}")
-            # 비동기 방식으로 종료 처리
-            asyncio.create_task(self.stop())
+            # 비동기 방식으로 종료 처리 (처리 중인 요청이 없어 루프가 대기 중이어도 깨어나도록 call_soon_threadsafe 사용)
+            loop.call_soon_threadsafe(lambda: asyncio.ensure_future(self.stop()))
 
         # Docker 환경에서 주로 사용되는 시그널들
         for sig in [signal.SIGTERM, signal.SIGINT]:
@@ -216,6 +324,190 @@ class GRPCServer:
                 self.logger.warning(f"시그널 {sig} 핸들러 설정 실패: {e}")
 
 
+def run_worker(index: int, port: int, llm_factory: Optional[Callable[[], BaseChatModel]] = None):
+    """워커 프로세스 진입점 - 127.0.0.1:port에서 세션 파티션 하나를 담당"""
+    # 워커마다 별도의 저장소와 스냅샷 파일 사용
+    for name in ("SESSION_STORE_PATH", "SESSION_SNAPSHOT_PATH"):
+        if os.getenv(name):
+            os.environ[name] = f"{os.environ[name]}.worker{index}"
+
+    server = GRPCServer(port=port, host="127.0.0.1", max_workers=Config().max_workers, llm_factory=llm_factory)
+    try:
+        asyncio.run(server.start())
+    except KeyboardInterrupt:
+        pass
+
+
+class MultiProcessServer(GRPCServer):
+    """워커 프로세스 N개와 앞단 디스패처로 이루어진 서버
+
+    각 워커는 독립된 SessionManager를 가진 GRPCServer로 127.0.0.1의 내부 포트에서 동작하고,
+    디스패처는 공개 포트에서 요청의 session_id로 소유 워커를 정해 요청을 그대로 전달한다 (SessionRouter).
+    세션은 생성될 때부터 한 워커에만 존재하므로 프로세스 간에 세션 상태를 공유하지 않는다.
+    """
+
+    def __init__(
+            self,
+            port: int = 50051,
+            workers: int = 2,
+            worker_base_port: Optional[int] = None,
+            llm_factory: Optional[Callable[[], BaseChatModel]] = None
+    ):
+        super().__init__(port=port, llm_factory=llm_factory)
+        base_port = worker_base_port if worker_base_port is not None else port + 1
+        self.worker_ports: List[int] = [base_port + index for index in range(workers)]
+        self.processes: List[multiprocessing.Process] = []
+        self.router: Optional[SessionRouter] = None
+
+    async def start(self):
+        """워커 시작 후 디스패처 시작"""
+        try:
+            config = Config()
+            self.drain_timeout = config.session_drain_timeout_seconds
+            # gRPC 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            for index, port in enumerate(self.worker_ports):
+                process = context.Process(
+                    target=run_worker, args=(index, port, self.llm_factory), name=f"chatbot-worker-{index}"
+                )
+                process.start()
+                self.processes.append(process)
+            await self._wait_for_workers(timeout=120.0)
+
+            self.router = SessionRouter([f"127.0.0.1:{port}" for port in self.worker_ports],
+                                        stream_chat_concurrency=config.stream_chat_concurrency,
+                                        batch_max_items=config.batch_max_items,
+                                        batch_parallelism=config.batch_parallelism)
+            listen_addr = await self._start_router_server(self.router)
+            self.logger.info(f"디스패처가 {listen_addr}에서 시작되었습니다 (워커 {len(self.processes)}개)")
+
+            self._setup_signal_handlers()
+            await self._shutdown_event.wait()
+
+        except Exception as e:
+            self.logger.error(f"서버 시작 실패: {e}")
+            raise
+        finally:
+            await self._cleanup()
+
+    async def _wait_for_workers(self, timeout: float):
+        """모든 워커의 health check가 SERVING이 될 때까지 대기"""
+        deadline = asyncio.get_running_loop().time() + timeout
+        for process, port in zip(self.processes, self.worker_ports):
+            async with aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = chatbot_pb2_grpc.HealthStub(channel)
+                while True:
+                    if not process.is_alive():
+                        raise RuntimeError(f"{process.name} exited with code {process.exitcode}")
+                    try:
+                        response = await stub.Check(chatbot_pb2.HealthCheckRequest(service=""), timeout=1.0)
+                        if response.status == chatbot_pb2.HealthCheckResponse.SERVING:
+                            break
+                    except aio.AioRpcError:
+                        pass
+                    if asyncio.get_running_loop().time() > deadline:
+                        raise TimeoutError(f"{process.name} did not become ready in {timeout}s")
+                    await asyncio.sleep(0.2)
+
+    async def _cleanup(self):
+        """디스패처를 먼저 닫고 워커에 종료 시그널 전달 (워커는 각자 드레인 후 종료)"""
+        if self.server:
+            try:
+                await self.server.stop(grace=max(self.drain_timeout, 5.0))
+            except Exception as e:
+                self.logger.error(f"디스패처 종료 중 오류: {e}")
+        if self.router:
+            await self.router.close()
+
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            await asyncio.to_thread(process.join, self.drain_timeout + 10.0)
+            if process.is_alive():
+                self.logger.warning(f"{process.name}이(가) 종료되지 않아 강제 종료합니다")
+                process.kill()
+
+        self.logger.info("서버 종료 완료")
+
+
+class GatewayServer(GRPCServer):
+    """여러 서버 노드 앞의 단일 엔드포인트 (SessionGateway)
+
+    노드 목록은 GATEWAY_BACKENDS 또는 GATEWAY_BACKENDS_FILE에서 읽는다.
+    파일을 쓰면 SIGHUP을 받을 때마다 다시 읽어 노드 추가/제거에 맞춰 세션을 옮긴다.
+    """
+
+    def __init__(self, port: int = 50051, backends: Optional[List[str]] = None, backends_file: str = ""):
+        super().__init__(port=port)
+        self.backends = backends or []
+        self.backends_file = backends_file
+        self.router: Optional[SessionGateway] = None
+
+    async def start(self):
+        """게이트웨이 시작"""
+        try:
+            config = Config()
+            self.drain_timeout = config.session_drain_timeout_seconds
+            if self.backends_file:
+                self.backends = read_backends(path=self.backends_file)
+            if not self.backends:
+                raise ValueError("GATEWAY_BACKENDS or GATEWAY_BACKENDS_FILE is required in gateway mode")
+
+            self.router = SessionGateway(self.backends, replicas=config.gateway_ring_replicas,
+                                         pause_timeout=self.drain_timeout,
+                                         stream_chat_concurrency=config.stream_chat_concurrency,
+                                         batch_max_items=config.batch_max_items,
+                                         batch_parallelism=config.batch_parallelism)
+            listen_addr = await self._start_router_server(self.router)
+            self.logger.info(f"게이트웨이가 {listen_addr}에서 시작되었습니다 (노드 {', '.join(self.backends)})")
+
+            self._setup_signal_handlers()
+            await self._shutdown_event.wait()
+
+        except Exception as e:
+            self.logger.error(f"서버 시작 실패: {e}")
+            raise
+        finally:
+            await self._cleanup()
+
+    async def reload_backends(self):
+        """노드 목록 파일을 다시 읽어 적용"""
+        try:
+            backends = read_backends(path=self.backends_file)
+            moved = await self.router.set_backends(backends)
+            self.logger.info(f"노드 목록을 다시 읽었습니다: {', '.join(backends)} (옮긴 세션 {moved}개)")
+        except Exception as e:
+            self.logger.error(f"노드 목록 갱신 실패: {e}")
+
+    def _setup_signal_handlers(self):
+        super()._setup_signal_handlers()
+        if not self.backends_file:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        def reload_handler(signum, frame):
+            loop.call_soon_threadsafe(lambda: asyncio.ensure_future(self.reload_backends()))
+
+        try:
+            signal.signal(signal.SIGHUP, reload_handler)
+        except (AttributeError, OSError, ValueError) as e:
+            self.logger.warning(f"SIGHUP 핸들러 설정 실패: {e}")
+
+    async def _cleanup(self):
+        """게이트웨이 종료 (노드는 각자 종료)"""
+        if self.server:
+            try:
+                await self.server.stop(grace=max(self.drain_timeout, 5.0))
+            except Exception as e:
+                self.logger.error(f"게이트웨이 종료 중 오류: {e}")
+        if self.router:
+            await self.router.close()
+
+        self.logger.info("서버 종료 완료")
+
+
 class TestGRPCServer:
     """테스트용 gRPC 서버 (protobuf 없이 동작)"""
 
@@ -320,8 +612,17 @@ class TestGRPCServer:
 
 
 async def main():
-    """메인 함수"""
-    if len(sys.argv) > 1 and sys.argv[1] == "test":
+    """메인 함수
+
+    python server.py [test | gateway] [--workers N]
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mode", nargs="?", choices=["test", "gateway"])
+    parser.add_argument("--workers", type=int, default=Config().server_workers,
+                        help="워커 프로세스 수 (1이면 단일 프로세스)")
+    args = parser.parse_args()
+
+    if args.mode == "test":
         # 테스트 모드
         test_server = TestGRPCServer()
         try:
@@ -329,8 +630,15 @@ async def main():
         except KeyboardInterrupt:
             test_server.stop()
     else:
-        # 실제 서버 모드
-        server = GRPCServer(port=50051, max_workers=10)
+        # 실제 서버 모드 (--workers가 2 이상이면 디스패처 + 워커 프로세스)
+        config = Config()
+        if args.mode == "gateway":
+            server = GatewayServer(port=config.grpc_port, backends=read_backends(config.gateway_backends),
+                                   backends_file=config.gateway_backends_file)
+        elif args.workers > 1:
+            server = MultiProcessServer(port=config.grpc_port, workers=args.workers)
+        else:
+            server = GRPCServer(port=config.grpc_port, max_workers=config.max_workers)
         try:
             await server.start()
         except KeyboardInterrupt:
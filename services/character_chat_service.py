@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, List, Optional, Set, Tuple
 
 import grpc
 from grpc import aio
@@ -8,30 +8,70 @@ from grpc import aio
 # Generated protobuf imports - 실제 환경에서는 protobuf 컴파일 후 사용
 from generated import chatbot_pb2, chatbot_pb2_grpc
 
-from core.session_manager import SessionManager
-from core.agent import AgentException
+from core.session_manager import SessionManager, SessionDrainingException
+from core.agent import AgentException, DeadlineExceededException
+from core.mailbox import SessionBusyException
+from core.limiter import LLMOverloadedException
+from core.match_policy import MatchAction, MatchEvent, MatchEventType, MatchPolicy, MatchTrigger
+from services.stream_dispatch import dispatch_by_key
+
+# proto MatchEventType 값 -> 정책의 이벤트 종류 (MATCH_EVENT_UNKNOWN과 이 서버가 모르는 값은 없음)
+_MATCH_EVENT_TYPES = {chatbot_pb2.MatchEventType.Value(event_type.value): event_type for event_type in MatchEventType}
+
+
+class _ItemContext:
+    """일괄 요청의 항목 하나를 처리할 때 쓰는 context - 상태 코드는 항목별로 기록하고 deadline은 원래 호출을 따름"""
+
+    def __init__(self, context):
+        self._context = context
+        self.code = grpc.StatusCode.OK
+        self.details = ""
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+    def time_remaining(self):
+        return self._context.time_remaining()
 
 
 class CharacterChatService:
     """gRPC CharacterChatService 구현"""
 
-    def __init__(self, session_manager: SessionManager):
+    def __init__(self, session_manager: SessionManager, stream_chat_concurrency: int = 8,
+                 batch_max_items: int = 256, batch_parallelism: int = 16,
+                 match_policy_factory: Callable[[], MatchPolicy] = MatchPolicy):
         self.session_manager = session_manager
+        # StreamChat 스트림 하나에서 동시에 처리할 수 있는 요청 수
+        self.stream_chat_concurrency = stream_chat_concurrency
+        # 일괄 요청 하나에 담을 수 있는 항목 수와 동시에 처리할 항목 수
+        self.batch_max_items = batch_max_items
+        self.batch_parallelism = batch_parallelism
+        # StreamMatch 스트림마다 새로 만드는 이벤트 정책과 누적 이벤트/출력 수
+        self.match_policy_factory = match_policy_factory
+        self.match_stats = {"match_events": 0, "match_speeches": 0, "match_analyses": 0}
 
     async def InitSession(self, request, context):
         """세션 초기화"""
         try:
-            session_id = self.session_manager.create_session(
+            session_id = await self.session_manager.create_session(
                 session_id=request.session_id if request.session_id else None,
                 character_role=request.character_role,
                 opponent_role=request.opponent_role,
-                language=request.language
+                language=request.language,
+                background=request.background_init,
+                idle_timeout_seconds=request.idle_timeout_seconds,
+                max_lifetime_seconds=request.max_lifetime_seconds
             )
+            state = self.session_manager.get_session_state(session_id)
 
             return chatbot_pb2.InitSessionResponse(
                 success=True,
                 session_id=session_id,
-                error_message=""
+                error_message="",
+                state=chatbot_pb2.SessionState.Value(state.value)
             )
 
             # # protobuf 없이 테스트용 반환
@@ -41,6 +81,29 @@ class CharacterChatService:
             #     "error_message": ""
             # }
 
+        except LLMOverloadedException as e:
+            # LLM 호출 대기열이 가득 참 - 쌓아 두지 않고 바로 거절
+            logging.warning(f"Session initialization rejected: {e}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(str(e))
+
+            return chatbot_pb2.InitSessionResponse(
+                success=False,
+                session_id="",
+                error_message=str(e)
+            )
+
+        except SessionDrainingException as e:
+            # 드레인 중 - 클라이언트는 다른 인스턴스로 재시도
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details(str(e))
+
+            return chatbot_pb2.InitSessionResponse(
+                success=False,
+                session_id="",
+                error_message=str(e)
+            )
+
         except AgentException as e:
             logging.error(f"Session initialization failed: {e}")
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
@@ -72,8 +135,11 @@ class CharacterChatService:
     async def Chat(self, request, context):
         """채팅 대화"""
         try:
-            agent = self.session_manager.get_session(request.session_id)
-            response = agent.chat(request.user_message)
+            # 클라이언트 deadline의 남은 시간을 LLM 호출 timeout으로 전달
+            response = await self.session_manager.submit(
+                request.session_id, lambda agent: agent.achat(request.user_message),
+                timeout=context.time_remaining()
+            )
 
             return chatbot_pb2.ChatResponse(
                 speech=response.speech,
@@ -89,6 +155,30 @@ class CharacterChatService:
             #     "error_message": ""
             # }
 
+        except DeadlineExceededException as e:
+            logging.warning(f"Chat abandoned: {e}")
+            context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+            context.set_details(str(e))
+
+            return chatbot_pb2.ChatResponse(
+                speech="",
+                emotion="",
+                success=False,
+                error_message=str(e)
+            )
+
+        except (SessionBusyException, LLMOverloadedException) as e:
+            logging.warning(f"Chat rejected: {e}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(str(e))
+
+            return chatbot_pb2.ChatResponse(
+                speech="",
+                emotion="",
+                success=False,
+                error_message=str(e)
+            )
+
         except AgentException as e:
             logging.error(f"Chat failed: {e}")
             context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -113,11 +203,67 @@ class CharacterChatService:
                 "error_message": "Internal server error"
             }
 
+    async def ChatStream(self, request, context):
+        """채팅 대화 (토큰 스트리밍) - 대사 조각과 감정을 생성되는 대로 보내고, 완성된 응답으로 끝냄"""
+        events: asyncio.Queue = asyncio.Queue()
+        turn = asyncio.ensure_future(self.session_manager.submit(
+            request.session_id,
+            lambda agent: agent.achat(request.user_message, on_event=lambda field, value: events.put_nowait((field, value))),
+            timeout=context.time_remaining()
+        ))
+        turn.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                field, value = event
+                if field == "speech":
+                    yield chatbot_pb2.ChatStreamEvent(speech_delta=value)
+                else:
+                    yield chatbot_pb2.ChatStreamEvent(emotion=value)
+
+            response = turn.result()
+            yield chatbot_pb2.ChatStreamEvent(
+                done=True,
+                speech=response.speech,
+                emotion=response.emotion,
+                success=True
+            )
+
+        except DeadlineExceededException as e:
+            logging.warning(f"Chat stream abandoned: {e}")
+            context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+            context.set_details(str(e))
+            yield chatbot_pb2.ChatStreamEvent(done=True, success=False, error_message=str(e))
+
+        except (SessionBusyException, LLMOverloadedException) as e:
+            logging.warning(f"Chat stream rejected: {e}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(str(e))
+            yield chatbot_pb2.ChatStreamEvent(done=True, success=False, error_message=str(e))
+
+        except AgentException as e:
+            logging.error(f"Chat stream failed: {e}")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            yield chatbot_pb2.ChatStreamEvent(done=True, success=False, error_message=str(e))
+
+        except Exception as e:
+            logging.error(f"Unexpected error in ChatStream: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+            yield chatbot_pb2.ChatStreamEvent(done=True, success=False, error_message="Internal server error")
+
+        finally:
+            # 클라이언트가 끊으면 진행 중인 턴도 취소 (대화 기록은 턴 이전으로 되돌아감)
+            if not turn.done():
+                turn.cancel()
+
     async def AnalyzeGameState(self, request, context):
         """게임 상태 분석"""
         try:
-            agent = self.session_manager.get_session(request.session_id)
-            analysis = agent.analyze_game_state(request.opponent_actions)
+            # 같은 세션의 분석 요청이 몰리면 행동을 합쳐 한 번만 분석
+            analysis = await self.session_manager.analyze_game_state(
+                request.session_id, request.opponent_actions, timeout=context.time_remaining()
+            )
 
             return chatbot_pb2.AnalysisResponse(
                 analysis=analysis,
@@ -131,6 +277,28 @@ class CharacterChatService:
             #     "error_message": ""
             # }
 
+        except DeadlineExceededException as e:
+            logging.warning(f"Game state analysis abandoned: {e}")
+            context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+            context.set_details(str(e))
+
+            return chatbot_pb2.AnalysisResponse(
+                analysis="",
+                success=False,
+                error_message=str(e)
+            )
+
+        except (SessionBusyException, LLMOverloadedException) as e:
+            logging.warning(f"Game state analysis rejected: {e}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(str(e))
+
+            return chatbot_pb2.AnalysisResponse(
+                analysis="",
+                success=False,
+                error_message=str(e)
+            )
+
         except AgentException as e:
             logging.error(f"Game state analysis failed: {e}")
             context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -209,47 +377,194 @@ class CharacterChatService:
                 "session_ids": []
             }
 
+    async def GetSessionStatus(self, request, context):
+        """세션 준비 상태 조회"""
+        try:
+            state = self.session_manager.get_session_state(request.session_id)
+
+            return chatbot_pb2.SessionStatusResponse(
+                success=True,
+                state=chatbot_pb2.SessionState.Value(state.value),
+                error_message=self.session_manager.get_session_error(request.session_id)
+            )
+
+        except AgentException as e:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+
+            return chatbot_pb2.SessionStatusResponse(
+                success=False,
+                state=chatbot_pb2.SESSION_STATE_UNKNOWN,
+                error_message=str(e)
+            )
+
+        except Exception as e:
+            logging.error(f"Unexpected error in GetSessionStatus: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.SessionStatusResponse(
+                success=False,
+                state=chatbot_pb2.SESSION_STATE_UNKNOWN,
+                error_message="Internal server error"
+            )
+
+    async def GetSessionStats(self, request, context):
+        """세션 통계 조회"""
+        try:
+            accounting = self.session_manager.get_memory_accounting(top_n=request.top_n or 10)
+            largest = [chatbot_pb2.SessionUsage(**usage) for usage in accounting.pop("largest_sessions")]
+            stats = {
+                **self.session_manager.get_hibernation_stats(), **accounting, **self.session_manager.get_llm_stats(),
+                **self.session_manager.get_turn_stats(), **self.match_stats
+            }
+
+            return chatbot_pb2.SessionStatsResponse(**stats, largest_sessions=largest)
+
+        except Exception as e:
+            logging.error(f"Unexpected error in GetSessionStats: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.SessionStatsResponse()
+
+    async def WatchSessionEvents(self, request, context):
+        """세션 이벤트 구독 - 클라이언트가 끊을 때까지 이벤트를 스트리밍"""
+        session_ids = set(request.session_ids)
+        queue = self.session_manager.subscribe_events()
+        try:
+            while True:
+                event = await queue.get()
+                if session_ids and event["session_id"] not in session_ids:
+                    continue
+
+                yield chatbot_pb2.SessionEvent(
+                    session_id=event["session_id"],
+                    type=chatbot_pb2.SessionEventType.Value(event["type"].value),
+                    timestamp=event["timestamp"]
+                )
+
+        except Exception as e:
+            logging.error(f"Unexpected error in WatchSessionEvents: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+        finally:
+            self.session_manager.unsubscribe_events(queue)
+
+    async def ExportSessions(self, request, context):
+        """세션 내보내기 - drain이면 새 세션을 막고 진행 중인 턴이 끝난 뒤 내보냄
+
+        drain이 아니어도 초기화 중인(WARMING) 세션은 초기화가 끝날 때까지 기다린 뒤 내보낸다.
+        """
+        try:
+            timeout = request.drain_timeout_seconds or 30.0
+            if request.drain:
+                await self.session_manager.drain(timeout=timeout)
+            else:
+                await self.session_manager.wait_for_warmups(timeout=timeout)
+
+            for record in self.session_manager.export_sessions():
+                yield chatbot_pb2.SessionSnapshot(
+                    session_id=record["session_id"],
+                    thread_id=record["thread_id"],
+                    character_role=record["character_role"],
+                    opponent_role=record["opponent_role"],
+                    language=record["language"],
+                    created_at=record["created_at"],
+                    last_activity=record["last_activity"],
+                    idle_ttl=record.get("idle_ttl", 0),
+                    absolute_ttl=record.get("absolute_ttl", 0),
+                    history=record["blob"]
+                )
+
+        except AgentException as e:
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(str(e))
+
+        except Exception as e:
+            logging.error(f"Unexpected error in ExportSessions: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+    async def ImportSessions(self, request_iterator, context):
+        """ExportSessions로 받은 세션 가져오기"""
+        try:
+            records = [
+                {
+                    "session_id": snapshot.session_id,
+                    "thread_id": snapshot.thread_id,
+                    "character_role": snapshot.character_role,
+                    "opponent_role": snapshot.opponent_role,
+                    "language": snapshot.language,
+                    "created_at": snapshot.created_at,
+                    "last_activity": snapshot.last_activity,
+                    "idle_ttl": snapshot.idle_ttl,
+                    "absolute_ttl": snapshot.absolute_ttl,
+                    "blob": snapshot.history
+                }
+                async for snapshot in request_iterator
+            ]
+            result = self.session_manager.import_sessions(records)
+
+            return chatbot_pb2.ImportSessionsResponse(**result)
+
+        except AgentException as e:
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(str(e))
+
+            return chatbot_pb2.ImportSessionsResponse()
+
+        except Exception as e:
+            logging.error(f"Unexpected error in ImportSessions: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.ImportSessionsResponse()
+
     async def StreamChat(self, request_iterator, context):
-        """스트림 채팅 (실시간)"""
+        """스트림 채팅 (실시간) - 세션별로 나누어 동시에 처리하고 끝나는 대로 응답
+
+        같은 세션의 요청은 도착 순서대로 처리되며, 응답에는 요청의 request_id와 session_id가 담긴다.
+        """
+        async def handle(request) -> chatbot_pb2.ChatResponse:
+            try:
+                response = await self.session_manager.submit(
+                    request.session_id, lambda agent: agent.achat(request.user_message),
+                    timeout=context.time_remaining()
+                )
+
+                return chatbot_pb2.ChatResponse(
+                    speech=response.speech,
+                    emotion=response.emotion,
+                    success=True,
+                    error_message="",
+                    request_id=request.request_id,
+                    session_id=request.session_id
+                )
+
+            except AgentException as e:
+                logging.error(f"Stream chat failed: {e}")
+                error_message = str(e)
+
+            except Exception as e:
+                logging.error(f"Unexpected error in stream chat: {e}")
+                error_message = "Internal server error"
+
+            return chatbot_pb2.ChatResponse(
+                speech="",
+                emotion="",
+                success=False,
+                error_message=error_message,
+                request_id=request.request_id,
+                session_id=request.session_id
+            )
+
         try:
-            async for request in request_iterator:
-                try:
-                    agent = self.session_manager.get_session(request.session_id)
-                    response = agent.chat(request.user_message)
-
-                    yield chatbot_pb2.ChatResponse(
-                        speech=response.speech,
-                        emotion=response.emotion,
-                        success=True,
-                        error_message=""
-                    )
-
-                    # yield {
-                    #     "speech": response.speech,
-                    #     "emotion": response.emotion,
-                    #     "success": True,
-                    #     "error_message": ""
-                    # }
-
-                except AgentException as e:
-                    logging.error(f"Stream chat failed: {e}")
-
-                    yield {
-                        "speech": "",
-                        "emotion": "",
-                        "success": False,
-                        "error_message": str(e)
-                    }
-
-                except Exception as e:
-                    logging.error(f"Unexpected error in stream chat: {e}")
-
-                    yield {
-                        "speech": "",
-                        "emotion": "",
-                        "success": False,
-                        "error_message": "Internal server error"
-                    }
+            async for response in dispatch_by_key(
+                    request_iterator, lambda request: request.session_id, handle, self.stream_chat_concurrency
+            ):
+                yield response
 
         except Exception as e:
             logging.error(f"Unexpected error in StreamChat: {e}")
@@ -257,11 +572,192 @@ class CharacterChatService:
             context.set_details("Internal server error")
 
 
+    async def _batch(self, requests, handler, response_type, context) -> Tuple[List[Any], List[int]]:
+        """항목마다 단건 RPC 처리를 batch_parallelism개씩 동시에 실행 - (응답 목록, 상태 코드 목록)을 요청 순서대로 반환"""
+        semaphore = asyncio.Semaphore(self.batch_parallelism)
+
+        async def run(request) -> Tuple[Any, int]:
+            item_context = _ItemContext(context)
+            async with semaphore:
+                response = await handler(request, item_context)
+            if isinstance(response, dict):
+                response = response_type(**response)
+            return response, item_context.code.value[0]
+
+        results = await asyncio.gather(*[run(request) for request in requests])
+        return [response for response, _ in results], [code for _, code in results]
+
+    def _check_batch_size(self, requests, context) -> bool:
+        if len(requests) <= self.batch_max_items:
+            return True
+        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        context.set_details(f"Batch has {len(requests)} items, the limit is {self.batch_max_items}")
+        return False
+
+    async def BatchInitSession(self, request, context):
+        """여러 세션 일괄 초기화 - 같은 매치업의 캐릭터 소개는 매치업 캐시를 통해 한 번만 생성됨"""
+        if not self._check_batch_size(request.requests, context):
+            return chatbot_pb2.BatchInitSessionResponse()
+        try:
+            responses, codes = await self._batch(
+                request.requests, self.InitSession, chatbot_pb2.InitSessionResponse, context
+            )
+
+            return chatbot_pb2.BatchInitSessionResponse(responses=responses, status_codes=codes)
+
+        except Exception as e:
+            logging.error(f"Unexpected error in BatchInitSession: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.BatchInitSessionResponse()
+
+    async def BatchChat(self, request, context):
+        """여러 세션 일괄 채팅"""
+        if not self._check_batch_size(request.requests, context):
+            return chatbot_pb2.BatchChatResponse()
+        try:
+            responses, codes = await self._batch(request.requests, self.Chat, chatbot_pb2.ChatResponse, context)
+
+            return chatbot_pb2.BatchChatResponse(responses=responses, status_codes=codes)
+
+        except Exception as e:
+            logging.error(f"Unexpected error in BatchChat: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.BatchChatResponse()
+
+    async def BatchAnalyzeGameState(self, request, context):
+        """여러 세션 일괄 게임 상태 분석"""
+        if not self._check_batch_size(request.requests, context):
+            return chatbot_pb2.BatchAnalysisResponse()
+        try:
+            responses, codes = await self._batch(
+                request.requests, self.AnalyzeGameState, chatbot_pb2.AnalysisResponse, context
+            )
+
+            return chatbot_pb2.BatchAnalysisResponse(responses=responses, status_codes=codes)
+
+        except Exception as e:
+            logging.error(f"Unexpected error in BatchAnalyzeGameState: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+
+            return chatbot_pb2.BatchAnalysisResponse()
+
+
+    async def StreamMatch(self, request_iterator, context):
+        """매치 이벤트 스트림 - 이벤트를 정책에 넘기고, 정책이 고른 이벤트에서만 반응 대사나 분석을 생성하여 보냄
+
+        세션마다 출력은 한 번에 하나만 생성하고, 생성 중에 들어온 이벤트는 요약에 쌓여 다음 출력에 반영된다.
+        입력이 끝나면 생성 중인 출력까지 보낸 뒤 스트림을 닫는다.
+        """
+        policy = self.match_policy_factory()
+        outputs: asyncio.Queue = asyncio.Queue()
+        tasks: Set[asyncio.Task] = set()
+
+        def fire(session_id: str, trigger: MatchTrigger):
+            key = "match_speeches" if trigger.action == MatchAction.SPEECH else "match_analyses"
+            self.match_stats[key] += 1
+            task = asyncio.create_task(self._match_output(session_id, trigger, context))
+            tasks.add(task)
+            task.add_done_callback(lambda done: finished(session_id, done))
+
+        def finished(session_id: str, task: asyncio.Task):
+            tasks.discard(task)
+            if task.cancelled():
+                return
+            outputs.put_nowait(task.result())
+            # 생성 중에 미뤄 둔 출력이 있으면 이어서 생성
+            trigger = policy.finish(session_id)
+            if trigger is not None:
+                fire(session_id, trigger)
+
+        async def read():
+            try:
+                async for event in request_iterator:
+                    event_type = _MATCH_EVENT_TYPES.get(event.type)
+                    if event_type is None:
+                        # 종류를 모르는 이벤트(더 새 클라이언트가 보낸 값 등)는 그 이벤트만 건너뜀
+                        continue
+                    self.match_stats["match_events"] += 1
+                    trigger = policy.observe(event.session_id, MatchEvent(
+                        type=event_type,
+                        by_opponent=event.by_opponent,
+                        move=event.move,
+                        special=event.special,
+                        damage=event.damage,
+                        combo_hits=event.combo_hits,
+                        hp=event.hp,
+                        max_hp=event.max_hp,
+                        round=event.round
+                    ))
+                    if trigger is not None:
+                        fire(event.session_id, trigger)
+
+            except Exception as e:
+                logging.error(f"Unexpected error while reading StreamMatch events: {e}")
+
+            finally:
+                outputs.put_nowait(None)
+
+        reader = asyncio.create_task(read())
+        try:
+            reading = True
+            while reading or tasks or not outputs.empty():
+                output = await outputs.get()
+                if output is None:
+                    reading = False
+                    continue
+                yield output
+
+        finally:
+            reader.cancel()
+            for task in list(tasks):
+                task.cancel()
+
+    async def _match_output(self, session_id: str, trigger: MatchTrigger, context) -> chatbot_pb2.MatchOutput:
+        """정책이 고른 출력 생성 - 오류도 success=False 출력으로 돌려줌"""
+        output = chatbot_pb2.MatchOutput(
+            session_id=session_id,
+            type=chatbot_pb2.MatchOutputType.Value(trigger.action.value),
+            trigger=chatbot_pb2.MatchEventType.Value(trigger.event_type.value),
+            events=trigger.events
+        )
+        try:
+            if trigger.action == MatchAction.SPEECH:
+                response = await self.session_manager.submit(
+                    session_id, lambda agent: agent.areact(trigger.summary), timeout=context.time_remaining()
+                )
+                output.speech, output.emotion = response.speech, response.emotion
+            else:
+                output.analysis = await self.session_manager.analyze_game_state(
+                    session_id, trigger.summary, timeout=context.time_remaining()
+                )
+            output.success = True
+
+        except AgentException as e:
+            logging.warning(f"Match output failed: {e}")
+            output.error_message = str(e)
+
+        except Exception as e:
+            logging.error(f"Unexpected error in StreamMatch: {e}")
+            output.error_message = "Internal server error"
+
+        return output
+
+
 class CharacterChatServicer:
     """실제 gRPC 서비스 구현 (protobuf 사용 시)"""
 
-    def __init__(self, session_manager: SessionManager):
-        self.service = CharacterChatService(session_manager)
+    def __init__(self, session_manager: SessionManager, stream_chat_concurrency: int = 8,
+                 batch_max_items: int = 256, batch_parallelism: int = 16,
+                 match_policy_factory: Callable[[], MatchPolicy] = MatchPolicy):
+        self.service = CharacterChatService(
+            session_manager, stream_chat_concurrency=stream_chat_concurrency, batch_max_items=batch_max_items,
+            batch_parallelism=batch_parallelism, match_policy_factory=match_policy_factory
+        )
 
     # 실제 protobuf 사용 시 이 메서드들을 활성화
 
@@ -271,6 +767,10 @@ class CharacterChatServicer:
     async def Chat(self, request, context):
         return await self.service.Chat(request, context)
 
+    async def ChatStream(self, request, context):
+        async for event in self.service.ChatStream(request, context):
+            yield event
+
     async def AnalyzeGameState(self, request, context):
         return await self.service.AnalyzeGameState(request, context)
 
@@ -284,6 +784,36 @@ class CharacterChatServicer:
         async for response in self.service.StreamChat(request_iterator, context):
             yield response
 
+    async def GetSessionStatus(self, request, context):
+        return await self.service.GetSessionStatus(request, context)
+
+    async def GetSessionStats(self, request, context):
+        return await self.service.GetSessionStats(request, context)
+
+    async def WatchSessionEvents(self, request, context):
+        async for event in self.service.WatchSessionEvents(request, context):
+            yield event
+
+    async def ExportSessions(self, request, context):
+        async for snapshot in self.service.ExportSessions(request, context):
+            yield snapshot
+
+    async def ImportSessions(self, request_iterator, context):
+        return await self.service.ImportSessions(request_iterator, context)
+
+    async def BatchInitSession(self, request, context):
+        return await self.service.BatchInitSession(request, context)
+
+    async def BatchChat(self, request, context):
+        return await self.service.BatchChat(request, context)
+
+    async def BatchAnalyzeGameState(self, request, context):
+        return await self.service.BatchAnalyzeGameState(request, context)
+
+    async def StreamMatch(self, request_iterator, context):
+        async for output in self.service.StreamMatch(request_iterator, context):
+            yield output
+
 
 # Mock protobuf classes for testing without compilation
 class MockRequest:
@@ -298,12 +828,16 @@ class MockChatRequest(MockRequest):
 
 
 class MockInitSessionRequest(MockRequest):
-    def __init__(self, session_id: str, character_role: str, opponent_role: str, language: str):
+    def __init__(self, session_id: str, character_role: str, opponent_role: str, language: str,
+                 background_init: bool = False, idle_timeout_seconds: int = 0, max_lifetime_seconds: int = 0):
         super().__init__(
             session_id=session_id,
             character_role=character_role,
             opponent_role=opponent_role,
-            language=language
+            language=language,
+            background_init=background_init,
+            idle_timeout_seconds=idle_timeout_seconds,
+            max_lifetime_seconds=max_lifetime_seconds
         )
 
 
@@ -322,6 +856,26 @@ class MockListSessionsRequest(MockRequest):
         super().__init__()
 
 
+class MockSessionStatusRequest(MockRequest):
+    def __init__(self, session_id: str):
+        super().__init__(session_id=session_id)
+
+
+class MockSessionStatsRequest(MockRequest):
+    def __init__(self, top_n: int = 10):
+        super().__init__(top_n=top_n)
+
+
+class MockSessionEventsRequest(MockRequest):
+    def __init__(self, session_ids: Optional[List[str]] = None):
+        super().__init__(session_ids=session_ids or [])
+
+
+class MockExportSessionsRequest(MockRequest):
+    def __init__(self, drain: bool = False, drain_timeout_seconds: float = 0):
+        super().__init__(drain=drain, drain_timeout_seconds=drain_timeout_seconds)
+
+
 class MockContext:
     def __init__(self):
         self.code = None
@@ -331,4 +885,7 @@ class MockContext:
         self.code = code
 
     def set_details(self, details):
-        self.details = details
\ No newline at end of file
+        self.details = details
+
+    def time_remaining(self):
+        return None
\ No newline at end of file
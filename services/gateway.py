@@ -0,0 +1,208 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from grpc import aio
+
+from generated import chatbot_pb2
+from services.session_router import SessionRouter
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """가상 노드를 쓰는 consistent hash ring
+
+    노드 하나를 replicas개의 점으로 원 위에 올리고, 키는 시계 방향으로 처음 만나는 점의 노드가 맡는다.
+    노드를 더하거나 빼면 그 노드와 인접한 구간의 키(대략 1/노드 수)만 주인이 바뀐다.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 160):
+        if replicas < 1:
+            raise ValueError("HashRing replicas must be at least 1")
+        self.replicas = replicas
+        self._points: List[Tuple[int, str]] = []
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def add(self, node: str):
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for index in range(self.replicas):
+            bisect.insort(self._points, (_hash(f"{node}#{index}"), node))
+
+    def remove(self, node: str):
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        self._points = [point for point in self._points if point[1] != node]
+
+    def node_for(self, key: str) -> str:
+        if not self._points:
+            raise LookupError("HashRing has no nodes")
+        index = bisect.bisect(self._points, _hash(key), key=lambda point: point[0])
+        return self._points[index % len(self._points)][1]
+
+
+class SessionGateway(SessionRouter):
+    """여러 서버 노드 앞에 두는 CharacterChatService 게이트웨이
+
+    session_id의 consistent hash로 소유 노드를 정한다 (SessionRouter의 전달/집계 동작은 그대로 사용).
+    set_backends로 노드 목록이 바뀌면 세션 단위 RPC와 StreamMatch 이벤트 전달을 잠시 멈추고, 진행 중인
+    호출이 끝나면 주인이 바뀐 세션만 ExportSessions/ImportSessions로 새 노드에 옮긴 뒤 이전 노드에서 EndSession한다.
+    StreamMatch의 노드별 스트림은 이때 입력을 닫아 생성 중인 출력까지 받고 끝내며, 이후 이벤트는 새 주인에게 보낸다.
+    빠지는 노드는 드레인 후 내보내므로 그 노드의 세션은 모두 남은 노드로 옮겨진다.
+    """
+
+    def __init__(self, backends: List[str], replicas: int = 160, pause_timeout: float = 30.0,
+                 stream_chat_concurrency: int = 8, batch_max_items: int = 256, batch_parallelism: int = 16):
+        super().__init__(backends, stream_chat_concurrency=stream_chat_concurrency, batch_max_items=batch_max_items,
+                         batch_parallelism=batch_parallelism)
+        self.ring = HashRing(self.backends, replicas=replicas)
+        self.pause_timeout = pause_timeout
+        self._rebalance_lock = asyncio.Lock()
+        # 세션 단위 호출을 막는 게이트와 진행 중인 호출 수
+        self._gate = asyncio.Event()
+        self._gate.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._in_flight = 0
+
+    def backend_for(self, session_id: str) -> str:
+        return self.ring.node_for(session_id)
+
+    def _enter(self):
+        self._in_flight += 1
+        self._idle.clear()
+
+    def _leave(self):
+        self._in_flight -= 1
+        if not self._in_flight:
+            self._idle.set()
+
+    async def _call_owner(self, session_id: str, method: str, raw: bytes, timeout: Optional[float] = None) -> bytes:
+        await self._gate.wait()
+        self._enter()
+        try:
+            return await super()._call_owner(session_id, method, raw, timeout=timeout)
+        finally:
+            self._leave()
+
+    async def _stream_owner(self, session_id: str, method: str, raw: bytes,
+                            timeout: Optional[float] = None) -> AsyncIterator[bytes]:
+        await self._gate.wait()
+        self._enter()
+        try:
+            async for response in super()._stream_owner(session_id, method, raw, timeout=timeout):
+                yield response
+        finally:
+            self._leave()
+
+    async def _match_owner(self, session_id: str) -> str:
+        await self._gate.wait()
+        return self.backend_for(session_id)
+
+    def _match_upstream_opened(self, address: str):
+        self._enter()
+
+    def _match_upstream_closed(self, address: str):
+        self._leave()
+
+    async def set_backends(self, backends: List[str]) -> int:
+        """노드 목록을 바꾸고 주인이 바뀐 세션을 옮김 - 옮긴 세션 수 반환"""
+        if not backends:
+            raise ValueError("SessionGateway needs at least one backend")
+
+        async with self._rebalance_lock:
+            added = [address for address in backends if address not in self.backends]
+            removed = [address for address in self.backends if address not in backends]
+            if not added and not removed:
+                return 0
+
+            self._gate.clear()
+            try:
+                # 열려 있는 StreamMatch 노드별 스트림은 끝날 때까지 진행 중인 호출로 세므로 입력을 닫아 끝냄
+                self._close_match_upstreams()
+                try:
+                    await asyncio.wait_for(self._idle.wait(), timeout=self.pause_timeout)
+                except asyncio.TimeoutError:
+                    logging.warning(f"Rebalancing with {self._in_flight} session calls still in flight")
+
+                sources = self.ring.nodes
+                for address in added:
+                    self._open(address)
+                    self.ring.add(address)
+                for address in removed:
+                    self.ring.remove(address)
+
+                moved = await self._rebalance(sources, removed)
+
+                for address in removed:
+                    await self._close(address)
+            finally:
+                self._gate.set()
+
+            logging.info(f"Gateway backends: +{added} -{removed}, moved {moved} sessions")
+            return moved
+
+    async def _rebalance(self, sources: List[str], removed: List[str]) -> int:
+        """sources 노드의 세션 중 새 ring에서 주인이 바뀐 세션을 옮김"""
+        moved = 0
+        for source in sources:
+            leaving = source in removed
+            request = chatbot_pb2.ExportSessionsRequest(drain=leaving, drain_timeout_seconds=self.pause_timeout)
+            by_target: Dict[str, List[bytes]] = defaultdict(list)
+            try:
+                async for raw in self._method(source, "unary_stream", "ExportSessions")(
+                        request.SerializeToString()):
+                    session_id = chatbot_pb2.SessionSnapshot.FromString(raw).session_id
+                    target = self.ring.node_for(session_id)
+                    if target != source:
+                        by_target[target].append(raw)
+            except aio.AioRpcError as e:
+                logging.error(f"Could not export sessions from {source}: {e.code()} {e.details()}")
+                continue
+
+            for target, snapshots in by_target.items():
+                try:
+                    response = chatbot_pb2.ImportSessionsResponse.FromString(
+                        await self._method(target, "stream_unary", "ImportSessions")(iter(snapshots))
+                    )
+                except aio.AioRpcError as e:
+                    logging.error(f"Could not import {len(snapshots)} sessions into {target}: {e.code()}")
+                    continue
+                moved += response.imported
+                if leaving:
+                    continue
+                # 남는 노드에서는 실제로 옮겨진 세션만 지워 주인이 하나만 있도록 함
+                # (새 노드가 건너뛴 세션은 이전 노드에 그대로 두어 잃지 않게 함)
+                if response.skipped:
+                    logging.warning(f"{target} skipped {response.skipped} sessions; keeping them on {source}")
+                for session_id in response.imported_session_ids:
+                    try:
+                        await self._method(source, "unary_unary", "EndSession")(
+                            chatbot_pb2.EndSessionRequest(session_id=session_id).SerializeToString()
+                        )
+                    except aio.AioRpcError as e:
+                        logging.warning(f"Could not end moved session {session_id} on {source}: {e.code()}")
+        return moved
+
+
+def read_backends(value: str = "", path: str = "") -> List[str]:
+    """쉼표로 구분한 주소 목록 또는 한 줄에 주소 하나인 파일에서 노드 목록 읽기 (# 주석 허용)"""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            lines = [line.split("#", 1)[0].strip() for line in f]
+        return [line for line in lines if line]
+    return [address.strip() for address in value.split(",") if address.strip()]
@@ -0,0 +1,375 @@
+import asyncio
+import logging
+import uuid
+import zlib
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import grpc
+from grpc import aio
+
+from generated import chatbot_pb2
+from services.stream_dispatch import dispatch_by_key
+
+SERVICE_NAME = "chatbot.CharacterChatService"
+
+
+def _identity(data: bytes) -> bytes:
+    return data
+
+
+def partition(session_id: str, count: int) -> int:
+    """세션 ID를 0..count-1 파티션 번호로 변환 (프로세스와 실행에 관계없이 고정된 해시)"""
+    return zlib.crc32(session_id.encode()) % count
+
+
+class SessionRouter:
+    """CharacterChatService 요청을 세션을 소유한 백엔드로 전달하는 프록시
+
+    - 세션 단위 RPC(InitSession, Chat, AnalyzeGameState, EndSession, GetSessionStatus)는 요청에서
+      session_id만 읽고 요청/응답 바이트를 그대로 전달한다. session_id 없는 InitSession은 여기서 ID를 정한다.
+    - ChatStream은 소유 백엔드의 이벤트 스트림을 그대로 전달한다.
+    - StreamChat은 요청마다 소유 백엔드의 Chat으로 보내며, 세션 간에는 동시에 보내고 같은 세션은 순서대로 보낸다.
+    - StreamMatch는 이벤트를 소유 백엔드별 StreamMatch 스트림으로 나누어 보내고 출력을 합친다.
+    - BatchInitSession, BatchChat, BatchAnalyzeGameState는 항목마다 소유 백엔드의 단건 RPC로 나누어 보낸다.
+    - ListSessions, GetSessionStats, WatchSessionEvents, ExportSessions는 모든 백엔드의 결과를 합치고,
+      ImportSessions는 세션마다 소유 백엔드로 나누어 보낸다.
+
+    기본 라우팅은 백엔드 수로 나눈 나머지(partition)이며, 하위 클래스는 backend_for와 _call_owner,
+    _match_owner 등을 바꿔 다른 방식을 쓸 수 있다 (services.gateway.SessionGateway).
+    """
+
+    def __init__(self, backends: List[str], stream_chat_concurrency: int = 8, batch_max_items: int = 256,
+                 batch_parallelism: int = 16):
+        if not backends:
+            raise ValueError("SessionRouter needs at least one backend")
+        self.stream_chat_concurrency = stream_chat_concurrency
+        self.batch_max_items = batch_max_items
+        self.batch_parallelism = batch_parallelism
+        self.backends: List[str] = []
+        self._channels: Dict[str, aio.Channel] = {}
+        self._methods: Dict[Tuple[str, str, str], Any] = {}
+        # 진행 중인 StreamMatch 호출마다 백엔드 스트림 입력을 닫는 함수 (라우팅이 바뀌기 전에 호출)
+        self._match_streams: Set[Callable[[], None]] = set()
+        for address in backends:
+            self._open(address)
+
+    def _open(self, address: str):
+        if address not in self._channels:
+            self._channels[address] = aio.insecure_channel(address)
+            self.backends.append(address)
+
+    async def _close(self, address: str):
+        channel = self._channels.pop(address, None)
+        self.backends.remove(address)
+        for key in [key for key in self._methods if key[0] == address]:
+            del self._methods[key]
+        if channel is not None:
+            await channel.close()
+
+    def backend_for(self, session_id: str) -> str:
+        """세션을 소유한 백엔드 주소"""
+        return self.backends[partition(session_id, len(self.backends))]
+
+    async def close(self):
+        for address in list(self._channels):
+            await self._close(address)
+
+    # ---- 백엔드 호출 ----
+
+    def _method(self, address: str, kind: str, method: str):
+        """백엔드의 메서드 호출 객체 (바이트를 그대로 주고받음, 주소와 메서드마다 하나만 생성)"""
+        key = (address, kind, method)
+        callable_ = self._methods.get(key)
+        if callable_ is None:
+            factory = getattr(self._channels[address], kind)
+            callable_ = factory(f"/{SERVICE_NAME}/{method}", request_serializer=_identity,
+                                response_deserializer=_identity)
+            self._methods[key] = callable_
+        return callable_
+
+    async def _call_owner(self, session_id: str, method: str, raw: bytes, timeout: Optional[float] = None) -> bytes:
+        """세션을 소유한 백엔드의 unary 메서드 호출 (세션 단위 RPC는 모두 이 경로를 거침)"""
+        return await self._method(self.backend_for(session_id), "unary_unary", method)(raw, timeout=timeout)
+
+    async def _stream_owner(self, session_id: str, method: str, raw: bytes,
+                            timeout: Optional[float] = None) -> AsyncIterator[bytes]:
+        """세션을 소유한 백엔드의 server-streaming 메서드 호출"""
+        async for response in self._method(self.backend_for(session_id), "unary_stream", method)(raw, timeout=timeout):
+            yield response
+
+    async def _match_owner(self, session_id: str) -> str:
+        """StreamMatch 이벤트를 보낼 백엔드 주소 (이벤트마다 호출)"""
+        return self.backend_for(session_id)
+
+    def _match_upstream_opened(self, address: str):
+        """StreamMatch의 백엔드 스트림이 열림 - _match_owner가 돌려준 뒤 await 없이 바로 호출됨"""
+
+    def _match_upstream_closed(self, address: str):
+        """StreamMatch의 백엔드 스트림이 닫힘 (열릴 때마다 한 번씩 호출됨)"""
+
+    def _close_match_upstreams(self):
+        """진행 중인 모든 StreamMatch의 백엔드 스트림 입력을 닫음 - 백엔드는 생성 중인 출력까지 보낸 뒤
+        스트림을 닫고, 이후 이벤트는 그때의 소유 백엔드로 새 스트림을 열어 보낸다"""
+        for close in list(self._match_streams):
+            close()
+
+    async def _unary(self, session_id: str, method: str, raw: bytes, context) -> bytes:
+        """소유 백엔드 unary 호출 - 남은 deadline을 전달하고 백엔드의 오류 코드를 그대로 돌려줌"""
+        try:
+            return await self._call_owner(session_id, method, raw, timeout=context.time_remaining())
+        except aio.AioRpcError as e:
+            await context.abort(e.code(), e.details())
+
+    # ---- 세션 단위 RPC ----
+
+    def _routed(self, method: str, request_type) -> Callable:
+        async def handler(raw: bytes, context) -> bytes:
+            session_id = request_type.FromString(raw).session_id
+            return await self._unary(session_id, method, raw, context)
+        return handler
+
+    async def InitSession(self, raw: bytes, context) -> bytes:
+        request = chatbot_pb2.InitSessionRequest.FromString(raw)
+        if not request.session_id:
+            # 소유 백엔드를 정하려면 ID가 먼저 필요
+            request.session_id = str(uuid.uuid4())
+            raw = request.SerializeToString()
+        return await self._unary(request.session_id, "InitSession", raw, context)
+
+    async def ChatStream(self, raw: bytes, context) -> AsyncIterator[bytes]:
+        session_id = chatbot_pb2.ChatRequest.FromString(raw).session_id
+        try:
+            async for event in self._stream_owner(session_id, "ChatStream", raw, timeout=context.time_remaining()):
+                yield event
+        except aio.AioRpcError as e:
+            await context.abort(e.code(), e.details())
+
+    async def StreamChat(self, request_iterator: AsyncIterator[bytes], context) -> AsyncIterator[bytes]:
+        async def parsed() -> AsyncIterator[Tuple[chatbot_pb2.ChatRequest, bytes]]:
+            async for raw in request_iterator:
+                yield chatbot_pb2.ChatRequest.FromString(raw), raw
+
+        async def handle(item: Tuple[chatbot_pb2.ChatRequest, bytes]) -> bytes:
+            request, raw = item
+            try:
+                return await self._call_owner(request.session_id, "Chat", raw, timeout=context.time_remaining())
+            except aio.AioRpcError as e:
+                return chatbot_pb2.ChatResponse(
+                    success=False, error_message=e.details() or "", request_id=request.request_id,
+                    session_id=request.session_id
+                ).SerializeToString()
+
+        async for response in dispatch_by_key(parsed(), lambda item: item[0].session_id, handle,
+                                              self.stream_chat_concurrency):
+            yield response
+
+    async def StreamMatch(self, request_iterator: AsyncIterator[bytes], context) -> AsyncIterator[bytes]:
+        """이벤트를 세션 소유 백엔드별 StreamMatch 스트림으로 나누어 보내고 출력을 합쳐 전달"""
+        outputs: asyncio.Queue = asyncio.Queue()
+        upstreams: Dict[str, asyncio.Queue] = {}
+        pumps: List[asyncio.Task] = []
+
+        async def pump(address: str, events: asyncio.Queue):
+            async def forward() -> AsyncIterator[bytes]:
+                while (raw := await events.get()) is not None:
+                    yield raw
+
+            try:
+                async for output in self._method(address, "stream_stream", "StreamMatch")(forward()):
+                    outputs.put_nowait(("output", output))
+            except aio.AioRpcError as e:
+                outputs.put_nowait(("error", e))
+            finally:
+                outputs.put_nowait(("closed", address))
+
+        def close_upstreams():
+            for events in upstreams.values():
+                events.put_nowait(None)
+            upstreams.clear()
+
+        async def read():
+            try:
+                async for raw in request_iterator:
+                    address = await self._match_owner(chatbot_pb2.MatchEvent.FromString(raw).session_id)
+                    events = upstreams.get(address)
+                    if events is None:
+                        events = upstreams[address] = asyncio.Queue()
+                        task = asyncio.create_task(pump(address, events))
+                        # 시작 전에 취소된 태스크도 완료 콜백은 호출되므로 닫힘을 놓치지 않음
+                        self._match_upstream_opened(address)
+                        task.add_done_callback(lambda _, address=address: self._match_upstream_closed(address))
+                        pumps.append(task)
+                    events.put_nowait(raw)
+            finally:
+                close_upstreams()
+                outputs.put_nowait(("read_done", None))
+
+        self._match_streams.add(close_upstreams)
+        reader = asyncio.create_task(read())
+        try:
+            reading, closed = True, 0
+            while reading or closed < len(pumps):
+                kind, value = await outputs.get()
+                if kind == "output":
+                    yield value
+                elif kind == "error":
+                    await context.abort(value.code(), value.details())
+                elif kind == "closed":
+                    closed += 1
+                else:
+                    reading = False
+
+        finally:
+            self._match_streams.discard(close_upstreams)
+            reader.cancel()
+            for task in pumps:
+                task.cancel()
+
+    # ---- 일괄 RPC ----
+
+    async def _batch(self, method: str, requests, response_type, context) -> Tuple[List[Any], List[int]]:
+        """일괄 요청의 항목을 소유 백엔드의 단건 RPC로 나누어 보내고 (응답 목록, 상태 코드 목록)을 요청 순서대로 반환"""
+        if len(requests) > self.batch_max_items:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                                f"Batch has {len(requests)} items, the limit is {self.batch_max_items}")
+        semaphore = asyncio.Semaphore(self.batch_parallelism)
+
+        async def forward(request) -> Tuple[Any, int]:
+            async with semaphore:
+                try:
+                    response = await self._call_owner(request.session_id, method, request.SerializeToString(),
+                                                      timeout=context.time_remaining())
+                    return response_type.FromString(response), grpc.StatusCode.OK.value[0]
+                except aio.AioRpcError as e:
+                    return response_type(success=False, error_message=e.details() or ""), e.code().value[0]
+
+        results = await asyncio.gather(*[forward(request) for request in requests])
+        return [response for response, _ in results], [code for _, code in results]
+
+    async def BatchInitSession(self, raw: bytes, context) -> bytes:
+        batch = chatbot_pb2.BatchInitSessionRequest.FromString(raw)
+        for request in batch.requests:
+            if not request.session_id:
+                request.session_id = str(uuid.uuid4())
+        responses, codes = await self._batch("InitSession", batch.requests, chatbot_pb2.InitSessionResponse, context)
+        return chatbot_pb2.BatchInitSessionResponse(responses=responses, status_codes=codes).SerializeToString()
+
+    async def BatchChat(self, raw: bytes, context) -> bytes:
+        batch = chatbot_pb2.BatchChatRequest.FromString(raw)
+        responses, codes = await self._batch("Chat", batch.requests, chatbot_pb2.ChatResponse, context)
+        return chatbot_pb2.BatchChatResponse(responses=responses, status_codes=codes).SerializeToString()
+
+    async def BatchAnalyzeGameState(self, raw: bytes, context) -> bytes:
+        batch = chatbot_pb2.BatchAnalysisRequest.FromString(raw)
+        responses, codes = await self._batch("AnalyzeGameState", batch.requests, chatbot_pb2.AnalysisResponse,
+                                             context)
+        return chatbot_pb2.BatchAnalysisResponse(responses=responses, status_codes=codes).SerializeToString()
+
+    # ---- 모든 백엔드에 대한 RPC ----
+
+    async def _broadcast(self, method: str, raw: bytes, response_type, context) -> List[Any]:
+        try:
+            responses = await asyncio.gather(*[
+                self._method(address, "unary_unary", method)(raw, timeout=context.time_remaining())
+                for address in list(self.backends)
+            ])
+        except aio.AioRpcError as e:
+            await context.abort(e.code(), e.details())
+        return [response_type.FromString(response) for response in responses]
+
+    async def ListSessions(self, raw: bytes, context) -> bytes:
+        responses = await self._broadcast("ListSessions", raw, chatbot_pb2.ListSessionsResponse, context)
+        session_ids = [session_id for response in responses for session_id in response.session_ids]
+        return chatbot_pb2.ListSessionsResponse(session_ids=session_ids).SerializeToString()
+
+    async def GetSessionStats(self, raw: bytes, context) -> bytes:
+        top_n = chatbot_pb2.SessionStatsRequest.FromString(raw).top_n or 10
+        responses = await self._broadcast("GetSessionStats", raw, chatbot_pb2.SessionStatsResponse, context)
+        merged = chatbot_pb2.SessionStatsResponse()
+        for field in ("active_sessions", "hibernated_sessions", "hibernations", "rehydrations", "hibernated_bytes",
+                      "active_bytes", "max_sessions", "max_memory_bytes", "evictions", "llm_in_flight",
+                      "llm_queue_depth", "llm_max_concurrent", "llm_max_queue", "llm_admitted", "llm_rejected",
+                      "llm_queue_timeouts", "cancelled_turns", "deadline_exceeded_turns", "analysis_requests",
+                      "analysis_runs", "match_events", "match_speeches", "match_analyses"):
+            setattr(merged, field, sum(getattr(response, field) for response in responses))
+        # 평균 소요 시간은 횟수로 가중 평균
+        if merged.hibernations:
+            merged.avg_hibernate_ms = sum(r.avg_hibernate_ms * r.hibernations for r in responses) / merged.hibernations
+        if merged.rehydrations:
+            merged.avg_rehydrate_ms = sum(r.avg_rehydrate_ms * r.rehydrations for r in responses) / merged.rehydrations
+        if merged.llm_admitted:
+            merged.avg_llm_wait_ms = sum(r.avg_llm_wait_ms * r.llm_admitted for r in responses) / merged.llm_admitted
+        merged.max_llm_wait_ms = max((r.max_llm_wait_ms for r in responses), default=0.0)
+        largest = sorted((usage for r in responses for usage in r.largest_sessions), key=lambda u: -u.bytes)
+        merged.largest_sessions.extend(largest[:top_n])
+        return merged.SerializeToString()
+
+    async def WatchSessionEvents(self, raw: bytes, context) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def pump(address: str):
+            try:
+                async for event in self._method(address, "unary_stream", "WatchSessionEvents")(raw):
+                    await queue.put(event)
+            except aio.AioRpcError as e:
+                logging.warning(f"Session event stream from {address} ended: {e.code()}")
+
+        pumps = [asyncio.create_task(pump(address)) for address in list(self.backends)]
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            for task in pumps:
+                task.cancel()
+
+    async def ExportSessions(self, raw: bytes, context) -> AsyncIterator[bytes]:
+        for address in list(self.backends):
+            try:
+                async for snapshot in self._method(address, "unary_stream", "ExportSessions")(raw):
+                    yield snapshot
+            except aio.AioRpcError as e:
+                await context.abort(e.code(), e.details())
+
+    async def ImportSessions(self, request_iterator: AsyncIterator[bytes], context) -> bytes:
+        by_backend: Dict[str, List[bytes]] = defaultdict(list)
+        async for raw in request_iterator:
+            session_id = chatbot_pb2.SessionSnapshot.FromString(raw).session_id
+            by_backend[self.backend_for(session_id)].append(raw)
+
+        result = chatbot_pb2.ImportSessionsResponse()
+        for address, snapshots in by_backend.items():
+            try:
+                response = chatbot_pb2.ImportSessionsResponse.FromString(
+                    await self._method(address, "stream_unary", "ImportSessions")(iter(snapshots))
+                )
+            except aio.AioRpcError as e:
+                await context.abort(e.code(), e.details())
+            result.imported += response.imported
+            result.skipped += response.skipped
+            result.imported_session_ids.extend(response.imported_session_ids)
+        return result.SerializeToString()
+
+    # ---- 서버 등록 ----
+
+    def handler(self) -> grpc.GenericRpcHandler:
+        """gRPC 서버에 등록할 CharacterChatService 핸들러 (요청/응답은 직렬화된 바이트)"""
+        unary = grpc.unary_unary_rpc_method_handler
+        return grpc.method_handlers_generic_handler(SERVICE_NAME, {
+            "InitSession": unary(self.InitSession),
+            "Chat": unary(self._routed("Chat", chatbot_pb2.ChatRequest)),
+            "AnalyzeGameState": unary(self._routed("AnalyzeGameState", chatbot_pb2.AnalysisRequest)),
+            "EndSession": unary(self._routed("EndSession", chatbot_pb2.EndSessionRequest)),
+            "GetSessionStatus": unary(self._routed("GetSessionStatus", chatbot_pb2.SessionStatusRequest)),
+            "ListSessions": unary(self.ListSessions),
+            "GetSessionStats": unary(self.GetSessionStats),
+            "ChatStream": grpc.unary_stream_rpc_method_handler(self.ChatStream),
+            "StreamChat": grpc.stream_stream_rpc_method_handler(self.StreamChat),
+            "BatchInitSession": unary(self.BatchInitSession),
+            "BatchChat": unary(self.BatchChat),
+            "BatchAnalyzeGameState": unary(self.BatchAnalyzeGameState),
+            "StreamMatch": grpc.stream_stream_rpc_method_handler(self.StreamMatch),
+            "WatchSessionEvents": grpc.unary_stream_rpc_method_handler(self.WatchSessionEvents),
+            "ExportSessions": grpc.unary_stream_rpc_method_handler(self.ExportSessions),
+            "ImportSessions": grpc.stream_unary_rpc_method_handler(self.ImportSessions),
+        })
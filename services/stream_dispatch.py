@@ -0,0 +1,77 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Set, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def dispatch_by_key(
+        items: AsyncIterator[T],
+        key: Callable[[T], str],
+        handle: Callable[[T], Awaitable[R]],
+        max_in_flight: int
+) -> AsyncIterator[R]:
+    """요청 스트림을 키(세션)별로 나누어 동시에 처리하고 끝나는 대로 결과를 내보냄
+
+    같은 키의 요청은 도착 순서대로 하나씩 처리되므로 결과 순서도 유지되고, 다른 키와는 동시에 처리된다.
+    처리 중이거나 차례를 기다리거나 아직 전달되지 않은 결과를 합쳐 max_in_flight개가 차면
+    다음 요청을 읽지 않고 기다린다 (1이면 기존처럼 한 번에 하나씩).
+    handle은 요청별 오류를 결과로 바꿔 돌려줘야 하며, 예외를 던지면 스트림 전체가 그 예외로 끝난다.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    results: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(max_in_flight)
+    lanes: Dict[str, Deque[T]] = {}
+    tasks: Set[asyncio.Task] = set()
+
+    async def run_lane(lane_key: str, lane: Deque[T]):
+        try:
+            # 마지막 popleft와 lanes 제거 사이에 await가 없으므로 read가 빈 lane에 요청을 넣는 일은 없음
+            while lane:
+                results.put_nowait(("result", await handle(lane[0])))
+                lane.popleft()
+        except Exception as e:
+            results.put_nowait(("error", e))
+        finally:
+            del lanes[lane_key]
+
+    async def read():
+        try:
+            async for item in items:
+                await slots.acquire()
+                lane_key = key(item)
+                lane = lanes.get(lane_key)
+                if lane is not None:
+                    lane.append(item)
+                    continue
+                lanes[lane_key] = lane = deque([item])
+                task = asyncio.create_task(run_lane(lane_key, lane))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            # 입력이 끝나면 남은 요청을 모두 처리한 뒤 종료
+            while tasks:
+                await asyncio.wait(set(tasks))
+            results.put_nowait(("done", None))
+
+        except Exception as e:
+            results.put_nowait(("error", e))
+
+    reader = asyncio.create_task(read())
+    try:
+        while True:
+            kind, value = await results.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            slots.release()
+            yield value
+
+    finally:
+        reader.cancel()
+        for task in list(tasks):
+            task.cancel()
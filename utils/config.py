@@ -12,7 +12,60 @@ class Config:
         self.top_p = float(os.getenv('TOP_P', "0.95"))
         self.grpc_port = int(os.getenv('GRPC_PORT', "50051"))
         self.max_workers = int(os.getenv('MAX_WORKERS', "10"))
+        # 서버 프로세스 수 - 2 이상이면 세션을 나누어 맡는 워커 프로세스와 앞단 디스패처로 실행
+        self.server_workers = int(os.getenv('SERVER_WORKERS', "1"))
+        # 게이트웨이 모드의 백엔드 노드 (쉼표로 구분, 파일을 주면 SIGHUP마다 다시 읽음), 노드당 가상 노드 수
+        self.gateway_backends = os.getenv('GATEWAY_BACKENDS', '')
+        self.gateway_backends_file = os.getenv('GATEWAY_BACKENDS_FILE', '')
+        self.gateway_ring_replicas = int(os.getenv('GATEWAY_RING_REPLICAS', "160"))
         self.session_timeout_minutes = int(os.getenv('SESSION_TIMEOUT_MINUTES', "60"))
+        # 생성 후 활동과 무관하게 세션을 만료시키는 시간 (0이면 끔), InitSession에서 세션별로 바꿀 수 있음
+        self.session_absolute_timeout_minutes = float(os.getenv('SESSION_ABSOLUTE_TIMEOUT_MINUTES', "0"))
+        self.session_max_pending_turns = int(os.getenv('SESSION_MAX_PENDING_TURNS', "8"))
+        self.matchup_cache_dir = os.getenv('MATCHUP_CACHE_DIR', '')  # 비어 있으면 메모리에만 캐시
+        # 서버 시작 시 프롬프트를 미리 렌더링할 언어 목록
+        self.prompt_languages = [
+            language.strip() for language in os.getenv('PROMPT_LANGUAGES', 'korean,english').split(',')
+            if language.strip()
+        ]
+        # 컨텍스트 정책 - CONTEXT_RECENT_TURNS가 0이면 전체 기록 전송
+        self.context_recent_turns = int(os.getenv('CONTEXT_RECENT_TURNS', "10"))
+        self.context_max_tokens = int(os.getenv('CONTEXT_MAX_TOKENS', "4000"))
+        # 체크포인트 보존 정책 - latest: 세션마다 최신 체크포인트만, all: 모든 단계 보관 (MemorySaver)
+        self.checkpoint_retention = os.getenv('CHECKPOINT_RETENTION', 'latest')
+        # 세션 영속화 - 비어 있으면 메모리에만 보관, 지정하면 SQLite 파일에 저장하고 최근 세션만 메모리에 유지
+        self.session_store_path = os.getenv('SESSION_STORE_PATH', '')
+        self.session_hot_capacity = int(os.getenv('SESSION_HOT_CAPACITY', "1000"))
+        # 이 시간 동안 활동이 없는 세션은 압축하여 휴면 (0이면 끔)
+        self.session_hibernate_minutes = float(os.getenv('SESSION_HIBERNATE_MINUTES', "2"))
+        # 메모리에 올릴 세션 수와 세션 기록 추정 크기의 상한 (0이면 제한 없음), 넘으면 오래된 세션부터 휴면/제거
+        self.session_max_active = int(os.getenv('SESSION_MAX_ACTIVE', "5000"))
+        self.session_max_memory_mb = float(os.getenv('SESSION_MAX_MEMORY_MB', "512"))
+        self.session_eviction_policy = os.getenv('SESSION_EVICTION_POLICY', 'hibernate')
+        # 세션 조회 락을 나눌 stripe 수 (세션 ID 해시 기준)
+        self.session_registry_stripes = int(os.getenv('SESSION_REGISTRY_STRIPES', "16"))
+        # 종료 시 세션을 기록하고 시작 시 가져올 스냅샷 파일 (비어 있으면 끔), 드레인 대기 시간
+        self.session_snapshot_path = os.getenv('SESSION_SNAPSHOT_PATH', '')
+        self.session_drain_timeout_seconds = float(os.getenv('SESSION_DRAIN_TIMEOUT_SECONDS', "30"))
+        # LLM 동시 호출 수 (0이면 제한 없음), 차례를 기다릴 수 있는 호출 수와 최대 대기 시간
+        self.llm_max_concurrent = int(os.getenv('LLM_MAX_CONCURRENT', "16"))
+        self.llm_max_queue = int(os.getenv('LLM_MAX_QUEUE', "64"))
+        self.llm_queue_timeout_seconds = float(os.getenv('LLM_QUEUE_TIMEOUT_SECONDS', "10"))
+        # StreamChat 스트림 하나에서 동시에 처리할 요청 수 (1이면 한 번에 하나씩)
+        self.stream_chat_concurrency = int(os.getenv('STREAM_CHAT_CONCURRENCY', "8"))
+        # Batch* RPC 하나에 담을 수 있는 항목 수와 동시에 처리할 항목 수
+        self.batch_max_items = int(os.getenv('BATCH_MAX_ITEMS', "256"))
+        self.batch_parallelism = int(os.getenv('BATCH_PARALLELISM', "16"))
+        # 같은 세션의 AnalyzeGameState를 모으는 시간(ms) - 0이어도 앞선 턴을 기다리는 동안 들어온 요청은 합침
+        self.analysis_coalesce_ms = float(os.getenv('ANALYSIS_COALESCE_MS', "100"))
+        # StreamMatch 이벤트 정책 - 세션별 대사/분석 최소 간격(초), 라운드 시작·종료/KO 대사의 최소 간격(초),
+        # 분석까지 쌓을 이벤트 수, 대사를 낼 콤보 히트 수, 위험 체력 비율
+        self.match_speech_interval_seconds = float(os.getenv('MATCH_SPEECH_INTERVAL_SECONDS', "3"))
+        self.match_critical_interval_seconds = float(os.getenv('MATCH_CRITICAL_INTERVAL_SECONDS', "1"))
+        self.match_analysis_interval_seconds = float(os.getenv('MATCH_ANALYSIS_INTERVAL_SECONDS', "10"))
+        self.match_analysis_after_events = int(os.getenv('MATCH_ANALYSIS_AFTER_EVENTS', "30"))
+        self.match_combo_hits = int(os.getenv('MATCH_COMBO_HITS', "4"))
+        self.match_low_hp_ratio = float(os.getenv('MATCH_LOW_HP_RATIO', "0.3"))
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
 
     def validate(self):
@@ -26,6 +79,72 @@ class Config:
         if self.top_p < 0 or self.top_p > 1:
             raise ValueError("TOP_P must be between 0 and 1")
 
+        if self.session_timeout_minutes < 1 or self.session_absolute_timeout_minutes < 0:
+            raise ValueError("SESSION_TIMEOUT_MINUTES must be at least 1 and SESSION_ABSOLUTE_TIMEOUT_MINUTES >= 0")
+
+        if self.session_max_pending_turns < 1:
+            raise ValueError("SESSION_MAX_PENDING_TURNS must be at least 1")
+
+        if self.context_recent_turns < 0 or self.context_max_tokens < 1:
+            raise ValueError("CONTEXT_RECENT_TURNS must be >= 0 and CONTEXT_MAX_TOKENS must be >= 1")
+
+        if self.checkpoint_retention not in ("latest", "all"):
+            raise ValueError("CHECKPOINT_RETENTION must be 'latest' or 'all'")
+
+        if self.session_store_path and self.checkpoint_retention == "all":
+            raise ValueError("SESSION_STORE_PATH keeps only the latest checkpoint; unset CHECKPOINT_RETENTION=all")
+
+        if self.session_hibernate_minutes < 0:
+            raise ValueError("SESSION_HIBERNATE_MINUTES must be >= 0")
+
+        if self.session_max_active < 0 or self.session_max_memory_mb < 0:
+            raise ValueError("SESSION_MAX_ACTIVE and SESSION_MAX_MEMORY_MB must be >= 0")
+
+        if self.session_eviction_policy not in ("hibernate", "remove"):
+            raise ValueError("SESSION_EVICTION_POLICY must be 'hibernate' or 'remove'")
+
+        if self.session_drain_timeout_seconds < 0:
+            raise ValueError("SESSION_DRAIN_TIMEOUT_SECONDS must be >= 0")
+
+        if self.session_snapshot_path and self.checkpoint_retention == "all":
+            raise ValueError("SESSION_SNAPSHOT_PATH requires CHECKPOINT_RETENTION=latest")
+
+        if self.session_registry_stripes < 1:
+            raise ValueError("SESSION_REGISTRY_STRIPES must be at least 1")
+
+        if self.session_hot_capacity < 1:
+            raise ValueError("SESSION_HOT_CAPACITY must be at least 1")
+
+        if self.llm_max_concurrent < 0 or self.llm_max_queue < 0 or self.llm_queue_timeout_seconds <= 0:
+            raise ValueError("LLM_MAX_CONCURRENT and LLM_MAX_QUEUE must be >= 0 and LLM_QUEUE_TIMEOUT_SECONDS > 0")
+
+        if self.stream_chat_concurrency < 1:
+            raise ValueError("STREAM_CHAT_CONCURRENCY must be at least 1")
+
+        if self.batch_max_items < 1 or self.batch_parallelism < 1:
+            raise ValueError("BATCH_MAX_ITEMS and BATCH_PARALLELISM must be at least 1")
+
+        if self.analysis_coalesce_ms < 0:
+            raise ValueError("ANALYSIS_COALESCE_MS must be >= 0")
+
+        if self.match_speech_interval_seconds < 0 or self.match_analysis_interval_seconds < 0:
+            raise ValueError("MATCH_SPEECH_INTERVAL_SECONDS and MATCH_ANALYSIS_INTERVAL_SECONDS must be >= 0")
+
+        if self.match_critical_interval_seconds < 0:
+            raise ValueError("MATCH_CRITICAL_INTERVAL_SECONDS must be >= 0")
+
+        if self.match_analysis_after_events < 1 or self.match_combo_hits < 1:
+            raise ValueError("MATCH_ANALYSIS_AFTER_EVENTS and MATCH_COMBO_HITS must be at least 1")
+
+        if not 0 <= self.match_low_hp_ratio <= 1:
+            raise ValueError("MATCH_LOW_HP_RATIO must be between 0 and 1")
+
+        if self.server_workers < 1:
+            raise ValueError("SERVER_WORKERS must be at least 1")
+
+        if self.gateway_ring_replicas < 1:
+            raise ValueError("GATEWAY_RING_REPLICAS must be at least 1")
+
         if self.grpc_port < 1024 or self.grpc_port > 65535:
             raise ValueError("GRPC_PORT must be between 1024 and 65535")
 
@@ -36,6 +155,19 @@ class Config:
         Top P: {self.top_p}
         gRPC Port: {self.grpc_port}
         Max Workers: {self.max_workers}
-        Session Timeout: {self.session_timeout_minutes} minutes
+        Server Processes: {self.server_workers}
+        Gateway Backends: {self.gateway_backends_file or self.gateway_backends or '(none)'} ({self.gateway_ring_replicas} ring replicas)
+        Session Timeout: {self.session_timeout_minutes} idle minutes, {self.session_absolute_timeout_minutes or 'no'} max lifetime minutes
+        Session Max Pending Turns: {self.session_max_pending_turns}
+        Matchup Cache Dir: {self.matchup_cache_dir or '(memory only)'}
+        Prompt Languages: {', '.join(self.prompt_languages)}
+        Context: last {self.context_recent_turns} turns within {self.context_max_tokens} tokens
+        Checkpoint Retention: {self.checkpoint_retention}
+        Session Store: {self.session_store_path or '(memory only)'} (hot capacity {self.session_hot_capacity})
+        Session Hibernation: after {self.session_hibernate_minutes} idle minutes
+        Session Limits: {self.session_max_active} active, {self.session_max_memory_mb}MB ({self.session_eviction_policy} on overflow)
+        Session Registry: {self.session_registry_stripes} lock stripes
+        Session Snapshot: {self.session_snapshot_path or '(disabled)'} (drain timeout {self.session_drain_timeout_seconds}s)
+        LLM Limit: {self.llm_max_concurrent or 'unlimited'} concurrent, {self.llm_max_queue} queued, {self.llm_queue_timeout_seconds}s queue timeout
         Log Level: {self.log_level}
         """